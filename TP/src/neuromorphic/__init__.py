@@ -1,8 +1,54 @@
-from .etat_neurone import EtatNeurone, DeriveeEtatNeurone, SerieEtatsNeurone
-from .integrateur import Integrateur, Euler, RK4
-from .neurone_update_strategy import NeuroneUpdateStrategy, EulerUpdateStrategy, RK4UpdateStrategy
+from .etat_neurone import EtatNeurone, DeriveeEtatNeurone, SerieEtatsNeurone, TableEtats
+from .integrateur import Integrateur, Euler, RK4, IntegrateurEnPlace, EulerEnPlace, RK4EnPlace, DormandPrinceEnPlace
+from .neurone_update_strategy import (
+    NeuroneUpdateStrategy,
+    EulerUpdateStrategy,
+    RK4UpdateStrategy,
+    EulerEnPlaceUpdateStrategy,
+    RK4EnPlaceUpdateStrategy,
+    ExponentielUpdateStrategy,
+)
 from .neurone import Neurone, LIF
+from .population import PopulationLIF
 from .normalisateur import Normalisateur
-from .plotting import NeuronesPlotter, LinearDataPlotter, PotentielsPlotter, InputsPlotter
+from .plotting import (
+    NeuronesPlotter,
+    LinearDataPlotter,
+    PotentielsPlotter,
+    InputsPlotter,
+    LiveDataPlotter,
+    LivePotentielsPlotter,
+    LiveInputsPlotter,
+    TamponCirculaire,
+    decimer_min_max,
+    figure_hors_ecran,
+)
+from .synapses import FileRetards, MatriceSynaptiqueCSR
+from .noyaux import NoyauSynaptique, NoyauTabule, NoyauExponentiel, NoyauAlphaExponentiel
 from .reseau import Reseau
-from .simulation import Subscriber, Publisher, SimulationNeurones, SimulationEventType
+from .enregistrement import Enregistrement, EnregistrementColonnes, EnregistrementDisque, EnregistrementSpikes, ouvrir_enregistrement
+from .simulation import Subscriber, Publisher, SimulationNeurones, SimulationPopulation, SimulationEventType, LotSpikes
+from .evenementiel import SimulationEvenementielle, TypeEvenement
+from .lots import SimulationLots
+from .adaptatif import SimulationAdaptative
+from .balayage import BalayageParallele, ConfigurationSimulation, grille
+from .reseau_distribue import ReseauDistribue
+from .acceleration import FusionneUpdateStrategy, pas_fusionne, NUMBA_DISPONIBLE
+from .backends import Backend, EtatPopulation, PopulationBackend, ReseauBackend, pas_lif, pas_reseau
+from .stimuli import (
+    Stimulus,
+    StimulusConstant,
+    StimulusEchelon,
+    StimulusRampe,
+    StimulusSinusoidal,
+    StimulusPoisson,
+    StimulusGaussien,
+    StimulusTableau,
+    StimulusFichier,
+    SommeStimuli,
+    LecteurStimulus,
+    fonction_courants,
+)
+from .dvs import FluxDVS, StimulusDVS, CartePixels, blocs_comptes, paquets_aedat, dimensions_aedat, prelecture, alimenter
+from .sauvegarde import Sauvegardable, sauvegarder, restaurer, charger
+from .stdp import RegleSTDP, RegleTraces, RegleFonction, PlasticiteSTDP, W_vectorisee
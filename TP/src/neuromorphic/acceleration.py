@@ -0,0 +1,118 @@
+from typing import Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .neurone import Neurone
+from .population import PopulationLIF
+
+try:
+    import numba
+except ImportError:  # numba est une dépendance optionnelle (extra "acceleration")
+    numba = None
+
+NUMBA_DISPONIBLE: bool = numba is not None
+
+METHODES: dict[str, int] = {"euler": 0, "rk4": 1, "exponentiel": 2}
+
+
+def _pas_lif(
+    U0: NDArray[np.float64],
+    U: NDArray[np.float64],
+    theta: NDArray[np.float64],
+    R: NDArray[np.float64],
+    C: NDArray[np.float64],
+    I_ext: NDArray[np.float64],
+    psps: NDArray[np.float64],
+    spike: NDArray[np.bool_],
+    decroissance: NDArray[np.float64],
+    dt: float,
+    methode: int,
+) -> None:
+    """
+    Noyau fusionné : dérivée, intégration, ajout des PSPs, seuil et
+    réinitialisation en une seule passe sur la population.
+
+    ``decroissance`` (exp(-dt/tau) par neurone) n'est lu que par la méthode exponentielle.
+    """
+    for i in range(U.size):
+        tau = R[i] * C[i]
+        RI = R[i] * I_ext[i]
+        u = U[i]
+        if methode == 0:
+            u += dt * (RI - (u - U0[i])) / tau
+        elif methode == 1:
+            k1 = (RI - (u - U0[i])) / tau
+            k2 = (RI - (u + k1 * (dt / 2) - U0[i])) / tau
+            k3 = (RI - (u + k2 * (dt / 2) - U0[i])) / tau
+            k4 = (RI - (u + k3 * dt - U0[i])) / tau
+            u += (k1 + 2 * k2 + 2 * k3 + k4) * (dt / 6)
+        else:
+            U_inf = U0[i] + RI
+            u = U_inf + (u - U_inf) * decroissance[i]
+        u += psps[i]
+        if u >= theta[i]:
+            U[i] = U0[i]
+            spike[i] = True
+        else:
+            U[i] = u
+            spike[i] = False
+
+
+_pas_lif_compile = numba.njit(cache=True, nogil=True)(_pas_lif) if NUMBA_DISPONIBLE else None
+
+
+def pas_fusionne(
+    population: PopulationLIF, dt: ArrayLike, I_ext: ArrayLike, psps: ArrayLike = 0.0, methode: str = "rk4"
+) -> NDArray[np.bool_]:
+    """
+    Fait avancer ``population`` d'un pas avec le noyau compilé s'il est disponible.
+
+    Sans numba (ou avec un dt par neurone), on se rabat sur le pas vectorisé
+    ``backends.pas_lif`` de ``PopulationLIF``, qui donne le même résultat.
+    """
+    if methode not in METHODES:
+        raise ValueError(f"Méthode d'intégration '{methode}' inconnue.")
+    if _pas_lif_compile is None or np.ndim(dt) > 0:
+        return population._update(dt, I_ext, psps, methode)
+
+    population["I_ext"] = I_ext
+    psps = np.broadcast_to(np.asarray(psps, dtype=np.float64), (len(population),))
+    decroissance = population._facteurs_decroissance(dt) if methode == "exponentiel" else population._decroissance
+    _pas_lif_compile(
+        population["U0"], population["U"], population["theta"], population["R"], population["C"],
+        population["I_ext"], psps, population["spike"], decroissance, float(dt), METHODES[methode],
+    )
+    return population["spike"]
+
+
+class FusionneUpdateStrategy:
+    """
+    Stratégie appliquant le noyau fusionné (compilé par numba si installé).
+
+    Sur un neurone isolé, elle délègue à la méthode ``update*`` correspondante.
+    """
+
+    def __init__(self, methode: str = "rk4") -> None:
+        if methode not in METHODES:
+            raise ValueError(f"Méthode d'intégration '{methode}' inconnue.")
+        self.methode: str = methode
+
+    def __str__(self) -> str:
+        return f"Fusionné ({self.methode})"
+
+    def __repr__(self) -> str:
+        return f"FusionneUpdateStrategy({self.methode!r})"
+
+    def update(
+        self, neurone: Union[Neurone, PopulationLIF], dt: float, intensite: ArrayLike, psps: ArrayLike = 0.0
+    ) -> Union[bool, NDArray[np.bool_]]:
+        if isinstance(neurone, PopulationLIF):
+            return pas_fusionne(neurone, dt, intensite, psps, self.methode)
+        match self.methode:
+            case "euler":
+                return neurone.updateEuler(dt, intensite, psps)
+            case "rk4":
+                return neurone.updateRK4(dt, intensite, psps)
+            case _:
+                return neurone.updateExponentiel(dt, intensite, psps)
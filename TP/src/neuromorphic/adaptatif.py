@@ -0,0 +1,237 @@
+import math
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .enregistrement import Enregistrement, EnregistrementColonnes, terminer_enregistrement
+from .integrateur import DormandPrinceEnPlace
+from .population import PopulationLIF
+from .simulation import LotSpikes, Publisher, SimulationEventType
+
+
+def hermite(
+    s: ArrayLike, dt: float, y0: NDArray[np.float64], f0: NDArray[np.float64], y1: NDArray[np.float64], f1: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Interpolation cubique d'Hermite en la fraction ``s`` du pas, à partir des valeurs et dérivées aux extrémités."""
+    s = np.asarray(s, dtype=np.float64)
+    s2 = s * s
+    s3 = s2 * s
+    return (2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * dt * f0 + (3 * s2 - 2 * s3) * y1 + (s3 - s2) * dt * f1
+
+
+class SimulationAdaptative(Publisher):
+    """
+    Simulation d'une ``PopulationLIF`` à pas de temps adaptatif.
+
+    Chaque pas est fait par Dormand-Prince 5(4) : le pas est rejeté et réduit
+    si l'erreur estimée dépasse ``tolerance_abs + tolerance_rel * |U|``, et
+    agrandi (au plus x5) quand la dynamique est calme. Quand des neurones
+    franchissent leur seuil pendant un pas, l'instant du franchissement est
+    trouvé par interpolation d'Hermite dans le pas, et le pas est refait
+    jusqu'à ce premier franchissement (au plus ``nb_raffinements`` fois) ; les
+    neurones qui franchissent dans les ``resolution_spikes`` suivantes émettent
+    ensemble et sont réinitialisés.
+
+    Le coût est proportionnel au nombre de pas acceptés, donc au nombre
+    d'instants de spike distincts : la méthode convient surtout aux petites
+    populations et aux entrées par rafales. Les courants doivent être une
+    fonction du temps continu, évaluée aux étapes intermédiaires.
+    """
+
+    def __init__(
+        self,
+        population: PopulationLIF,
+        enregistrement: Optional[Enregistrement] = None,
+        tolerance_abs: float = 1e-6,
+        tolerance_rel: float = 1e-6,
+        dt_min: float = 1e-9,
+        dt_max: float = math.inf,
+        resolution_spikes: float = 1e-9,
+        nb_raffinements: int = 8,
+    ) -> None:
+        super().__init__()
+        self._population: PopulationLIF = population
+        self._enregistrement: Enregistrement = (
+            enregistrement if enregistrement is not None else EnregistrementColonnes(champs=("t", "U", "spike"))
+        )
+        self.tolerance_abs: float = tolerance_abs
+        self.tolerance_rel: float = tolerance_rel
+        self.dt_min: float = dt_min
+        self.dt_max: float = dt_max
+        self.resolution_spikes: float = resolution_spikes
+        self.nb_raffinements: int = nb_raffinements
+        self._integrateur: DormandPrinceEnPlace = DormandPrinceEnPlace()
+        nb_neurones = len(population)
+        self._U1: NDArray[np.float64] = np.empty(nb_neurones, dtype=np.float64)
+        self._erreur: NDArray[np.float64] = np.empty(nb_neurones, dtype=np.float64)
+        self._get_current_inputs: Callable[[float], ArrayLike]
+        self._duree: float
+        self._dt_initial: float
+        self._dt: float
+        self._t: float
+        self._iteration: int
+        self._nb_rejets: int
+        self._spikes_neurones: list[NDArray[np.intp]]
+        self._spikes_temps: list[NDArray[np.float64]]
+
+    def _set_initial_values(self, duree: float, dt_initial: float, get_current_inputs: Callable[[float], ArrayLike]) -> None:
+        self._population.reset()
+        self._enregistrement.reset()
+        self._get_current_inputs = get_current_inputs
+        self._duree = duree
+        self._dt_initial = dt_initial
+        self._dt = dt_initial
+        self._t = 0.0
+        self._iteration = 0
+        self._nb_rejets = 0
+        self._spikes_neurones = []
+        self._spikes_temps = []
+
+    @property
+    def population(self) -> PopulationLIF:
+        return self._population
+
+    @property
+    def enregistrement(self) -> Enregistrement:
+        return self._enregistrement
+
+    @property
+    def iteration(self) -> int:
+        """Nombre de pas acceptés."""
+        return self._iteration
+
+    @property
+    def temps(self) -> float:
+        return self._t
+
+    @property
+    def dt(self) -> float:
+        """Pas proposé pour la prochaine itération."""
+        return self._dt
+
+    @property
+    def nb_rejets(self) -> int:
+        return self._nb_rejets
+
+    @property
+    def spikes_neurones(self) -> NDArray[np.intp]:
+        return np.concatenate(self._spikes_neurones) if self._spikes_neurones else np.empty(0, dtype=np.intp)
+
+    @property
+    def spikes_temps(self) -> NDArray[np.float64]:
+        return np.concatenate(self._spikes_temps) if self._spikes_temps else np.empty(0, dtype=np.float64)
+
+    def temps_spikes(self, neurone: int) -> NDArray[np.float64]:
+        """Instants (interpolés) des spikes émis par ``neurone``."""
+        return self.spikes_temps[self.spikes_neurones == neurone]
+
+    def _derivee(self, t: float, U: NDArray[np.float64], out: NDArray[np.float64]) -> None:
+        population = self._population
+        np.multiply(population["R"], self._get_current_inputs(t), out=out)
+        out -= U
+        out += population["U0"]
+        out /= population["R"] * population["C"]
+
+    def _norme_erreur(self, U: NDArray[np.float64]) -> float:
+        if U.size == 0:
+            return 0.0
+        echelle = self.tolerance_abs + self.tolerance_rel * np.maximum(np.abs(U), np.abs(self._U1))
+        return float(np.max(np.abs(self._erreur) / echelle))
+
+    def _franchissements(self, U: NDArray[np.float64], dt: float, neurones: NDArray[np.intp]) -> NDArray[np.float64]:
+        """Fraction du pas à laquelle chaque neurone de ``neurones`` atteint son seuil, par dichotomie sur l'interpolant."""
+        theta = self._population["theta"][neurones]
+        y0, y1 = U[neurones], self._U1[neurones]
+        f0 = self._integrateur.derivee_debut[neurones]
+        f1 = self._integrateur.derivee_fin[neurones]
+        bas = np.zeros(neurones.size, dtype=np.float64)
+        haut = np.ones(neurones.size, dtype=np.float64)
+        # Un neurone déjà au-dessus de son seuil en début de pas émet immédiatement
+        haut[y0 >= theta] = 0.0
+        for _ in range(50):
+            milieu = (bas + haut) / 2
+            au_dessus = hermite(milieu, dt, y0, f0, y1, f1) >= theta
+            haut = np.where(au_dessus, milieu, haut)
+            bas = np.where(au_dessus, bas, milieu)
+        return haut
+
+    def init(self, duree: float, dt_initial: float, get_current_inputs_callback: Callable[[float], ArrayLike]) -> None:
+        """
+        Args:
+            duree (float): Durée simulée
+            dt_initial (float): Premier pas essayé
+            get_current_inputs_callback: Courants d'entrée en fonction du temps (scalaire ou N valeurs)
+        """
+        self._set_initial_values(duree, dt_initial, get_current_inputs_callback)
+        self.notify(SimulationEventType.INIT, self._population)
+
+    def run(self) -> None:
+        self.notify(SimulationEventType.RUN_START)
+        while self._t < self._duree:
+            self.update()
+
+        terminer_enregistrement(self._enregistrement)
+        self.notify(SimulationEventType.RUN_END)
+
+    def update(self) -> None:
+        if self._t >= self._duree:
+            raise RuntimeError("Simulation has already ended.")
+
+        population = self._population
+        U = population["U"]
+        while True:
+            dt = min(self._dt, self._duree - self._t)
+            self._integrateur.step_erreur(self._derivee, dt, self._t, U, self._U1, self._erreur)
+            erreur = self._norme_erreur(U)
+            if erreur <= 1.0 or dt <= self.dt_min:
+                break
+            self._dt = max(self.dt_min, dt * max(0.2, 0.9 * erreur ** -0.2))
+            self._nb_rejets += 1
+
+        facteur = 5.0 if erreur == 0.0 else min(5.0, 0.9 * erreur ** -0.2)
+        dt_propose = min(self.dt_max, max(self.dt_min, dt * facteur))
+
+        # Pas raccourci jusqu'au premier franchissement de seuil : l'interpolant est
+        # d'autant plus précis que le franchissement est proche de la fin du pas
+        raffinements = 0
+        while True:
+            emetteurs = np.flatnonzero(self._U1 >= population["theta"])
+            fractions = self._franchissements(U, dt, emetteurs)
+            if emetteurs.size == 0:
+                break
+            premier = float(fractions.min()) * dt
+            if premier >= dt - self.resolution_spikes or raffinements == self.nb_raffinements:
+                break
+            dt = premier + self.resolution_spikes / 2
+            self._integrateur.step_erreur(self._derivee, dt, self._t, U, self._U1, self._erreur)
+            raffinements += 1
+
+        instants = self._t + fractions * dt
+        U[...] = self._U1
+        self._t += dt
+        U[emetteurs] = population["U0"][emetteurs]
+        population["spike"][...] = False
+        population["spike"][emetteurs] = True
+        population["I_ext"] = self._get_current_inputs(self._t)
+
+        if emetteurs.size > 0:
+            self._spikes_neurones.append(emetteurs)
+            self._spikes_temps.append(instants)
+        self._dt = dt_propose
+
+        self._enregistrement.ajouter(population, self._t)
+        if emetteurs.size > 0 and self.a_des_abonnes(SimulationEventType.SPIKES):
+            etat = {champ: population[champ] for champ in self.champs_demandes(SimulationEventType.SPIKES)}
+            self.notify(SimulationEventType.SPIKES, LotSpikes(self._iteration, self._t, emetteurs, etat))
+        self.notify(SimulationEventType.UPDATE)
+
+        self._iteration += 1
+
+    def reset(self) -> None:
+        """
+        Reset the simulation.
+        """
+        self._set_initial_values(self._duree, self._dt_initial, self._get_current_inputs)
+
+        self.notify(SimulationEventType.RESET)
@@ -0,0 +1,225 @@
+import importlib
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .etat_neurone import derivee_lif
+from .noyaux import NoyauExponentiel, NoyauSynaptique
+from .synapses import MatriceSynaptiqueCSR
+
+# Module importé (à la demande) pour chaque backend
+_MODULES: dict[str, str] = {"numpy": "numpy", "jax": "jax.numpy", "cupy": "cupy"}
+
+
+class Backend:
+    """
+    Espace de noms de tableaux (API « array API ») utilisé par les fonctions de pas.
+
+    Le module correspondant n'est importé qu'à la construction : un utilisateur
+    qui n'a que NumPy n'a besoin d'aucune autre dépendance. Avec JAX, la double
+    précision doit être activée par l'appelant (``jax.config.update("jax_enable_x64", True)``
+    avant tout calcul) pour obtenir les mêmes résultats qu'avec NumPy.
+    """
+
+    def __init__(self, nom: str = "numpy") -> None:
+        if nom not in _MODULES:
+            raise ValueError(f"Backend '{nom}' inconnu, choisir parmi {list(_MODULES)}.")
+        try:
+            self.xp: Any = importlib.import_module(_MODULES[nom])
+        except ImportError as erreur:
+            raise ImportError(f"Le backend '{nom}' nécessite le paquet '{_MODULES[nom].split('.')[0]}'.") from erreur
+        self.nom: str = nom
+        if nom == "jax":
+            import jax
+            if not jax.config.read("jax_enable_x64"):
+                raise RuntimeError(
+                    "Le backend 'jax' calcule en float64 : activer la double précision avec "
+                    "jax.config.update(\"jax_enable_x64\", True) avant de le construire."
+                )
+
+    def jit(self, fonction: Callable) -> Callable:
+        """Compile ``fonction`` si le backend le permet (JAX), sinon la retourne telle quelle."""
+        if self.nom == "jax":
+            import jax
+            return jax.jit(fonction, static_argnames=("methode",))
+        return fonction
+
+    def asarray(self, valeur: ArrayLike, dtype: Optional[Any] = None) -> Any:
+        return self.xp.asarray(valeur, dtype=dtype if dtype is not None else self.xp.float64)
+
+    def vers_numpy(self, tableau: Any) -> NDArray:
+        if self.nom == "cupy":
+            return tableau.get()
+        return np.asarray(tableau)
+
+    def __repr__(self) -> str:
+        return f"Backend({self.nom!r})"
+
+
+class EtatPopulation(NamedTuple):
+    """État d'une population en colonnes ; un NamedTuple est directement un pytree JAX."""
+    U0: Any
+    U: Any
+    theta: Any
+    R: Any
+    C: Any
+    I_ext: Any
+    spike: Any
+
+
+def pas_lif(
+    xp: Any, etat: EtatPopulation, dt: ArrayLike, I_ext: Any, psps: Any, methode: str = "rk4",
+    decroissance: Optional[Any] = None,
+) -> EtatPopulation:
+    """
+    Pas fonctionnel (sans écriture en place) d'une population LIF, écrit pour
+    n'importe quel espace de noms ``xp`` compatible array API.
+
+    C'est l'unique définition du pas LIF vectorisé : ``PopulationLIF`` l'appelle
+    avec NumPy, ``PopulationBackend`` et ``ReseauBackend`` avec le backend choisi ;
+    la dérivée est ``derivee_lif``, celle des neurones v1 et des processeurs v2.
+    Intégration, PSPs, seuil puis réinitialisation ; ``decroissance`` permet de
+    fournir des facteurs exp(-dt/tau) déjà calculés pour la méthode exponentielle.
+    """
+    def derivee(U: Any) -> Any:
+        return derivee_lif(U, etat.U0, etat.R, etat.C, I_ext)
+
+    U = etat.U
+    if methode == "euler":
+        U = U + dt * derivee(U)
+    elif methode == "rk4":
+        k1 = derivee(U)
+        k2 = derivee(U + k1 * (dt / 2))
+        k3 = derivee(U + k2 * (dt / 2))
+        k4 = derivee(U + k3 * dt)
+        U = U + (k1 + 2 * k2 + 2 * k3 + k4) * (dt / 6)
+    elif methode == "exponentiel":
+        U_inf = etat.U0 + etat.R * I_ext
+        if decroissance is None:
+            decroissance = xp.exp(-dt / (etat.R * etat.C))
+        U = U_inf + (U - U_inf) * decroissance
+    else:
+        raise ValueError(f"Méthode d'intégration '{methode}' inconnue.")
+
+    U = U + psps
+    spike = U >= etat.theta
+    U = xp.where(spike, etat.U0, U)
+    return etat._replace(U=U, I_ext=xp.broadcast_to(xp.asarray(I_ext), U.shape), spike=spike)
+
+
+def pas_reseau(
+    xp: Any, etat: EtatPopulation, trace: Any, poids: Any, decroissance: float, dt: float, I_ext: Any, methode: str = "rk4"
+) -> tuple[EtatPopulation, Any]:
+    """
+    Tick complet d'un réseau à noyau exponentiel : PSPs = trace @ poids, pas de la
+    population, puis mise à jour de la trace (1 après un spike, sinon décroissance).
+    Compilé d'un bloc avec JAX, il ne laisse aucun aller-retour Python par pas.
+    """
+    psps = trace @ poids
+    etat = pas_lif(xp, etat, dt, I_ext, psps, methode)
+    trace = xp.where(etat.spike, 1.0, trace * decroissance)
+    return etat, trace
+
+
+class PopulationBackend:
+    """
+    Population LIF dont l'état vit dans le backend choisi à la construction
+    (NumPy par défaut, JAX ou CuPy) et dont le pas est éventuellement compilé.
+    """
+
+    _fields: list[str] = list(EtatPopulation._fields)
+
+    def __init__(
+        self,
+        nb_neurones: int,
+        backend: str = "numpy",
+        methode: str = "rk4",
+        U0: ArrayLike = 0.0,
+        U: Optional[ArrayLike] = None,
+        theta: ArrayLike = 0.1,
+        R: ArrayLike = 1.0,
+        C: ArrayLike = 1.0,
+        I_ext: ArrayLike = 0.0,
+    ) -> None:
+        self.backend: Backend = Backend(backend)
+        self.methode: str = methode
+        xp = self.backend.xp
+        U = U if U is not None else U0
+
+        def colonne(valeur: ArrayLike) -> Any:
+            return xp.asarray(np.broadcast_to(np.asarray(valeur, dtype=np.float64), (nb_neurones,)).copy())
+
+        self._etat_initial: EtatPopulation = EtatPopulation(
+            colonne(U0), colonne(U), colonne(theta), colonne(R), colonne(C), colonne(I_ext),
+            xp.zeros(nb_neurones, dtype=bool),
+        )
+        self.etat: EtatPopulation = self._etat_initial
+
+        def pas(etat: EtatPopulation, dt: float, I_ext: Any, psps: Any, methode: str) -> EtatPopulation:
+            return pas_lif(xp, etat, dt, I_ext, psps, methode)
+
+        self._pas: Callable[..., EtatPopulation] = self.backend.jit(pas)
+
+    def __len__(self) -> int:
+        return self.etat.U.shape[0]
+
+    def __getitem__(self, key: str) -> NDArray:
+        """Copie NumPy de la colonne ``key``."""
+        if key not in self._fields:
+            raise KeyError(f"Champ '{key}' non valide.")
+        return self.backend.vers_numpy(getattr(self.etat, key))
+
+    def update(self, dt: float, I_ext: ArrayLike, psps: ArrayLike = 0.0) -> Any:
+        xp = self.backend.xp
+        self.etat = self._pas(self.etat, dt, xp.asarray(I_ext), xp.asarray(psps), methode=self.methode)
+        return self.etat.spike
+
+    def reset(self) -> None:
+        self.etat = self._etat_initial
+
+
+class ReseauBackend:
+    """
+    Réseau à poids denses et noyau exponentiel dont le tick complet (PSPs, pas
+    de la population, trace) est une seule fonction, compilée avec JAX.
+
+    ``noyau`` est la constante de temps du noyau, ou un ``NoyauExponentiel``
+    (dont le seuil ``epsilon`` est ignoré : la trace reste dense).
+    """
+
+    def __init__(
+        self, population: PopulationBackend, poids: ArrayLike, noyau: Union[float, NoyauExponentiel]
+    ) -> None:
+        if isinstance(poids, MatriceSynaptiqueCSR):
+            raise TypeError(
+                "ReseauBackend calcule les PSPs par un produit dense : passer MatriceSynaptiqueCSR.dense()."
+            )
+        if isinstance(noyau, NoyauExponentiel):
+            noyau = noyau.tau
+        elif isinstance(noyau, NoyauSynaptique) or callable(noyau):
+            raise TypeError(
+                f"ReseauBackend ne gère que le noyau exponentiel (NoyauExponentiel ou sa constante de temps), "
+                f"pas {type(noyau).__name__}."
+            )
+        self.population: PopulationBackend = population
+        self.tau: float = float(noyau)
+        xp = population.backend.xp
+        self.poids: Any = population.backend.asarray(poids)
+        if self.poids.shape != (len(population), len(population)):
+            raise ValueError(f"poids doit être une matrice ({len(population)}, {len(population)}).")
+        self.trace: Any = xp.zeros(len(population), dtype=xp.float64)
+
+        def tick(etat: EtatPopulation, trace: Any, poids: Any, decroissance: float, dt: float, I_ext: Any,
+                 methode: str) -> tuple[EtatPopulation, Any]:
+            return pas_reseau(xp, etat, trace, poids, decroissance, dt, I_ext, methode)
+
+        self._tick: Callable[..., tuple[EtatPopulation, Any]] = population.backend.jit(tick)
+
+    def update(self, dt: float, intensites: ArrayLike) -> Any:
+        xp = self.population.backend.xp
+        self.population.etat, self.trace = self._tick(
+            self.population.etat, self.trace, self.poids, float(np.exp(-dt / self.tau)), dt,
+            xp.asarray(intensites), methode=self.population.methode,
+        )
+        return self.population.etat.spike
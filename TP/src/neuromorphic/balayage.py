@@ -0,0 +1,170 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .enregistrement import EnregistrementColonnes
+from .neurone_update_strategy import NeuroneUpdateStrategy
+from .population import PopulationLIF
+from .simulation import SimulationPopulation
+
+
+def courant_nul(t: float) -> float:
+    return 0.0
+
+
+@dataclass
+class ConfigurationSimulation:
+    """
+    Une simulation du balayage.
+
+    ``courants`` et ``strategie`` sont envoyés aux processus : ce doivent être
+    des objets picklables (fonction définie au niveau d'un module, pas de lambda).
+    """
+    nb_neurones: int
+    strategie: NeuroneUpdateStrategy
+    courants: Callable[[float], ArrayLike] = courant_nul
+    parametres: dict[str, ArrayLike] = field(default_factory=dict)
+    bruit: float = 0.0
+
+
+def grille(
+    nb_neurones: int,
+    strategies: Sequence[NeuroneUpdateStrategy],
+    courants: Sequence[Callable[[float], ArrayLike]] = (courant_nul,),
+    bruit: float = 0.0,
+    **parametres: Sequence[ArrayLike],
+) -> list[ConfigurationSimulation]:
+    """Produit cartésien des stratégies, des courants et des valeurs de chaque paramètre LIF."""
+    noms = list(parametres)
+    return [
+        ConfigurationSimulation(nb_neurones, strategie, courant, dict(zip(noms, valeurs)), bruit)
+        for strategie, courant, *valeurs in itertools.product(strategies, courants, *parametres.values())
+    ]
+
+
+def _dtype(champ: str) -> np.dtype:
+    return np.dtype(bool) if champ == "spike" else np.dtype(np.float64)
+
+
+def _forme(champ: str, forme: tuple[int, int, int]) -> tuple[int, ...]:
+    """Forme du résultat d'un champ : ``"t"`` n'a pas de dimension neurones."""
+    return forme[:2] if champ == "t" else forme
+
+
+def _courants_bruites(
+    courants: Callable[[float], ArrayLike], ecart_type: float, nb_neurones: int, graine: np.random.SeedSequence
+) -> Callable[[float], NDArray[np.float64]]:
+    generateur = np.random.default_rng(graine)
+
+    def courants_bruites(t: float) -> NDArray[np.float64]:
+        return courants(t) + ecart_type * generateur.standard_normal(nb_neurones)
+
+    return courants_bruites
+
+
+def _ecrire(segments: dict[str, shared_memory.SharedMemory], forme: tuple[int, int, int], k: int,
+            enregistrement: EnregistrementColonnes) -> None:
+    for champ, segment in segments.items():
+        np.ndarray(_forme(champ, forme), dtype=_dtype(champ), buffer=segment.buf)[k] = enregistrement[champ]
+
+
+def _simuler(
+    configurations: Sequence[tuple[int, ConfigurationSimulation, np.random.SeedSequence]],
+    memoires: dict[str, str],
+    forme: tuple[int, int, int],
+    nb_iterations: int,
+    dt: float,
+    decimation: int,
+) -> None:
+    """Exécuté dans un processus : simule chaque configuration et écrit ses colonnes en mémoire partagée."""
+    segments = {champ: shared_memory.SharedMemory(name=nom) for champ, nom in memoires.items()}
+    try:
+        for k, configuration, graine in configurations:
+            population = PopulationLIF(configuration.nb_neurones, **configuration.parametres)
+            enregistrement = EnregistrementColonnes(tuple(memoires), decimation, taille_bloc=forme[1])
+            simulation = SimulationPopulation(population, configuration.strategie, enregistrement)
+
+            courants = configuration.courants
+            if configuration.bruit > 0.0:
+                courants = _courants_bruites(courants, configuration.bruit, configuration.nb_neurones, graine)
+
+            simulation.init(nb_iterations, dt, courants)
+            simulation.run()
+            _ecrire(segments, forme, k, enregistrement)
+    finally:
+        for segment in segments.values():
+            segment.close()
+
+
+class BalayageParallele:
+    """
+    Exécution d'un ensemble de simulations indépendantes sur un pool de processus.
+
+    Les configurations sont réparties en paquets entre les processus d'un
+    ``ProcessPoolExecutor``. Chaque processus écrit ses résultats directement
+    dans des segments de mémoire partagée (un par champ, de forme
+    (configurations, pas enregistrés, N)) : seuls les configurations et les
+    noms des segments sont sérialisés. Avec une graine, chaque configuration
+    reçoit son propre flux aléatoire, indépendant du découpage en paquets.
+    """
+
+    def __init__(
+        self,
+        configurations: Sequence[ConfigurationSimulation],
+        champs: Sequence[str] = ("U", "spike"),
+        nb_processus: Optional[int] = None,
+        taille_paquet: Optional[int] = None,
+    ) -> None:
+        if len({configuration.nb_neurones for configuration in configurations}) > 1:
+            raise ValueError("Toutes les configurations doivent avoir le même nombre de neurones.")
+        self.configurations: list[ConfigurationSimulation] = list(configurations)
+        self.champs: tuple[str, ...] = tuple(champs)
+        self.nb_processus: int = nb_processus or os.cpu_count() or 1
+        self.taille_paquet: int = taille_paquet or max(1, len(self.configurations) // (4 * self.nb_processus))
+        self.resultats: dict[str, NDArray] = {}
+
+    def run(self, nb_iterations: int, dt: float, decimation: int = 1, graine: Optional[int] = None) -> dict[str, NDArray]:
+        """
+        Lance toutes les simulations et retourne, par champ, un tableau
+        (configurations, pas enregistrés, N), ou (configurations, pas enregistrés) pour ``"t"``.
+        """
+        nb_lignes = -(-nb_iterations // decimation)
+        forme = (len(self.configurations), nb_lignes, self.configurations[0].nb_neurones if self.configurations else 0)
+        graines = np.random.SeedSequence(graine).spawn(len(self.configurations))
+        taches = list(zip(range(len(self.configurations)), self.configurations, graines))
+        paquets = [taches[i:i + self.taille_paquet] for i in range(0, len(taches), self.taille_paquet)]
+
+        segments = {
+            champ: shared_memory.SharedMemory(
+                create=True, size=max(1, int(np.prod(_forme(champ, forme))) * _dtype(champ).itemsize)
+            )
+            for champ in self.champs
+        }
+        try:
+            memoires = {champ: segment.name for champ, segment in segments.items()}
+            with ProcessPoolExecutor(max_workers=self.nb_processus) as executeur:
+                futurs = [
+                    executeur.submit(_simuler, paquet, memoires, forme, nb_iterations, dt, decimation)
+                    for paquet in paquets
+                ]
+                for futur in futurs:
+                    futur.result()
+            self.resultats = {
+                champ: np.ndarray(_forme(champ, forme), dtype=_dtype(champ), buffer=segment.buf).copy()
+                for champ, segment in segments.items()
+            }
+        finally:
+            for segment in segments.values():
+                segment.close()
+                segment.unlink()
+        return self.resultats
+
+    def resultat(self, k: int) -> dict[str, NDArray]:
+        """Champs enregistrés de la configuration ``k``, de forme (pas enregistrés, N) ou (pas enregistrés,)."""
+        return {champ: valeurs[k] for champ, valeurs in self.resultats.items()}
@@ -0,0 +1,274 @@
+import argparse
+import datetime
+import gc
+import itertools
+import json
+import platform
+import tracemalloc
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .acceleration import NUMBA_DISPONIBLE, FusionneUpdateStrategy
+from .enregistrement import EnregistrementColonnes
+from .etat_neurone import TableEtats
+from .neurone import LIF
+from .neurone_update_strategy import EulerUpdateStrategy, NeuroneUpdateStrategy, RK4UpdateStrategy
+from .population import PopulationLIF
+from .reseau import Reseau
+from .synapses import MatriceSynaptiqueCSR
+
+MOTEURS: tuple[str, ...] = ("v1", "v2", "population", "fusionne")
+INTEGRATEURS: tuple[str, ...] = ("euler", "rk4")
+
+
+@dataclass(frozen=True)
+class ConfigurationBenchmark:
+    moteur: str
+    nb_neurones: int
+    densite: float
+    dt: float
+    integrateur: str
+    enregistrement: bool
+
+
+@dataclass
+class ResultatBenchmark:
+    configuration: ConfigurationBenchmark
+    nb_pas: int
+    duree: float
+    pas_par_seconde: float
+    mises_a_jour_par_seconde: float
+    pic_memoire: int
+    blocs_crees_par_pas: float
+    nb_spikes: int
+
+
+def synapses_aleatoires(nb_neurones: int, densite: float, generateur: np.random.Generator) -> MatriceSynaptiqueCSR:
+    """Connectivité aléatoire de ``densite * N²`` synapses, de poids assez faibles pour éviter l'emballement."""
+    nb_synapses = generateur.binomial(nb_neurones * nb_neurones, densite) if nb_neurones > 0 else 0
+    sources = generateur.integers(0, nb_neurones, nb_synapses)
+    cibles = generateur.integers(0, nb_neurones, nb_synapses)
+    poids = generateur.uniform(0.0, 0.05 / max(1.0, densite * nb_neurones), nb_synapses)
+    return MatriceSynaptiqueCSR.depuis_tableaux(nb_neurones, sources, cibles, poids)
+
+
+def _strategie(moteur: str, integrateur: str) -> NeuroneUpdateStrategy:
+    if moteur == "fusionne":
+        return FusionneUpdateStrategy(integrateur)
+    return EulerUpdateStrategy() if integrateur == "euler" else RK4UpdateStrategy()
+
+
+def _preparer(configuration: ConfigurationBenchmark, graine: int) -> Callable[[int], int]:
+    """
+    Construit le moteur décrit par ``configuration`` et retourne une fonction
+    qui le fait avancer de ``nb_pas`` pas et renvoie le nombre de spikes.
+    """
+    generateur = np.random.default_rng(graine)
+    N, dt = configuration.nb_neurones, configuration.dt
+    courants: NDArray[np.float64] = generateur.uniform(0.0, 0.3, N)
+    enregistrement = EnregistrementColonnes(("U", "spike")) if configuration.enregistrement else None
+
+    if configuration.moteur == "v2":
+        # Le prototype v2 n'a pas de réseau : la densité est ignorée
+        from neuromorphic_v2.neuron import DonneesNeurone, ProcesseurNeuroneLIF
+
+        # Les données des processeurs sont des vues sur une seule table d'états
+        table = TableEtats(N)
+        table.colonne("theta")[:] = 0.1
+        table.colonne("R")[:] = 1.0
+        table.colonne("C")[:] = 1.0
+        table.colonne("I_ext")[:] = courants
+        processeurs: list[ProcesseurNeuroneLIF] = []
+        for i in range(N):
+            processeur = ProcesseurNeuroneLIF()
+            processeur.assignerDonnees(DonneesNeurone.vue(table, i), dt)
+            processeurs.append(processeur)
+        historique: list[NDArray[np.float64]] = []
+
+        def avancer_v2(nb_pas: int) -> int:
+            nb_spikes = 0
+            for _ in range(nb_pas):
+                for processeur in processeurs:
+                    if configuration.integrateur == "euler":
+                        processeur.stepEuler()
+                    else:
+                        processeur.stepRK4()
+                    nb_spikes += processeur.dn.spike
+                if configuration.enregistrement:
+                    historique.append(table.colonne("U").copy())
+            return nb_spikes
+
+        return avancer_v2
+
+    neurones = PopulationLIF(N) if configuration.moteur in ("population", "fusionne") else [LIF() for _ in range(N)]
+    reseau = Reseau(
+        neurones,
+        synapses_aleatoires(N, configuration.densite, generateur),
+        update_strategy=_strategie(configuration.moteur, configuration.integrateur),
+    )
+
+    def avancer(nb_pas: int) -> int:
+        nb_spikes = 0
+        for _ in range(nb_pas):
+            nb_spikes += int(np.count_nonzero(reseau.update(dt, courants)))
+            if enregistrement is not None:
+                enregistrement.ajouter(reseau.neurones)
+        return nb_spikes
+
+    return avancer
+
+
+def mesurer(
+    configuration: ConfigurationBenchmark, nb_pas: int, repetitions: int = 3, echauffement: int = 5, graine: int = 0
+) -> ResultatBenchmark:
+    """
+    Mesure une configuration : meilleure durée sur ``repetitions`` runs de
+    ``nb_pas`` pas (après ``echauffement`` pas non chronométrés, qui absorbent
+    les compilations et les tabulations), puis un run séparé, pas par pas sous
+    tracemalloc, pour le pic mémoire et le nombre moyen de blocs créés par pas :
+    à chaque pas, somme des hausses du nombre de blocs vivants de chaque
+    fichier source entre le début et la fin du pas (``count_diff`` positifs).
+    Un temporaire libéré dans le pas même n'y figure pas.
+    """
+    durees: list[float] = []
+    nb_spikes = 0
+    for _ in range(repetitions):
+        avancer = _preparer(configuration, graine)
+        avancer(echauffement)
+        gc.collect()
+        debut = perf_counter()
+        nb_spikes = avancer(nb_pas)
+        durees.append(perf_counter() - debut)
+
+    avancer = _preparer(configuration, graine)
+    avancer(echauffement)
+    gc.collect()
+    tracemalloc.start()
+    blocs_crees = 0
+    avant = _instantane()
+    for _ in range(nb_pas):
+        avancer(1)
+        apres = _instantane()
+        blocs_crees += sum(max(0, stat.count_diff) for stat in apres.compare_to(avant, "filename"))
+        avant = apres
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    duree = min(durees)
+    pas_par_seconde = nb_pas / duree if duree > 0 else float("inf")
+    return ResultatBenchmark(
+        configuration,
+        nb_pas,
+        duree,
+        pas_par_seconde,
+        pas_par_seconde * configuration.nb_neurones,
+        pic,
+        blocs_crees / nb_pas if nb_pas > 0 else 0.0,
+        nb_spikes,
+    )
+
+
+def _instantane() -> tracemalloc.Snapshot:
+    """Instantané tracemalloc sans les allocations de tracemalloc lui-même."""
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+def configurations(
+    moteurs: Sequence[str] = ("v1", "v2", "population"),
+    nb_neurones: Sequence[int] = (10, 100, 1000),
+    densites: Sequence[float] = (0.0, 0.1),
+    dts: Sequence[float] = (1e-2,),
+    integrateurs: Sequence[str] = INTEGRATEURS,
+    enregistrements: Sequence[bool] = (False, True),
+) -> list[ConfigurationBenchmark]:
+    """Produit cartésien des paramètres ; le moteur v2, sans réseau, n'est mesuré qu'à densité nulle."""
+    return [
+        ConfigurationBenchmark(*valeurs)
+        for valeurs in itertools.product(moteurs, nb_neurones, densites, dts, integrateurs, enregistrements)
+        if not (valeurs[0] == "v2" and valeurs[2] > 0.0)
+    ]
+
+
+def _meta() -> dict[str, str]:
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plateforme": platform.platform(),
+        "processeur": platform.processor(),
+        "numba": str(NUMBA_DISPONIBLE),
+    }
+
+
+def _cle(configuration: dict) -> tuple:
+    return tuple(configuration[champ] for champ in ConfigurationBenchmark.__dataclass_fields__)
+
+
+def comparer(reference: dict, resultats: dict, seuil: float = 0.9) -> list[str]:
+    """
+    Lignes de comparaison des pas/s entre deux fichiers de résultats ; les
+    configurations plus lentes que ``seuil`` fois la référence sont marquées.
+    """
+    anciens = {_cle(r["configuration"]): r for r in reference["resultats"]}
+    lignes: list[str] = []
+    for resultat in resultats["resultats"]:
+        ancien = anciens.get(_cle(resultat["configuration"]))
+        if ancien is None:
+            continue
+        rapport = resultat["pas_par_seconde"] / ancien["pas_par_seconde"]
+        marque = "  RÉGRESSION" if rapport < seuil else ""
+        lignes.append(f"{_format_configuration(resultat['configuration'])}  x{rapport:.2f}{marque}")
+    return lignes
+
+
+def _format_configuration(configuration: dict) -> str:
+    return (
+        f"{configuration['moteur']:>10} N={configuration['nb_neurones']:<6} densité={configuration['densite']:<5} "
+        f"dt={configuration['dt']:<7g} {configuration['integrateur']:<5} "
+        f"enregistrement={'oui' if configuration['enregistrement'] else 'non'}"
+    )
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark des moteurs de simulation de neurones.")
+    parser.add_argument("--moteurs", nargs="+", choices=MOTEURS, default=["v1", "v2", "population"])
+    parser.add_argument("--neurones", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--densites", nargs="+", type=float, default=[0.0, 0.1])
+    parser.add_argument("--dt", nargs="+", type=float, default=[1e-2])
+    parser.add_argument("--integrateurs", nargs="+", choices=INTEGRATEURS, default=list(INTEGRATEURS))
+    parser.add_argument("--enregistrement", choices=("oui", "non", "les-deux"), default="les-deux")
+    parser.add_argument("--pas", type=int, default=200, help="Nombre de pas chronométrés par run")
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--sortie", default="benchmark.json", help="Fichier JSON des résultats")
+    parser.add_argument("--comparer", help="Fichier JSON d'un run précédent à comparer")
+    options = parser.parse_args(arguments)
+
+    enregistrements = {"oui": (True,), "non": (False,), "les-deux": (False, True)}[options.enregistrement]
+    resultats: list[ResultatBenchmark] = []
+    for configuration in configurations(
+        options.moteurs, options.neurones, options.densites, options.dt, options.integrateurs, enregistrements
+    ):
+        resultat = mesurer(configuration, options.pas, options.repetitions)
+        resultats.append(resultat)
+        print(
+            f"{_format_configuration(asdict(configuration))}  {resultat.pas_par_seconde:>10.1f} pas/s  "
+            f"{resultat.mises_a_jour_par_seconde:>12.3e} neurones/s  pic {resultat.pic_memoire / 1024:.0f} Kio"
+        )
+
+    sortie = {"meta": _meta(), "resultats": [asdict(resultat) for resultat in resultats]}
+    with open(options.sortie, "w") as fichier:
+        json.dump(sortie, fichier, indent=2)
+    print(f"Résultats écrits dans {options.sortie}")
+
+    if options.comparer:
+        with open(options.comparer) as fichier:
+            for ligne in comparer(json.load(fichier), sortie):
+                print(ligne)
+
+
+if __name__ == "__main__":
+    main()
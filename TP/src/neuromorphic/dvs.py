@@ -0,0 +1,298 @@
+import os
+import queue
+import threading
+from typing import Any, Callable, Generator, Iterable, Iterator, Optional, TypeVar, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .reseau import Reseau
+from .stimuli import Stimulus
+
+E = TypeVar("E")
+
+CheminAedat = Union[str, os.PathLike]
+
+
+def paquets_aedat(chemin: CheminAedat, flux: Optional[int] = None) -> Iterator[NDArray]:
+    """
+    Paquets d'événements DVS d'un fichier AEDAT4, lus un par un par ``aedat.Decoder``.
+
+    Chaque paquet est un tableau structuré (``t`` en µs, ``x``, ``y``, ``on``) ;
+    les autres paquets (images, IMU, déclencheurs) sont ignorés, ainsi que les
+    flux autres que ``flux`` s'il est précisé.
+    """
+    import aedat
+
+    for paquet in aedat.Decoder(chemin):
+        if "events" in paquet and (flux is None or paquet["stream_id"] == flux):
+            yield paquet["events"]
+
+
+def dimensions_aedat(chemin: CheminAedat, flux: Optional[int] = None) -> tuple[int, int]:
+    """(largeur, hauteur) du capteur, lues dans l'en-tête du fichier."""
+    import aedat
+
+    for identifiant, description in aedat.Decoder(chemin).id_to_stream().items():
+        if description["type"] == "events" and (flux is None or identifiant == flux):
+            return description["width"], description["height"]
+    raise ValueError(f"Aucun flux d'événements dans '{chemin}'.")
+
+
+class CartePixels:
+    """
+    Correspondance pixel (x, y, polarité) -> neurone d'entrée.
+
+    Les pixels sont regroupés en carrés de ``facteur`` x ``facteur`` ; chaque
+    groupe (et chaque polarité si ``polarites``) est un neurone, numéroté à
+    partir de ``premier_neurone``.
+    """
+
+    def __init__(self, largeur: int, hauteur: int, facteur: int = 1, polarites: bool = True, premier_neurone: int = 0) -> None:
+        self.largeur: int = -(-largeur // facteur)
+        self.hauteur: int = -(-hauteur // facteur)
+        self.facteur: int = facteur
+        self.polarites: bool = polarites
+        self.premier_neurone: int = premier_neurone
+
+    @property
+    def nb_entrees(self) -> int:
+        return self.largeur * self.hauteur * (2 if self.polarites else 1)
+
+    def __call__(self, evenements: NDArray) -> NDArray[np.intp]:
+        x = evenements["x"].astype(np.intp) // self.facteur
+        y = evenements["y"].astype(np.intp) // self.facteur
+        neurones = y * self.largeur + x
+        if self.polarites:
+            neurones = 2 * neurones + evenements["on"]
+        return neurones + self.premier_neurone
+
+
+def blocs_comptes(
+    paquets: Iterable[NDArray],
+    carte: Callable[[NDArray], NDArray[np.intp]],
+    nb_neurones: int,
+    duree_pas: int,
+    taille_bloc: int = 256,
+    t0: Optional[int] = None,
+) -> Iterator[NDArray[np.int32]]:
+    """
+    Regroupe des paquets d'événements triés par temps en blocs (taille_bloc, N)
+    du nombre d'événements reçus par chaque neurone à chaque pas de ``duree_pas`` µs.
+
+    Seul le bloc en cours est en mémoire ; le dernier bloc s'arrête au pas du
+    dernier événement. Le pas 0 commence à ``t0`` (par défaut au premier
+    événement) ; les événements antérieurs, ou hors de [0, N), sont ignorés.
+    """
+    taille = taille_bloc * nb_neurones
+    comptes = np.zeros(taille, dtype=np.int32)
+    debut: Optional[int] = t0
+    dernier_pas = -1
+    for evenements in paquets:
+        if evenements.size == 0:
+            continue
+        t = evenements["t"].astype(np.int64)
+        if debut is None:
+            debut = int(t[0])
+        pas = (t - debut) // duree_pas
+        neurones = carte(evenements)
+        gardes = (pas >= 0) & (neurones >= 0) & (neurones < nb_neurones)
+        pas, neurones = pas[gardes], neurones[gardes]
+        while pas.size > 0:
+            # Les événements sont triés : ceux du bloc en cours forment un préfixe
+            n = int(np.searchsorted(pas, taille_bloc))
+            np.add.at(comptes, pas[:n] * nb_neurones + neurones[:n], 1)
+            if n > 0:
+                dernier_pas = int(pas[n - 1])
+            if n == pas.size:
+                break
+            yield comptes.reshape(taille_bloc, nb_neurones)
+            comptes = np.zeros(taille, dtype=np.int32)
+            debut += taille_bloc * duree_pas
+            dernier_pas = -1
+            pas, neurones = pas[n:] - taille_bloc, neurones[n:]
+    if dernier_pas >= 0:
+        yield comptes.reshape(taille_bloc, nb_neurones)[:dernier_pas + 1]
+
+
+def prelecture(source: Iterable[E], taille_file: int = 4) -> Generator[E, None, None]:
+    """
+    Consomme ``source`` dans un fil d'exécution séparé, à travers une file bornée.
+
+    La lecture et le décodage du fichier avancent pendant la simulation, sans
+    jamais prendre plus de ``taille_file`` éléments d'avance. Fermer le
+    générateur (``close``) arrête le fil et ferme ``source``.
+    """
+    file: queue.Queue = queue.Queue(maxsize=taille_file)
+    arret = threading.Event()
+    fin = object()
+
+    def deposer(element: object) -> bool:
+        while not arret.is_set():
+            try:
+                file.put(element, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produire() -> None:
+        elements = iter(source)
+        try:
+            for element in elements:
+                if not deposer(element):
+                    return
+            deposer(fin)
+        except BaseException as erreur:
+            deposer(erreur)
+        finally:
+            fermer = getattr(elements, "close", None)
+            if fermer is not None:
+                fermer()
+
+    fil = threading.Thread(target=produire, daemon=True)
+    fil.start()
+    try:
+        while True:
+            element = file.get()
+            if element is fin:
+                return
+            if isinstance(element, BaseException):
+                raise element
+            yield element
+    finally:
+        # Le consommateur a fini ou abandonné (GeneratorExit) : le producteur
+        # s'arrête au prochain élément, et on attend qu'il ait fermé la source
+        arret.set()
+        fil.join()
+
+
+class FluxDVS:
+    """
+    Entrée d'un réseau depuis un enregistrement AEDAT4, lu par paquets.
+
+    Les événements sont binnés en pas de ``duree_pas`` µs et projetés sur les
+    neurones d'entrée par ``carte`` ; le fichier est relu à chaque itération et
+    la mémoire utilisée ne dépend que de ``taille_bloc``, ``taille_file`` et N.
+    """
+
+    def __init__(
+        self,
+        chemin: CheminAedat,
+        nb_neurones: Optional[int] = None,
+        carte: Optional[Callable[[NDArray], NDArray[np.intp]]] = None,
+        duree_pas: int = 1000,
+        taille_bloc: int = 256,
+        taille_file: int = 4,
+        flux: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            nb_neurones (int): Nombre de neurones du réseau (par défaut, celui de la carte)
+            carte: Pixel -> neurone ; par défaut un neurone par pixel et par polarité
+            duree_pas (int): Durée d'un pas de simulation, en µs
+        """
+        self.chemin: CheminAedat = chemin
+        self.flux: Optional[int] = flux
+        if carte is None:
+            carte = CartePixels(*dimensions_aedat(chemin, flux))
+        self.carte: Callable[[NDArray], NDArray[np.intp]] = carte
+        if nb_neurones is None:
+            if not isinstance(carte, CartePixels):
+                raise ValueError("nb_neurones est obligatoire avec une carte personnalisée.")
+            nb_neurones = carte.premier_neurone + carte.nb_entrees
+        self.nb_neurones: int = nb_neurones
+        self.duree_pas: int = duree_pas
+        self.taille_bloc: int = taille_bloc
+        self.taille_file: int = taille_file
+
+    def paquets(self) -> Iterator[NDArray]:
+        return paquets_aedat(self.chemin, self.flux)
+
+    def blocs(self) -> Generator[NDArray[np.int32], None, None]:
+        """Blocs (pas, N) du nombre d'événements par neurone, décodés en avance dans un fil séparé."""
+        return prelecture(
+            blocs_comptes(self.paquets(), self.carte, self.nb_neurones, self.duree_pas, self.taille_bloc), self.taille_file
+        )
+
+    def pas(self, nb_pas: Optional[int] = None) -> Iterator[NDArray[np.int32]]:
+        """Nombre d'événements par neurone, pas par pas, au plus ``nb_pas`` pas."""
+        restants = nb_pas
+        for bloc in self.blocs():
+            for ligne in bloc[:restants]:
+                yield ligne
+            if restants is not None:
+                restants -= len(bloc)
+                if restants <= 0:
+                    return
+
+    def __iter__(self) -> Iterator[NDArray[np.int32]]:
+        return self.pas()
+
+
+class StimulusDVS(Stimulus):
+    """
+    ``Stimulus`` alimenté par un ``FluxDVS`` : chaque événement reçu pendant un
+    pas injecte ``amplitude`` (une seule fois par pas si ``binaire``, comme un spike).
+
+    Le pas de la simulation doit correspondre à ``flux.duree_pas`` ; les blocs
+    sont lus dans l'ordre, comme pour ``StimulusPoisson``, et sont nuls après la
+    fin de l'enregistrement.
+    """
+
+    def __init__(self, flux: FluxDVS, amplitude: float = 1.0, binaire: bool = False) -> None:
+        super().__init__(flux.nb_neurones)
+        self.flux: FluxDVS = flux
+        self.amplitude: float = amplitude
+        self.binaire: bool = binaire
+        self._blocs: Optional[Generator[NDArray[np.int32], None, None]] = None
+        self._reste: NDArray[np.int32] = np.empty((0, flux.nb_neurones), dtype=np.int32)
+        self._prochain_pas: int = 0
+
+    def _comptes(self, nb_pas: int) -> NDArray[np.int32]:
+        morceaux = [self._reste]
+        disponibles = len(self._reste)
+        while disponibles < nb_pas:
+            bloc = next(self._blocs, None) if self._blocs is not None else None
+            if bloc is None:
+                morceaux.append(np.zeros((nb_pas - disponibles, self.nb_neurones), dtype=np.int32))
+                break
+            morceaux.append(bloc)
+            disponibles += len(bloc)
+        comptes = np.concatenate(morceaux) if len(morceaux) > 1 else self._reste
+        self._reste = comptes[nb_pas:]
+        return comptes[:nb_pas]
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        raise TypeError("La lecture d'un enregistrement DVS ne peut pas être sauvegardée en cours de route.")
+
+    def fermer(self) -> None:
+        """Abandonne la lecture en cours et arrête son fil de prélecture."""
+        if self._blocs is not None:
+            self._blocs.close()
+            self._blocs = None
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        if debut == 0:
+            self.fermer()
+            self._blocs = self.flux.blocs()
+            self._reste = np.empty((0, self.nb_neurones), dtype=np.int32)
+        elif debut != self._prochain_pas:
+            raise ValueError(f"Bloc non consécutif : pas {self._prochain_pas} attendu, {debut} demandé.")
+        self._prochain_pas = debut + nb_pas
+        comptes = self._comptes(nb_pas)
+        if self.binaire:
+            return np.where(comptes > 0, self.amplitude, 0.0)
+        return self.amplitude * comptes
+
+
+def alimenter(
+    reseau: Reseau, flux: FluxDVS, dt: float, amplitude: float = 1.0, binaire: bool = False, nb_pas: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Fait avancer ``reseau`` d'un pas par pas de l'enregistrement, avec
+    ``amplitude`` par événement en courant d'entrée, et produit les spikes de chaque pas.
+    """
+    for comptes in flux.pas(nb_pas):
+        courants = np.where(comptes > 0, amplitude, 0.0) if binaire else amplitude * comptes
+        yield reseau.update(dt, courants)
@@ -1,15 +1,436 @@
-from typing import Protocol, TypeVar
+import json
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional, Protocol, Sequence, TypeVar
 
+import numpy as np
 from numpy import float64
 from numpy.typing import NDArray
 from .neurone import Neurone
+from .population import PopulationLIF
 from .reseau import Reseau
 from typing import Union
 
-T = TypeVar("T", bound=Union[Neurone, Reseau])
+T = TypeVar("T", bound=Union[Neurone, Reseau, PopulationLIF, Sequence[Neurone]])
 
 
 class Enregistrement(Protocol[T]):
     def ajouter(self, element: T) -> None: ...
 
     def __getitem__(self, key: str) -> NDArray[float64]: ...
+
+    def reset(self) -> None: ...
+
+
+def _colonne(neurones: Union[PopulationLIF, Sequence[Neurone]], champ: str) -> NDArray:
+    """Valeurs du champ ``champ`` pour tous les neurones, sans copie pour une population."""
+    if isinstance(neurones, PopulationLIF):
+        return neurones[champ]
+    dtype = bool if champ == "spike" else float64
+    return np.fromiter((neurone._etat[champ] for neurone in neurones), dtype=dtype, count=len(neurones))
+
+
+class EnregistrementColonnes:
+    """
+    Enregistrement par colonnes des champs demandés, un pas sur ``decimation``.
+
+    Chaque champ est stocké dans des blocs préalloués de ``taille_bloc`` lignes
+    et N colonnes ; un pas enregistré coûte une seule écriture vectorisée par
+    champ. Le champ ``"t"`` enregistre l'instant passé à ``ajouter``.
+    """
+
+    def __init__(self, champs: Sequence[str] = ("U",), decimation: int = 1, taille_bloc: int = 1024) -> None:
+        if decimation < 1:
+            raise ValueError("La décimation doit être un entier strictement positif.")
+        for champ in champs:
+            if champ != "t" and champ not in PopulationLIF._fields:
+                raise KeyError(f"Champ '{champ}' non valide.")
+        self.champs: tuple[str, ...] = tuple(champs)
+        self.decimation: int = decimation
+        self.taille_bloc: int = taille_bloc
+        self.reset()
+
+    def reset(self) -> None:
+        self._blocs: dict[str, list[NDArray]] = {champ: [] for champ in self.champs}
+        self._nb_lignes: int = 0
+        self._compteur: int = 0
+
+    def __len__(self) -> int:
+        return self._nb_lignes
+
+    def _allouer_bloc(self, nb_neurones: int) -> None:
+        for champ, blocs in self._blocs.items():
+            dtype = bool if champ == "spike" else float64
+            forme = (self.taille_bloc,) if champ == "t" else (self.taille_bloc, nb_neurones)
+            blocs.append(np.empty(forme, dtype=dtype))
+
+    def _ligne_libre(self, nb_neurones: int) -> int:
+        """Indice de la prochaine ligne libre du dernier bloc, en allouant un bloc si besoin."""
+        ligne = self._nb_lignes % self.taille_bloc
+        if ligne == 0:
+            self._allouer_bloc(nb_neurones)
+        return ligne
+
+    def ajouter(self, element: Union[PopulationLIF, Reseau, Sequence[Neurone]], t: Optional[float] = None) -> None:
+        compteur = self._compteur
+        self._compteur += 1
+        if compteur % self.decimation != 0:
+            return
+
+        neurones = element.neurones if isinstance(element, Reseau) else element
+        ligne = self._ligne_libre(len(neurones))
+        for champ, blocs in self._blocs.items():
+            if champ == "t":
+                blocs[-1][ligne] = np.nan if t is None else t
+            else:
+                blocs[-1][ligne] = _colonne(neurones, champ)
+        self._nb_lignes += 1
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        return {
+            "nb_lignes": self._nb_lignes,
+            "compteur": self._compteur,
+            "colonnes": {champ: self[champ] for champ in self.champs},
+        }
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        """Recopie les lignes sauvegardées dans des blocs neufs ; les ajouts reprennent à leur suite."""
+        self.reset()
+        nb_lignes = int(etat["nb_lignes"])
+        colonnes = etat.get("colonnes", {})
+        nb_neurones = next((colonnes[champ].shape[1] for champ in self.champs if champ != "t"), 0)
+        for debut in range(0, nb_lignes, self.taille_bloc):
+            fin = min(debut + self.taille_bloc, nb_lignes)
+            self._allouer_bloc(nb_neurones)
+            for champ, blocs in self._blocs.items():
+                blocs[-1][:fin - debut] = colonnes[champ][debut:fin]
+        self._nb_lignes = nb_lignes
+        self._compteur = int(etat["compteur"])
+
+    def __getitem__(self, key: str) -> NDArray:
+        """Tableau (pas enregistrés x N) du champ ``key`` (vecteur pour ``"t"``)."""
+        if key not in self._blocs:
+            raise KeyError(f"Champ '{key}' non enregistré.")
+        blocs = self._blocs[key]
+        if not blocs:
+            return np.empty((0,), dtype=float64)
+        if len(blocs) == 1:
+            return blocs[0][:self._nb_lignes]
+        return np.concatenate(blocs)[:self._nb_lignes]
+
+    def lignes(self, key: str, debut: int) -> NDArray:
+        """Pas enregistrés ``debut`` et suivants du champ ``key``, en ne lisant que les blocs qui les contiennent."""
+        if key not in self._blocs:
+            raise KeyError(f"Champ '{key}' non enregistré.")
+        blocs = self._blocs[key]
+        if not blocs:
+            return np.empty((0,), dtype=float64)
+        premier = min(debut, self._nb_lignes) // self.taille_bloc
+        decalage = premier * self.taille_bloc
+        suivants = blocs[premier:] or blocs[-1:]
+        valeurs = suivants[0] if len(suivants) == 1 else np.concatenate(suivants)
+        return valeurs[max(debut, 0) - decalage:self._nb_lignes - decalage]
+
+
+class EnregistrementDisque(EnregistrementColonnes):
+    """
+    Enregistrement par colonnes écrit sur disque au fil de la simulation.
+
+    Un seul bloc de ``taille_bloc`` lignes par champ reste en mémoire ; quand
+    il est plein, il est ajouté en binaire brut au fichier ``<champ>.bin`` du
+    dossier ``chemin``. ``meta.json`` décrit les colonnes (type, nombre de
+    neurones, nombre de lignes écrites) pour que ``ouvrir_enregistrement``
+    puisse les projeter en mémoire sans copie, pendant ou après la simulation.
+    """
+
+    def __init__(
+        self, chemin: Union[str, os.PathLike], champs: Sequence[str] = ("U",), decimation: int = 1, taille_bloc: int = 1024
+    ) -> None:
+        self.chemin: Path = Path(chemin)
+        self._fichiers: dict[str, BinaryIO] = {}
+        # Mode d'ouverture des fichiers à la prochaine écriture : "wb" après un reset, "ab" pour reprendre à leur suite
+        self._ouverture: Optional[str] = None
+        self._nb_neurones: Optional[int] = None
+        self._nb_lignes_ecrites: int = 0
+        super().__init__(champs, decimation, taille_bloc)
+
+    def reset(self) -> None:
+        if self._ouverture is not None:
+            self.fermer()
+        super().reset()
+        self.chemin.mkdir(parents=True, exist_ok=True)
+        # Les fichiers ne sont tronqués qu'à la première écriture : une reprise peut encore les relire
+        self._ouverture = "wb"
+        self._nb_neurones = None
+        self._nb_lignes_ecrites = 0
+        self._ecrire_meta()
+
+    def _ecrire_meta(self) -> None:
+        meta = {
+            "champs": list(self.champs),
+            "dtypes": {champ: "bool" if champ == "spike" else "float64" for champ in self.champs},
+            "nb_neurones": self._nb_neurones,
+            "nb_lignes": self._nb_lignes_ecrites,
+            "decimation": self.decimation,
+        }
+        with open(self.chemin / "meta.json", "w") as fichier:
+            json.dump(meta, fichier)
+
+    def _ligne_libre(self, nb_neurones: int) -> int:
+        if self._nb_neurones is None:
+            self._nb_neurones = nb_neurones
+            super()._ligne_libre(nb_neurones)
+        elif self._nb_lignes - self._nb_lignes_ecrites == self.taille_bloc:
+            self.flush()
+        return self._nb_lignes - self._nb_lignes_ecrites
+
+    def flush(self) -> None:
+        """Écrit sur disque les lignes encore en mémoire et met à jour ``meta.json``."""
+        nb_en_attente = self._nb_lignes - self._nb_lignes_ecrites
+        if nb_en_attente == 0 or self._ouverture is None:
+            return
+        if not self._fichiers:
+            self._fichiers = {champ: open(self.chemin / f"{champ}.bin", self._ouverture) for champ in self.champs}
+        for champ, fichier in self._fichiers.items():
+            self._blocs[champ][0][:nb_en_attente].tofile(fichier)
+            fichier.flush()
+        self._nb_lignes_ecrites = self._nb_lignes
+        self._ecrire_meta()
+
+    def fermer(self) -> None:
+        """
+        Vide le bloc en mémoire et ferme les fichiers ; de nouvelles lignes
+        rouvriraient les fichiers pour écrire à leur suite.
+        """
+        self.flush()
+        if self._fichiers:
+            for fichier in self._fichiers.values():
+                fichier.close()
+            self._fichiers = {}
+            self._ouverture = "ab"
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        """Positions d'écriture : les lignes en attente sont d'abord écrites, les données restent dans ``chemin``."""
+        self.flush()
+        return {"nb_lignes": self._nb_lignes, "compteur": self._compteur, "nb_neurones": self._nb_neurones}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        """Tronque les fichiers de ``chemin`` aux lignes sauvegardées ; les ajouts reprennent à leur suite."""
+        self.reset()
+        nb_lignes = int(etat["nb_lignes"])
+        nb_neurones = etat.get("nb_neurones")
+        if nb_lignes > 0:
+            for champ in self.champs:
+                taille = nb_lignes * (1 if champ == "t" else int(nb_neurones)) * (1 if champ == "spike" else 8)
+                chemin = self.chemin / f"{champ}.bin"
+                if not chemin.exists() or chemin.stat().st_size < taille:
+                    raise ValueError(f"Le fichier '{chemin}' ne contient pas les {nb_lignes} lignes sauvegardées.")
+                os.truncate(chemin, taille)
+            self._ouverture = "ab"
+        if nb_neurones is not None:
+            self._nb_neurones = int(nb_neurones)
+            self._allouer_bloc(self._nb_neurones)
+        self._nb_lignes = self._nb_lignes_ecrites = nb_lignes
+        self._compteur = int(etat["compteur"])
+        self._ecrire_meta()
+
+    def __enter__(self) -> "EnregistrementDisque":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.fermer()
+
+    def __getitem__(self, key: str) -> NDArray:
+        """Vue en lecture seule, projetée en mémoire, du champ ``key``."""
+        if key not in self._blocs:
+            raise KeyError(f"Champ '{key}' non enregistré.")
+        self.flush()
+        return ouvrir_enregistrement(self.chemin)[key]
+
+    def lignes(self, key: str, debut: int) -> NDArray:
+        """Pas ``debut`` et suivants : lus dans le bloc en mémoire s'ils n'ont pas encore été écrits, sinon sur disque."""
+        if key not in self._blocs:
+            raise KeyError(f"Champ '{key}' non enregistré.")
+        if debut < self._nb_lignes_ecrites:
+            return self[key][debut:]
+        if not self._blocs[key]:
+            return np.empty((0,), dtype=float64)
+        return self._blocs[key][0][debut - self._nb_lignes_ecrites:self._nb_lignes - self._nb_lignes_ecrites]
+
+
+def terminer_enregistrement(enregistrement: Optional[Enregistrement]) -> None:
+    """Fin d'un run : un enregistrement sur disque y écrit son dernier bloc, même incomplet, et ferme ses fichiers."""
+    if isinstance(enregistrement, EnregistrementDisque):
+        enregistrement.fermer()
+
+
+def ouvrir_enregistrement(chemin: Union[str, os.PathLike]) -> dict[str, NDArray]:
+    """
+    Ouvre en lecture seule un enregistrement écrit par ``EnregistrementDisque``.
+
+    Les colonnes sont des ``np.memmap`` : rien n'est chargé en mémoire avant d'être lu.
+
+    Returns:
+        dict: champ -> tableau (lignes x N), ou vecteur pour ``"t"``
+    """
+    chemin = Path(chemin)
+    with open(chemin / "meta.json") as fichier:
+        meta = json.load(fichier)
+    nb_lignes: int = meta["nb_lignes"]
+    colonnes: dict[str, NDArray] = {}
+    for champ in meta["champs"]:
+        dtype = np.dtype(meta["dtypes"][champ])
+        forme = (nb_lignes,) if champ == "t" else (nb_lignes, meta["nb_neurones"] or 0)
+        if nb_lignes == 0:
+            colonnes[champ] = np.empty(forme, dtype=dtype)
+        else:
+            colonnes[champ] = np.memmap(chemin / f"{champ}.bin", dtype=dtype, mode="r", shape=forme)
+    return colonnes
+
+
+class EnregistrementSpikes:
+    """
+    Enregistrement des spikes sous forme d'événements (neurone, pas), façon AER.
+
+    Seuls les spikes sont stockés, dans deux tableaux typés agrandis par
+    doublement. Un index (permutation triée par neurone + décalages) est
+    reconstruit à la demande pour extraire rapidement le train d'un neurone.
+    """
+
+    def __init__(self, nb_neurones: int, dt: float = 1.0, capacite: int = 1024) -> None:
+        self.nb_neurones: int = nb_neurones
+        self.dt: float = dt
+        self._capacite_initiale: int = capacite
+        self.reset()
+
+    def reset(self) -> None:
+        self._neurones: NDArray[np.int32] = np.empty(self._capacite_initiale, dtype=np.int32)
+        self._pas: NDArray[np.int64] = np.empty(self._capacite_initiale, dtype=np.int64)
+        self._nb_spikes: int = 0
+        self._nb_pas: int = 0
+        self._index: Optional[tuple[NDArray[np.intp], NDArray[np.intp]]] = None
+
+    def __len__(self) -> int:
+        return self._nb_spikes
+
+    def ajouter(self, element: Union[PopulationLIF, Reseau, Sequence[Neurone]], t: Optional[float] = None) -> None:
+        neurones = element.neurones if isinstance(element, Reseau) else element
+        pas = self._nb_pas
+        self.ajouter_spikes(np.flatnonzero(_colonne(neurones, "spike")), pas)
+        self._nb_pas = pas + 1
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        return {"neurones": self.neurones, "pas": self.pas, "nb_pas": self._nb_pas}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        self.reset()
+        self.ajouter_spikes(np.asarray(etat["neurones"], dtype=np.int32), np.asarray(etat["pas"], dtype=np.int64))
+        self._nb_pas = int(etat["nb_pas"])
+
+    def ajouter_spikes(self, neurones: NDArray[np.intp], pas: Union[int, NDArray[np.int64]]) -> None:
+        """Ajoute les spikes de ``neurones`` survenus au(x) ``pas`` donné(s)."""
+        nb = neurones.size
+        if nb == 0:
+            return
+        fin = self._nb_spikes + nb
+        if fin > self._neurones.size:
+            capacite = max(fin, 2 * self._neurones.size)
+            self._neurones = np.resize(self._neurones, capacite)
+            self._pas = np.resize(self._pas, capacite)
+        self._neurones[self._nb_spikes:fin] = neurones
+        self._pas[self._nb_spikes:fin] = pas
+        self._nb_spikes = fin
+        self._nb_pas = max(self._nb_pas, int(np.max(pas)) + 1)
+        self._index = None
+
+    @property
+    def neurones(self) -> NDArray[np.int32]:
+        return self._neurones[:self._nb_spikes]
+
+    @property
+    def pas(self) -> NDArray[np.int64]:
+        return self._pas[:self._nb_spikes]
+
+    @property
+    def temps(self) -> NDArray[float64]:
+        return self.pas * self.dt
+
+    @property
+    def nb_pas(self) -> int:
+        """Nombre de pas couverts par l'enregistrement (au moins le dernier pas ayant un spike)."""
+        return self._nb_pas
+
+    @nb_pas.setter
+    def nb_pas(self, nb_pas: int) -> None:
+        self._nb_pas = nb_pas
+
+    @property
+    def duree(self) -> float:
+        return self._nb_pas * self.dt
+
+    def __getitem__(self, key: str) -> NDArray:
+        match key:
+            case "neurone":
+                return self.neurones
+            case "pas":
+                return self.pas
+            case "t":
+                return self.temps
+        raise KeyError(f"Champ '{key}' non valide.")
+
+    def _indexer(self) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """Permutation triant les spikes par neurone (puis par pas) et décalages par neurone."""
+        if self._index is None:
+            ordre = np.lexsort((self.pas, self.neurones))
+            decalages = np.zeros(self.nb_neurones + 1, dtype=np.intp)
+            np.cumsum(np.bincount(self.neurones, minlength=self.nb_neurones), out=decalages[1:])
+            self._index = (ordre, decalages)
+        return self._index
+
+    def pas_neurone(self, neurone: int) -> NDArray[np.int64]:
+        ordre, decalages = self._indexer()
+        return self.pas[ordre[decalages[neurone]:decalages[neurone + 1]]]
+
+    def temps_neurone(self, neurone: int) -> NDArray[float64]:
+        return self.pas_neurone(neurone) * self.dt
+
+    def raster(self) -> tuple[NDArray[float64], NDArray[np.int32]]:
+        """Couples (instants, neurones) pour un nuage de points."""
+        return self.temps, self.neurones
+
+    def trains(self) -> list[NDArray[float64]]:
+        """Instants de spike de chaque neurone, au format attendu par ``Axes.eventplot``."""
+        ordre, decalages = self._indexer()
+        return np.split(self.pas[ordre] * self.dt, decalages[1:-1])
+
+    def nombre_spikes(self) -> NDArray[np.intp]:
+        return np.bincount(self.neurones, minlength=self.nb_neurones)
+
+    def taux_decharge(self) -> NDArray[float64]:
+        """Fréquence moyenne de décharge de chaque neurone (Hz) sur la durée enregistrée."""
+        if self.duree == 0.0:
+            return np.zeros(self.nb_neurones, dtype=float64)
+        return self.nombre_spikes() / self.duree
+
+    def intervalles(self) -> tuple[NDArray[float64], NDArray[np.intp]]:
+        """
+        Intervalles inter-spikes (ISI) de tous les neurones.
+
+        Returns:
+            tuple: (ISI concaténés, triés par neurone puis par date ; neurone de chaque ISI)
+        """
+        ordre, _ = self._indexer()
+        neurones = self.neurones[ordre]
+        ecarts = np.diff(self.pas[ordre]) * self.dt
+        meme_neurone = neurones[1:] == neurones[:-1]
+        return ecarts[meme_neurone], neurones[1:][meme_neurone]
+
+    def statistiques_isi(self) -> dict[str, NDArray[float64]]:
+        """Moyenne, écart-type et coefficient de variation des ISI par neurone (NaN si moins de 2 spikes)."""
+        isi, neurones = self.intervalles()
+        nombre = np.bincount(neurones, minlength=self.nb_neurones)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            moyenne = np.bincount(neurones, weights=isi, minlength=self.nb_neurones) / nombre
+            carres = np.bincount(neurones, weights=isi * isi, minlength=self.nb_neurones) / nombre
+            ecart_type = np.sqrt(np.maximum(carres - moyenne * moyenne, 0.0))
+            return {"moyenne": moyenne, "ecart_type": ecart_type, "cv": ecart_type / moyenne}
@@ -1,6 +1,10 @@
-from typing import Generic, TypeVar
+import math
+import operator
+from array import array
+from typing import Generic, Optional, Sequence, TypeVar
 
 import numpy as np
+from numpy.typing import NDArray
 from typing_extensions import Self
 
 T = TypeVar("T")
@@ -10,130 +14,256 @@ def _build_dtype(names: list[str], t_types: list[type]) -> np.dtype:
     return np.dtype([(name, t_type) for name, t_type in zip(names, t_types)])
 
 
+# Champs réels d'un neurone dans une table d'états, une ligne de N valeurs par
+# champ ; l'absence de spike passé est notée NaN dans ``secondes_depuis_spike``
+CHAMPS_REELS: tuple[str, ...] = ("U0", "U", "theta", "R", "C", "I_ext", "secondes_depuis_spike")
+NB_CHAMPS_REELS: int = len(CHAMPS_REELS)
+INDICES_CHAMPS: dict[str, int] = {champ: indice for indice, champ in enumerate(CHAMPS_REELS)}
+_SECONDES: int = INDICES_CHAMPS["secondes_depuis_spike"]
+# Champs d'état du modèle LIF, sans ``secondes_depuis_spike``
+_NB_CHAMPS_LIF: int = _SECONDES
+
+
+def derivee_lif(U: T, U0: T, R: T, C: T, I_ext: T) -> T:
+    """dU/dt du modèle LIF, commune aux neurones v1, aux processeurs v2 et aux pas vectorisés."""
+    return (R * I_ext - (U - U0)) / (R * C)
+
+
+def taille_memoire(nb_neurones: int) -> int:
+    """Taille en octets du tampon d'une ``TableEtats`` de ``nb_neurones`` neurones."""
+    return nb_neurones * (NB_CHAMPS_REELS * np.dtype(np.float64).itemsize + 1)
+
+
+def _memoire_propre(reels: Sequence[float], spike: bool) -> tuple[memoryview, memoryview]:
+    """Valeurs d'un neurone rattaché à aucune table : ses propres champs réels et son spike."""
+    return memoryview(array("d", reels)), memoryview(bytearray((bool(spike),))).cast("?")
+
+
+class TableEtats:
+    """
+    États de N neurones en colonnes, dans un seul tampon d'octets : les champs
+    réels (une ligne float64 de N valeurs par champ), puis les N spikes.
+
+    ``tableau`` (champs réels x N) et ``spike`` en sont des vues numpy, pour les
+    opérations sur tous les neurones : c'est aussi le stockage de ``PopulationLIF``.
+    ``reels`` et ``spikes`` sont des ``memoryview`` sur les mêmes octets, où un
+    accès scalaire coûte bien moins qu'à travers numpy ; les états individuels
+    (``EtatNeurone``, ``DonneesNeurone`` de v2) y lisent et écrivent leur colonne.
+    """
+
+    __slots__ = ("memoire", "tableau", "spike", "reels", "spikes")
+
+    def __init__(self, nb_neurones: int, memoire: Optional[NDArray[np.uint8]] = None) -> None:
+        """Sans ``memoire``, la table est allouée (aucun spike passé) ; sinon elle en est une vue."""
+        if memoire is None:
+            memoire = np.zeros(taille_memoire(nb_neurones), dtype=np.uint8)
+            self._lier(memoire, nb_neurones)
+            self.colonne("secondes_depuis_spike")[...] = np.nan
+        else:
+            if memoire.shape != (taille_memoire(nb_neurones),):
+                raise ValueError(f"Le tampon ne correspond pas à une table de {nb_neurones} neurones.")
+            self._lier(memoire, nb_neurones)
+
+    def _lier(self, memoire: NDArray[np.uint8], nb_neurones: int) -> None:
+        fin = NB_CHAMPS_REELS * nb_neurones * np.dtype(np.float64).itemsize
+        self.memoire: NDArray[np.uint8] = memoire
+        self.tableau: NDArray[np.float64] = memoire[:fin].view(np.float64).reshape(NB_CHAMPS_REELS, nb_neurones)
+        self.spike: NDArray[np.bool_] = memoire[fin:].view(bool)
+        self.reels: memoryview = memoryview(memoire[:fin]).cast("d")
+        self.spikes: memoryview = memoryview(memoire[fin:]).cast("?")
+
+    def __len__(self) -> int:
+        return self.spike.size
+
+    def colonne(self, champ: str) -> NDArray:
+        """Vue sur les valeurs de ``champ`` pour tous les neurones."""
+        if champ == "spike":
+            return self.spike
+        return self.tableau[INDICES_CHAMPS[champ]]
+
+    def __reduce__(self) -> tuple:
+        # Les vues sont reconstruites sur le tampon copié au lieu d'être copiées à part
+        return TableEtats, (len(self), self.memoire)
+
+
+def _etat_propre(cls: type, reels: Sequence[float], spike: bool) -> "EtatNeurone":
+    etat = cls.__new__(cls)
+    etat._reels, etat._spikes = _memoire_propre(reels, spike)
+    etat._i = 0
+    etat._n = 1
+    return etat
+
+
 class EtatNeurone(Generic[T]):
+    """
+    État d'un neurone : vue sur la colonne ``_i`` d'une ``TableEtats`` de
+    ``_n`` neurones, ou sur ses propres valeurs (une table d'un seul neurone)
+    tant qu'il n'est rattaché à aucune table (voir ``lier_etats``).
+    """
+
+    __slots__ = ("_reels", "_spikes", "_i", "_n")
     _fields: list[str] = ["U0", "U", "theta", "R", "C", "I_ext", "spike"]
+
     def __init__(self, U0: T, U: T, theta: T, R: T, C: T, I_ext: T) -> None:
-        dtype: np.dtype = _build_dtype(self._fields, 
-        [type(U0), type(U), type(theta), type(R), type(C), type(I_ext), type(bool)])
-        self._etat: np.ndarray = np.array([(U0, U, theta, R, C, I_ext, False)], dtype=dtype)
+        self._reels: memoryview
+        self._spikes: memoryview
+        self._reels, self._spikes = _memoire_propre((U0, U, theta, R, C, I_ext, math.nan), False)
+        self._i: int = 0
+        self._n: int = 1
+
+    @classmethod
+    def vue(cls, table: TableEtats, indice: int) -> Self:
+        """État du neurone ``indice`` de ``table``, sans copie."""
+        etat = cls.__new__(cls)
+        etat._lier(table, indice)
+        return etat
+
+    def _lier(self, table: TableEtats, indice: int) -> None:
+        self._reels = table.reels
+        self._spikes = table.spikes
+        self._i = indice
+        self._n = len(table)
 
     def __getitem__(self, key: str) -> T|bool:
-        if key not in self._fields:
+        if key == "spike":
+            return self._spikes[self._i]
+        indice = INDICES_CHAMPS.get(key, _SECONDES)
+        if indice == _SECONDES:
             raise KeyError(f"Champ '{key}' non valide.")
-        return self._etat[key][-1]
+        return self._reels[self._i + indice * self._n]
 
     def __setitem__(self, key: str, value: T|bool) -> None:
-        if key not in self._fields:
+        if key == "spike":
+            self._spikes[self._i] = bool(value)
+            return
+        indice = INDICES_CHAMPS.get(key, _SECONDES)
+        if indice == _SECONDES:
             raise KeyError(f"Champ '{key}' non valide.")
-        self._etat[key][-1] = value
+        self._reels[self._i + indice * self._n] = value
+
+    def _colonne(self) -> memoryview:
+        """Les champs réels du neurone (vue, sans copie)."""
+        return self._reels[self._i::self._n]
 
     def __str__(self) -> str:
-        return ", ".join(f"{k}: {self._etat[k][-1]}" for k in self._fields)
+        return ", ".join(f"{k}: {self[k]}" for k in self._fields)
 
     def __repr__(self) -> str:
-        return f"EtatNeurone {self._etat}"
+        return f"EtatNeurone ({', '.join(repr(self[k]) for k in self._fields)})"
 
     def __copy__(self) -> Self:
-        new_obj = type(self).__new__(type(self))
-        new_obj._etat = self._etat.copy()
-        return new_obj
-    
+        return _etat_propre(type(self), self._colonne(), self._spikes[self._i])
+
+    def __reduce__(self) -> tuple:
+        # Un état se sérialise comme une copie : la table qui le porte n'est pas emportée
+        return _etat_propre, (type(self), tuple(self._colonne()), self._spikes[self._i])
+
+    def copier_depuis(self, autre: "EtatNeurone[T]") -> None:
+        """Recopie ``autre`` dans cet état, sans changer la table qui le porte (éventuellement partagée)."""
+        self._reels[self._i::self._n] = autre._colonne()
+        self._spikes[self._i] = autre._spikes[autre._i]
+
     def _apply_op(self: Self, other, op) -> Self:
-        new_obj = self.__copy__()
-        for field in self._fields:
-            if isinstance(other, type(self)):
-                new_obj._etat[field] = op(self._etat[field], other._etat[field])
-            else:
-                new_obj._etat[field] = op(self._etat[field], other)
-        # Reset spike
-        new_obj._etat["spike"][...] = False
-        
-        return new_obj
+        gauche = self._colonne()[:_NB_CHAMPS_LIF]
+        if isinstance(other, type(self)):
+            droite = other._colonne()[:_NB_CHAMPS_LIF]
+        else:
+            droite = (other,) * _NB_CHAMPS_LIF
+        # Le spike est remis à zéro, secondes_depuis_spike conservé
+        reels = array("d", map(op, gauche, droite))
+        reels.append(self._reels[self._i + _SECONDES * self._n])
+        return _etat_propre(type(self), reels, False)
 
     def __add__(self: Self, other: Self, /) -> Self:
         if not isinstance(other, type(self)):
             return NotImplemented
-        return self._apply_op(other, np.add)
+        return self._apply_op(other, operator.add)
 
     def __mul__(self: Self, other: float | int, /) -> Self:
-        return self._apply_op(other, np.multiply)
+        return self._apply_op(other, operator.mul)
 
     def __truediv__(self: Self, other: float | int, /) -> Self:
-        return self._apply_op(other, np.divide)
+        return self._apply_op(other, operator.truediv)
+
+def lier_etats(etats: Sequence[EtatNeurone]) -> TableEtats:
+    """
+    Regroupe des états dans une seule ``TableEtats`` et fait de chaque état une
+    vue sur sa colonne : une copie de ``memoire`` est un instantané de tous les
+    neurones, et une ``PopulationLIF.vue`` de la table les fait avancer ensemble.
+    """
+    table = TableEtats(len(etats))
+    for i, etat in enumerate(etats):
+        table.tableau[:, i] = etat._colonne()
+        table.spike[i] = etat._spikes[etat._i]
+        etat._lier(table, i)
+    return table
+
 
 E = TypeVar("E")
 
 class DeriveeEtatNeurone(Generic[T,E]):
+    __slots__ = ("_valeurs",)
     _fields: list[str] = ["U0", "U", "theta", "R", "C", "I_ext"]
     def __init__(self, etatNeurone: EtatNeurone[E]) -> None:
-        dtype:np.dtype = np.dtype(
-            [(desc[0], desc[1]) for desc in etatNeurone._etat.dtype.descr if desc[0] in self._fields]
-        )
-        self._etat = np.zeros_like(etatNeurone._etat, dtype=dtype)
+        self._valeurs: array = array("d", bytes(_NB_CHAMPS_LIF * 8))
 
     def __getitem__(self, key: str) -> E:
-        if key not in self._fields:
+        indice = INDICES_CHAMPS.get(key, _NB_CHAMPS_LIF)
+        if indice >= _NB_CHAMPS_LIF:
             raise KeyError(f"Champ '{key}' non valide.")
-        return self._etat[key][-1]
+        return self._valeurs[indice]
 
     def __setitem__(self, key: str, value: E) -> None:
-        if key not in self._fields:
+        indice = INDICES_CHAMPS.get(key, _NB_CHAMPS_LIF)
+        if indice >= _NB_CHAMPS_LIF:
             raise KeyError(f"Champ '{key}' non valide.")
-        self._etat[key][-1] = value
+        self._valeurs[indice] = value
 
     def __str__(self) -> str:
-        return ", ".join(f"{k}: {self._etat[k][-1]}" for k in self._fields)
+        return ", ".join(f"{k}: {v}" for k, v in zip(self._fields, self._valeurs))
 
     def __repr__(self) -> str:
-        return f"DeriveeEtatNeurone {self._etat}"
+        return f"DeriveeEtatNeurone {tuple(self._valeurs)}"
     
     def __copy__(self) -> Self:
         new_obj = type(self).__new__(type(self))
-        new_obj._etat = self._etat.copy()
+        new_obj._valeurs = self._valeurs[:]
         return new_obj
 
     def _apply_op(self: Self, other, op) -> Self:
-        new_derivee = self.__copy__()
-
-        for field in self._fields:
-            if isinstance(other, type(self)):
-                new_derivee._etat[field] = op(self._etat[field], other._etat[field])
-            else:
-                new_derivee._etat[field] = op(self._etat[field], other)
+        new_derivee = type(self).__new__(type(self))
+        if isinstance(other, type(self)):
+            new_derivee._valeurs = array("d", map(op, self._valeurs, other._valeurs))
+        else:
+            new_derivee._valeurs = array("d", (op(valeur, other) for valeur in self._valeurs))
         return new_derivee
 
 
     def __add__(self: Self, other: Self, /) -> Self:
         if not isinstance(other, type(self)):
             return NotImplemented
-        return self._apply_op(other, np.add)
+        return self._apply_op(other, operator.add)
 
     def __mul__(self: Self, other: float | int, /) -> Self:
-        return self._apply_op(other, np.multiply)
+        return self._apply_op(other, operator.mul)
 
     def __truediv__(self: Self, other: float | int, /) -> Self:
-        return self._apply_op(other, np.divide)
+        return self._apply_op(other, operator.truediv)
 
     def integrer(self: Self, t: T) -> EtatNeurone[E]:
-        new_etat = EtatNeurone[E](
-            U0=self._etat["U0"][-1]*t,
-            U=self._etat["U"][-1]*t,
-            theta=self._etat["theta"][-1]*t,
-            R=self._etat["R"][-1]*t,
-            C=self._etat["C"][-1]*t,
-            I_ext=self._etat["I_ext"][-1]*t
-        )
-
-        return new_etat
+        reels = array("d", (valeur * t for valeur in self._valeurs))
+        reels.append(math.nan)
+        return _etat_propre(EtatNeurone, reels, False)
 
 # E = TypeVar("E", bound=EtatNeurone)
 
 class SerieEtatsNeurone(Generic[T]):
+    __slots__ = ("_etats",)
     _fields: list[str] = ["U0", "U", "theta", "R", "C", "I_ext", "spike", "t"]
 
     def __init__(self, steps: int, type_elems: type[T]) :
         dtype: np.dtype = _build_dtype(self._fields, 
-        [type_elems, type_elems, type_elems, type_elems, type_elems, type_elems, type(bool), type_elems]
+        [type_elems, type_elems, type_elems, type_elems, type_elems, type_elems, bool, type_elems]
         )
         self._etats = np.empty(steps, dtype=dtype)
     
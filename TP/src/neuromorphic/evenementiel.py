@@ -0,0 +1,168 @@
+import heapq
+import itertools
+import math
+from enum import IntEnum
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing_extensions import Self
+
+from .noyaux import NoyauTabule
+from .population import PopulationLIF
+from .reseau import Reseau, dirac
+from .synapses import MatriceSynaptiqueCSR
+
+
+class TypeEvenement(IntEnum):
+    COURANT = 0
+    PSP = 1
+    SPIKE = 2
+
+
+class SimulationEvenementielle:
+    """
+    Simulation événementielle d'une population LIF à courants constants par morceaux.
+
+    Entre deux événements, chaque neurone suit la solution exacte
+    U(t) = U_inf + (U(t0) - U_inf) * exp(-(t - t0) / tau), si bien que l'instant
+    où il atteint theta se calcule directement. Une file de priorité contient
+    les spikes prédits, les changements de courant et les PSPs en transit ;
+    seuls les neurones concernés par un événement sont recalculés, jamais les
+    intervalles silencieux.
+
+    Les connexions sont celles d'une matrice CSR (ou d'un ``Reseau`` à noyau
+    dirac) : un spike ajoute instantanément le poids synaptique au potentiel
+    des cibles après ``delai`` secondes. Le délai doit être strictement
+    positif : sans lui, deux neurones qui s'excitent mutuellement au-delà du
+    seuil s'enverraient une infinité de spikes au même instant. Avec
+    ``delai = dt`` (le défaut de ``depuis_reseau``), les trains de spikes
+    coïncident à dt près avec ceux d'un ``Reseau`` à pas fixe.
+    """
+
+    def __init__(
+        self,
+        population: PopulationLIF,
+        synapses: Optional[MatriceSynaptiqueCSR] = None,
+        delai: Optional[float] = None,
+    ) -> None:
+        if synapses is not None and (delai is None or not delai > 0.0):
+            raise ValueError(f"Le délai synaptique doit être strictement positif (dt du Reseau équivalent), pas {delai}.")
+        self.population: PopulationLIF = population
+        self.synapses: Optional[MatriceSynaptiqueCSR] = synapses
+        self.delai: float = 0.0 if delai is None else delai
+        self.t: float = 0.0
+
+        nb_neurones = len(population)
+        self._t_maj: NDArray[np.float64] = np.zeros(nb_neurones, dtype=np.float64)
+        # Un spike prédit n'est valide que si la version du neurone n'a pas changé depuis
+        self._versions: NDArray[np.int64] = np.zeros(nb_neurones, dtype=np.int64)
+        self._file: list[tuple[float, int, TypeEvenement, int, float]] = []
+        self._compteur = itertools.count()
+        self._spikes_neurones: list[int] = []
+        self._spikes_temps: list[float] = []
+
+        self._predire(np.arange(nb_neurones))
+
+    @classmethod
+    def depuis_reseau(cls, reseau: Reseau, delai: Optional[float] = None) -> Self:
+        """
+        Construit la simulation à partir d'un ``Reseau`` dont le noyau est le dirac.
+
+        Par défaut ``delai`` est le pas ``dt`` avec lequel le réseau a été
+        avancé : c'est le délai avec lequel les deux simulations coïncident.
+        """
+        if not (isinstance(reseau.noyau, NoyauTabule) and reseau.noyau.fonction is dirac):
+            raise ValueError("Seul le noyau dirac est compatible avec la simulation événementielle.")
+        if delai is None:
+            delai = reseau.noyau.dt
+            if delai is None:
+                raise ValueError("Le réseau n'a encore jamais été avancé : donner explicitement le délai (son dt).")
+        population = reseau.neurones
+        if not isinstance(population, PopulationLIF):
+            population = PopulationLIF.depuis_neurones(population)
+        return cls(population, reseau.synapses, delai)
+
+    @property
+    def spikes_neurones(self) -> NDArray[np.intp]:
+        return np.asarray(self._spikes_neurones, dtype=np.intp)
+
+    @property
+    def spikes_temps(self) -> NDArray[np.float64]:
+        return np.asarray(self._spikes_temps, dtype=np.float64)
+
+    def temps_spikes(self, neurone: int) -> NDArray[np.float64]:
+        """Instants des spikes émis par ``neurone``."""
+        return self.spikes_temps[self.spikes_neurones == neurone]
+
+    def programmer_courant(self, t: float, neurones: ArrayLike, courants: ArrayLike) -> None:
+        """Programme un changement du courant d'entrée de ``neurones`` à l'instant ``t``."""
+        if t < self.t:
+            raise ValueError(f"Instant {t} antérieur au temps courant {self.t}.")
+        neurones, courants = np.broadcast_arrays(np.asarray(neurones, dtype=np.intp), np.asarray(courants, dtype=np.float64))
+        for i, courant in zip(neurones.ravel().tolist(), courants.ravel().tolist()):
+            heapq.heappush(self._file, (t, next(self._compteur), TypeEvenement.COURANT, i, courant))
+
+    def _avancer(self, neurones: NDArray[np.intp], t: float) -> None:
+        """Fait évoluer analytiquement ``neurones`` jusqu'à l'instant ``t``."""
+        p = self.population
+        U_inf = p["U0"][neurones] + p["R"][neurones] * p["I_ext"][neurones]
+        decroissance = np.exp(-(t - self._t_maj[neurones]) / (p["R"][neurones] * p["C"][neurones]))
+        p["U"][neurones] = U_inf + (p["U"][neurones] - U_inf) * decroissance
+        self._t_maj[neurones] = t
+
+    def _predire(self, neurones: NDArray[np.intp]) -> None:
+        """Invalide les prédictions de ``neurones`` et programme leur prochain franchissement du seuil."""
+        p = self.population
+        self._versions[neurones] += 1
+        U = p["U"][neurones]
+        theta = p["theta"][neurones]
+        U_inf = p["U0"][neurones] + p["R"][neurones] * p["I_ext"][neurones]
+
+        atteint = U_inf > theta
+        instants = np.full(neurones.size, np.inf)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delais = p["R"][neurones] * p["C"][neurones] * np.log((U_inf - U) / (U_inf - theta))
+        instants[atteint] = self._t_maj[neurones][atteint] + np.maximum(delais[atteint], 0.0)
+        instants[U >= theta] = self._t_maj[neurones][U >= theta]
+
+        for i, t_spike in zip(neurones.tolist(), instants.tolist()):
+            if math.isfinite(t_spike):
+                heapq.heappush(self._file, (t_spike, next(self._compteur), TypeEvenement.SPIKE, i, self._versions[i]))
+
+    def _emettre_spike(self, i: int, t: float) -> None:
+        self._spikes_neurones.append(i)
+        self._spikes_temps.append(t)
+        p = self.population
+        p["U"][i] = p["U0"][i]
+        self._t_maj[i] = t
+        self._predire(np.array([i]))
+
+        if self.synapses is None:
+            return
+        debut, fin = self.synapses.indptr[i], self.synapses.indptr[i + 1]
+        for j, poids in zip(self.synapses.indices[debut:fin].tolist(), self.synapses.poids[debut:fin].tolist()):
+            heapq.heappush(self._file, (t + self.delai, next(self._compteur), TypeEvenement.PSP, j, poids))
+
+    def run(self, duree: float) -> None:
+        """Traite tous les événements jusqu'à ``t + duree`` puis y amène toute la population."""
+        t_fin = self.t + duree
+        p = self.population
+        while self._file and self._file[0][0] <= t_fin:
+            t, _, type_evenement, i, valeur = heapq.heappop(self._file)
+            self.t = t
+            match type_evenement:
+                case TypeEvenement.SPIKE:
+                    if valeur == self._versions[i]:
+                        self._emettre_spike(i, t)
+                case TypeEvenement.COURANT:
+                    self._avancer(np.array([i]), t)
+                    p["I_ext"][i] = valeur
+                    self._predire(np.array([i]))
+                case TypeEvenement.PSP:
+                    self._avancer(np.array([i]), t)
+                    p["U"][i] += valeur
+                    self._predire(np.array([i]))
+
+        self._avancer(np.arange(len(p)), t_fin)
+        self.t = t_fin
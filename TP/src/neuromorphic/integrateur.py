@@ -1,4 +1,7 @@
-from typing import Callable, Generic, TypeVar, Protocol, runtime_checkable
+from typing import Callable, Generic, Optional, TypeVar, Protocol, runtime_checkable
+
+import numpy as np
+from numpy.typing import NDArray
 from typing_extensions import Self
 
 Z1 = float | int
@@ -53,3 +56,166 @@ class RK4(Generic[T, E]):
         k4 = fonction(t0 + dt, y0 + k3.integrer(dt))
         y_prime = (k1 + k2 * 2 + k3 * 2 + k4) / 6
         return y0 + y_prime.integrer(dt)
+
+
+# Dérivée sans allocation : fonction(t, y, out) écrit dy/dt dans out
+FonctionEnPlace = Callable[[float, NDArray[np.float64], NDArray[np.float64]], None]
+
+
+def _tampon(tampon: Optional[NDArray[np.float64]], modele: NDArray) -> NDArray[np.float64]:
+    """Retourne ``tampon`` s'il a la forme de ``modele``, sinon en alloue un nouveau."""
+    if tampon is None or tampon.shape != modele.shape:
+        return np.empty(modele.shape, dtype=np.float64)
+    return tampon
+
+
+class IntegrateurEnPlace(Protocol):
+    def step(
+        self, fonction: FonctionEnPlace, dt: float, t0: float, y0: NDArray[np.float64], out: NDArray[np.float64]
+    ) -> NDArray[np.float64]: ...
+
+
+class EulerEnPlace:
+    """
+    Intégrateur d'Euler travaillant sur des tableaux préalloués.
+
+    Le tampon de la dérivée est alloué au premier pas puis réutilisé : un pas
+    n'alloue plus rien ensuite. ``out`` peut être ``y0`` lui-même.
+    """
+
+    def __init__(self) -> None:
+        self._k1: Optional[NDArray[np.float64]] = None
+
+    def step(
+        self, fonction: FonctionEnPlace, dt: float, t0: float, y0: NDArray[np.float64], out: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        k1 = self._k1 = _tampon(self._k1, y0)
+        fonction(t0, y0, k1)
+        k1 *= dt
+        np.add(y0, k1, out=out)
+        return out
+
+
+class RK4EnPlace:
+    """
+    Intégrateur de Runge-Kutta 4 travaillant sur des tableaux préalloués.
+
+    k1..k4 et l'état intermédiaire sont des tampons possédés par l'intégrateur
+    et réutilisés d'un pas à l'autre. ``out`` peut être ``y0`` lui-même.
+    """
+
+    def __init__(self) -> None:
+        self._k1: Optional[NDArray[np.float64]] = None
+        self._k2: Optional[NDArray[np.float64]] = None
+        self._k3: Optional[NDArray[np.float64]] = None
+        self._k4: Optional[NDArray[np.float64]] = None
+        self._y: Optional[NDArray[np.float64]] = None
+
+    def step(
+        self, fonction: FonctionEnPlace, dt: float, t0: float, y0: NDArray[np.float64], out: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        k1 = self._k1 = _tampon(self._k1, y0)
+        k2 = self._k2 = _tampon(self._k2, y0)
+        k3 = self._k3 = _tampon(self._k3, y0)
+        k4 = self._k4 = _tampon(self._k4, y0)
+        y = self._y = _tampon(self._y, y0)
+
+        fonction(t0, y0, k1)
+        np.multiply(k1, dt / 2, out=y)
+        y += y0
+        fonction(t0 + dt / 2, y, k2)
+        np.multiply(k2, dt / 2, out=y)
+        y += y0
+        fonction(t0 + dt / 2, y, k3)
+        np.multiply(k3, dt, out=y)
+        y += y0
+        fonction(t0 + dt, y, k4)
+
+        # y_prime = (k1 + 2*k2 + 2*k3 + k4) / 6, accumulé dans k1 dans l'ordre de RK4
+        k2 *= 2
+        k3 *= 2
+        k1 += k2
+        k1 += k3
+        k1 += k4
+        k1 /= 6
+        k1 *= dt
+        np.add(y0, k1, out=out)
+        return out
+
+
+class DormandPrinceEnPlace:
+    """
+    Intégrateur de Dormand-Prince 5(4) à estimation d'erreur embarquée.
+
+    ``step_erreur`` donne la solution d'ordre 5 et l'écart avec la solution
+    d'ordre 4, qui sert à adapter le pas. Après un pas, ``derivee_debut`` et
+    ``derivee_fin`` contiennent dy/dt aux deux extrémités (la dernière étape
+    est évaluée en (t0 + dt, y1)), ce qui permet une interpolation d'Hermite
+    dans le pas sans nouvelle évaluation.
+    """
+
+    C: tuple[float, ...] = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+    A: tuple[tuple[float, ...], ...] = (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+    )
+    # Poids d'ordre 5 (dernière ligne de A) moins poids d'ordre 4
+    E: tuple[float, ...] = (
+        71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40,
+    )
+
+    def __init__(self) -> None:
+        self._k: list[Optional[NDArray[np.float64]]] = [None] * 7
+        self._y: Optional[NDArray[np.float64]] = None
+        self._erreur: Optional[NDArray[np.float64]] = None
+
+    @property
+    def derivee_debut(self) -> Optional[NDArray[np.float64]]:
+        return self._k[0]
+
+    @property
+    def derivee_fin(self) -> Optional[NDArray[np.float64]]:
+        return self._k[6]
+
+    def step_erreur(
+        self,
+        fonction: FonctionEnPlace,
+        dt: float,
+        t0: float,
+        y0: NDArray[np.float64],
+        out: NDArray[np.float64],
+        erreur: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """Pas d'ordre 5 écrit dans ``out`` (distinct de ``y0``) ; l'erreur estimée est écrite dans ``erreur``."""
+        k = self._k = [_tampon(tampon, y0) for tampon in self._k]
+        y = self._y = _tampon(self._y, y0)
+
+        fonction(t0, y0, k[0])
+        for etape in range(1, 7):
+            y[...] = y0
+            for j, a in enumerate(self.A[etape]):
+                if a != 0.0:
+                    y += (dt * a) * k[j]
+            if etape == 6:
+                # Les poids de la dernière étape sont ceux de la solution d'ordre 5
+                out[...] = y
+                fonction(t0 + dt, out, k[6])
+            else:
+                fonction(t0 + self.C[etape] * dt, y, k[etape])
+
+        erreur[...] = 0.0
+        for j, e in enumerate(self.E):
+            if e != 0.0:
+                erreur += (dt * e) * k[j]
+        return out
+
+    def step(
+        self, fonction: FonctionEnPlace, dt: float, t0: float, y0: NDArray[np.float64], out: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        erreur = self._erreur = _tampon(self._erreur, y0)
+        return self.step_erreur(fonction, dt, t0, y0.copy() if out is y0 else y0, out, erreur)
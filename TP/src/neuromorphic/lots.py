@@ -0,0 +1,104 @@
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .enregistrement import EnregistrementColonnes
+from .neurone_update_strategy import NeuroneUpdateStrategy
+from .population import PopulationLIF
+
+
+class SimulationLots:
+    """
+    Simulation de B essais indépendants de N neurones dans un seul état vectorisé.
+
+    Les essais forment une dimension de lot : la population sous-jacente compte
+    B * N neurones (l'essai b occupe les colonnes b*N à (b+1)*N), et chaque pas
+    fait avancer tous les essais en un seul appel. Paramètres, pas de temps,
+    courants et bruit peuvent différer d'un essai à l'autre ; les résultats sont
+    rendus indexés par essai.
+    """
+
+    def __init__(
+        self,
+        nb_essais: int,
+        nb_neurones: int,
+        update_strategy: NeuroneUpdateStrategy,
+        champs: Sequence[str] = ("U", "spike"),
+        decimation: int = 1,
+        **parametres: ArrayLike,
+    ) -> None:
+        """
+        Args:
+            nb_essais (int): Nombre d'essais B
+            nb_neurones (int): Nombre de neurones N par essai
+            update_strategy (NeuroneUpdateStrategy): Stratégie commune à tous les essais
+            champs (Sequence[str]): Champs enregistrés ; ``"t"`` est refusé, les instants
+                dépendant du pas de temps de chaque essai (``t = pas * dt``)
+            decimation (int): Un pas enregistré sur ``decimation``
+            **parametres: U0, U, theta, R, C ou I_ext, diffusables en (B, N) ;
+                par exemple ``theta=np.array([...])[:, None]`` pour un balayage de theta
+        """
+        if "t" in champs:
+            raise ValueError("Le champ 't' n'est pas enregistré par essai : les instants valent pas * dt de chaque essai.")
+        self.nb_essais: int = nb_essais
+        self.nb_neurones: int = nb_neurones
+        self.update_strategy: NeuroneUpdateStrategy = update_strategy
+        colonnes = {nom: np.broadcast_to(valeur, self.forme).ravel() for nom, valeur in parametres.items()}
+        self.population: PopulationLIF = PopulationLIF(nb_essais * nb_neurones, **colonnes)
+        self.enregistrement: EnregistrementColonnes = EnregistrementColonnes(champs, decimation)
+
+    @property
+    def forme(self) -> tuple[int, int]:
+        return (self.nb_essais, self.nb_neurones)
+
+    def run(
+        self,
+        nb_iterations: int,
+        dt: ArrayLike,
+        get_current_inputs_callback: Callable[[NDArray[np.float64]], ArrayLike],
+        bruit: ArrayLike = 0.0,
+        graines: Optional[Sequence[int]] = None,
+    ) -> None:
+        """
+        Simule ``nb_iterations`` pas pour tous les essais.
+
+        Args:
+            dt (ArrayLike): Pas de temps commun ou un par essai (forme (B,))
+            get_current_inputs_callback: Reçoit les instants des essais (forme (B, 1))
+                et renvoie les courants, diffusables en (B, N)
+            bruit (ArrayLike): Écart-type d'un bruit gaussien ajouté au courant, par essai
+            graines (Sequence[int]): Graine du générateur de bruit de chaque essai ;
+                le bruit d'un essai ne dépend pas des autres essais du lot
+        """
+        self.population.reset()
+        self.enregistrement.reset()
+
+        dt_essais = np.broadcast_to(np.asarray(dt, dtype=np.float64), (self.nb_essais,))[:, None]
+        dt_neurones = np.broadcast_to(dt_essais, self.forme).ravel()
+        ecarts_types = np.broadcast_to(np.asarray(bruit, dtype=np.float64), (self.nb_essais,))
+        bruites = np.flatnonzero(ecarts_types)
+        if graines is None:
+            graines = np.random.SeedSequence().spawn(self.nb_essais)
+        generateurs = [np.random.default_rng(graines[b]) for b in bruites]
+
+        courants = np.empty(self.forme, dtype=np.float64)
+        tirage = np.empty(self.nb_neurones, dtype=np.float64)
+        for pas in range(nb_iterations):
+            t = pas * dt_essais
+            courants[...] = get_current_inputs_callback(t)
+            for b, generateur in zip(bruites, generateurs):
+                generateur.standard_normal(out=tirage)
+                tirage *= ecarts_types[b]
+                courants[b] += tirage
+            self.update_strategy.update(self.population, dt_neurones, courants.ravel())
+            self.enregistrement.ajouter(self.population)
+
+    def resultats(self, champ: str) -> NDArray:
+        """Champ enregistré, de forme (B, pas enregistrés, N)."""
+        valeurs = self.enregistrement[champ]
+        return valeurs.reshape(len(self.enregistrement), self.nb_essais, self.nb_neurones).transpose(1, 0, 2)
+
+    def essai(self, b: int) -> dict[str, NDArray]:
+        """Tous les champs enregistrés de l'essai ``b``, de forme (pas enregistrés, N)."""
+        return {champ: self.resultats(champ)[b] for champ in self.enregistrement.champs}
@@ -1,13 +1,35 @@
 import copy
+import math
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional, TypeVar
 
+import numpy as np
+from numpy.typing import NDArray
+from typing_extensions import Self
 
-from .etat_neurone import DeriveeEtatNeurone, EtatNeurone
-from .integrateur import RK4, Euler, Integrateur
+from .etat_neurone import DeriveeEtatNeurone, EtatNeurone, derivee_lif
+from .integrateur import RK4, Euler, EulerEnPlace, Integrateur, IntegrateurEnPlace, RK4EnPlace
+
+
+class _TamponsEnPlace(threading.local):
+    """Intégrateurs en place et tampon de U des pas sans allocation : un jeu par thread."""
+
+    def __init__(self) -> None:
+        self.euler: EulerEnPlace = EulerEnPlace()
+        self.rk4: RK4EnPlace = RK4EnPlace()
+        self.U: NDArray[np.float64] = np.zeros(1, dtype=np.float64)
+
+
+# Partagés par tous les neurones d'un même thread, dont les pas se suivent sans se chevaucher
+_tampons_en_place = _TamponsEnPlace()
 
 
 class Neurone(ABC):
+    # L'état est une vue sur une colonne de TableEtats : un neurone ne porte que
+    # ces références, pas de __dict__ ni de tampons propres
+    __slots__ = ("_etat", "_etat_initial")
+
     def __init__(self, etat: EtatNeurone) -> None:
         self._etat: EtatNeurone = etat
         self._etat_initial: EtatNeurone = copy.copy(etat)
@@ -16,6 +38,10 @@ class Neurone(ABC):
     @abstractmethod
     def _fonction_derivatrice(t: float, y: EtatNeurone) -> DeriveeEtatNeurone: ...
 
+    @abstractmethod
+    def _fonction_derivatrice_en_place(self, t: float, U: NDArray[np.float64], out: NDArray[np.float64]) -> None:
+        """Variante sans allocation de la dérivée : écrit dU/dt dans ``out``."""
+
     def _check_and_emit_spike(self) -> bool:
         """Vérifie si le neurone émet un spike et le réinitialise si besoin."""
         if self._etat["U"] >= self._etat["theta"]:
@@ -40,7 +66,28 @@ class Neurone(ABC):
         y0: EtatNeurone = self._etat
         f = self._fonction_derivatrice
 
-        self._etat = integrateur.step(fonction=f, dt=dt, t0=0.0, y0=y0)
+        # Recopié dans l'état existant, qui peut être une vue sur un tableau partagé
+        self._etat.copier_depuis(integrateur.step(fonction=f, dt=dt, t0=0.0, y0=y0))
+
+        self._add_psps(psps)
+
+        return self._check_and_emit_spike()
+
+    def _update_en_place(
+        self,
+        dt: float,
+        I_ext: float,
+        psps: float,
+        integrateur: IntegrateurEnPlace,
+    ) -> bool:
+        self._etat["I_ext"] = I_ext
+        self._etat["spike"] = False
+
+        # U est intégré dans un tampon d'un élément, puis recopié dans l'état
+        U: NDArray[np.float64] = _tampons_en_place.U
+        U[0] = self._etat["U"]
+        integrateur.step(fonction=self._fonction_derivatrice_en_place, dt=dt, t0=0.0, y0=U, out=U)
+        self._etat["U"] = U[0]
 
         self._add_psps(psps)
 
@@ -54,19 +101,40 @@ class Neurone(ABC):
         """Met à jour l'état en utilisant l'intégrateur de Runge-Kutta 4."""
         return self._update(dt, I_ext, psps, integrateur=RK4)
 
+    def updateEulerEnPlace(self, dt: float, I_ext: float, psps: float = 0.0) -> bool:
+        """Met à jour l'état avec l'intégrateur d'Euler sans allocation."""
+        return self._update_en_place(dt, I_ext, psps, integrateur=_tampons_en_place.euler)
+
+    def updateRK4EnPlace(self, dt: float, I_ext: float, psps: float = 0.0) -> bool:
+        """Met à jour l'état avec l'intégrateur de Runge-Kutta 4 sans allocation."""
+        return self._update_en_place(dt, I_ext, psps, integrateur=_tampons_en_place.rk4)
+
     def reset(self) -> None:
         """Réinitialise l'état du neurone à son état initial."""
-        self._etat = copy.copy(self._etat_initial)
+        self._etat.copier_depuis(self._etat_initial)
 
     @property
     def etat(self) -> EtatNeurone[float]:
+        """Copie de l'état courant, qui ne suit pas les pas suivants."""
         return copy.copy(self._etat)
 
+    def __deepcopy__(self, memo: dict) -> Self:
+        """
+        Copie indépendante sans parcours générique des attributs : seul l'état
+        courant est copié, l'état initial (jamais modifié en place) est partagé.
+        """
+        clone = copy.copy(self)
+        clone._etat = copy.copy(self._etat)
+        memo[id(self)] = clone
+        return clone
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}: {{ {self._etat} }}"
 
 
 class LIF(Neurone):
+    __slots__ = ("_cle_decroissance", "_decroissance")
+
     def __init__(
         self,
         U0: float = 0.0,
@@ -79,25 +147,47 @@ class LIF(Neurone):
         U = U if U is not None else U0
         etat = EtatNeurone[float](U0=U0, U=U, theta=theta, R=R, C=C, I_ext=I_ext)
         super().__init__(etat)
+        # Facteur exp(-dt / tau) mis en cache pour le dernier couple (dt, tau)
+        self._cle_decroissance: tuple[float, float] = (0.0, 0.0)
+        self._decroissance: float = 1.0
 
     @staticmethod
     def _fonction_derivatrice(t: float, y: EtatNeurone) -> DeriveeEtatNeurone:
         """Calcul de la dérivée pour le modèle LIF."""
 
-        U0 = y["U0"]
-        U = y["U"]
-        R = y["R"]
-        C = y["C"]
-        I_ext = y["I_ext"]
-
-        tau = R * C
-        diff_potentiel = U - U0
-
         derivee = DeriveeEtatNeurone(y)
-        derivee["U"] = (R * I_ext - diff_potentiel) / tau
+        derivee["U"] = derivee_lif(y["U"], y["U0"], y["R"], y["C"], y["I_ext"])
 
         return derivee
 
+    def updateExponentiel(self, dt: float, I_ext: float, psps: float = 0.0) -> bool:
+        """
+        Met à jour l'état avec la solution exacte de l'EDO du LIF.
+
+        Le courant étant constant sur le pas, U(t+dt) = U_inf + (U - U_inf) * exp(-dt/tau)
+        avec U_inf = U0 + R * I_ext : la dynamique sous le seuil est exacte quel que soit dt.
+        """
+        etat = self._etat
+        etat["I_ext"] = I_ext
+        etat["spike"] = False
+
+        R = etat["R"]
+        tau = R * etat["C"]
+        if self._cle_decroissance != (dt, tau):
+            self._cle_decroissance = (dt, tau)
+            self._decroissance = math.exp(-dt / tau)
+
+        U_inf = etat["U0"] + R * I_ext
+        etat["U"] = U_inf + (etat["U"] - U_inf) * self._decroissance
+
+        self._add_psps(psps)
+
+        return self._check_and_emit_spike()
+
+    def _fonction_derivatrice_en_place(self, t: float, U: NDArray[np.float64], out: NDArray[np.float64]) -> None:
+        y = self._etat
+        out[0] = derivee_lif(U.item(0), y["U0"], y["R"], y["C"], y["I_ext"])
+
 def main():
     # Exemple d'utilisation
     neurone1 = LIF()
@@ -128,8 +218,8 @@ def main():
     for i in tqdm(range(1_000_000), desc="Simulation neurones"):
         # print(f"Neurone Euler: \n\t{neurone1.etat}")
         # print(f"Neurone RK4: \n\t{neurone2.etat}")
-        neurone1.updateEuler(dt=dt, I_ext=1.0)
-        neurone1.updateRK4(dt=dt, I_ext=1.0)
+        neurone1.updateEulerEnPlace(dt=dt, I_ext=1.0)
+        neurone2.updateRK4EnPlace(dt=dt, I_ext=1.0)
 
     end_time = perf_counter()
     duration = end_time - start_time
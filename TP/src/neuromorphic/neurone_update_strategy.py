@@ -1,12 +1,21 @@
-from typing import Protocol
+from typing import Protocol, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from .neurone import Neurone
+from .population import PopulationLIF
+
+# Une stratégie s'applique indifféremment à un neurone seul ou à une population
+Neurones = Union[Neurone, PopulationLIF]
+Spikes = Union[bool, NDArray[np.bool_]]
 
 
 class NeuroneUpdateStrategy(Protocol):
     @staticmethod
     def update(
-        neurone: Neurone, dt: float, intensite: float, psps: float = 0.0
-    ) -> bool: ...
+        neurone: Neurones, dt: float, intensite: ArrayLike, psps: ArrayLike = 0.0
+    ) -> Spikes: ...
 
 
 class EulerUpdateStrategy(NeuroneUpdateStrategy):
@@ -18,8 +27,8 @@ class EulerUpdateStrategy(NeuroneUpdateStrategy):
 
     @staticmethod
     def update(
-        neurone: Neurone, dt: float, intensite: float, psps: float = 0.0
-    ) -> bool:
+        neurone: Neurones, dt: float, intensite: ArrayLike, psps: ArrayLike = 0.0
+    ) -> Spikes:
         return neurone.updateEuler(dt, intensite, psps)
 
 
@@ -32,6 +41,50 @@ class RK4UpdateStrategy(NeuroneUpdateStrategy):
 
     @staticmethod
     def update(
-        neurone: Neurone, dt: float, intensite: float, psps: float = 0.0
-    ) -> bool:
+        neurone: Neurones, dt: float, intensite: ArrayLike, psps: ArrayLike = 0.0
+    ) -> Spikes:
         return neurone.updateRK4(dt, intensite, psps)
+
+
+# Les stratégies en place ne s'appliquent qu'aux neurones isolés : le pas d'une
+# PopulationLIF (backends.pas_lif) calcule sur des temporaires avant de recopier U
+class EulerEnPlaceUpdateStrategy(NeuroneUpdateStrategy):
+    def __str__(self) -> str:
+        return "Euler (en place)"
+
+    def __repr__(self) -> str:
+        return "EulerEnPlaceUpdateStrategy"
+
+    @staticmethod
+    def update(
+        neurone: Neurones, dt: float, intensite: ArrayLike, psps: ArrayLike = 0.0
+    ) -> Spikes:
+        return neurone.updateEulerEnPlace(dt, intensite, psps)
+
+
+class RK4EnPlaceUpdateStrategy(NeuroneUpdateStrategy):
+    def __str__(self) -> str:
+        return "RK4 (en place)"
+
+    def __repr__(self) -> str:
+        return "RK4EnPlaceUpdateStrategy"
+
+    @staticmethod
+    def update(
+        neurone: Neurones, dt: float, intensite: ArrayLike, psps: ArrayLike = 0.0
+    ) -> Spikes:
+        return neurone.updateRK4EnPlace(dt, intensite, psps)
+
+
+class ExponentielUpdateStrategy(NeuroneUpdateStrategy):
+    def __str__(self) -> str:
+        return "Exponentiel"
+
+    def __repr__(self) -> str:
+        return "ExponentielUpdateStrategy"
+
+    @staticmethod
+    def update(
+        neurone: Neurones, dt: float, intensite: ArrayLike, psps: ArrayLike = 0.0
+    ) -> Spikes:
+        return neurone.updateExponentiel(dt, intensite, psps)
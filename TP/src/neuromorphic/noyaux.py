@@ -0,0 +1,185 @@
+import math
+from typing import Callable, Optional, Protocol, runtime_checkable
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def _meme_pas(dt: float, autre: Optional[float]) -> bool:
+    return autre is not None and math.isclose(dt, autre, rel_tol=1e-9)
+
+
+@runtime_checkable
+class NoyauSynaptique(Protocol):
+    """
+    Noyau alpha d'un réseau : valeur de la PSP émise par chaque neurone en
+    fonction du temps écoulé depuis son dernier spike.
+    """
+
+    def preparer(self, dt: float, nb_neurones: int) -> None:
+        """Alloue l'état pour ``nb_neurones`` et (re)calcule ce qui dépend de ``dt``."""
+        ...
+
+    def valeurs(self) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+        """Indices des neurones dont le noyau est non négligeable et valeurs associées."""
+        ...
+
+    def avancer(self, spikes: NDArray[np.bool_]) -> None:
+        """Avance l'état d'un pas de temps après la mise à jour des neurones."""
+        ...
+
+
+class NoyauTabule:
+    """
+    Noyau quelconque tabulé une seule fois sur la grille des pas de temps.
+
+    ``fonction`` est évaluée en ``k * dt`` jusqu'à ce qu'elle repasse
+    durablement sous ``epsilon`` ; au-delà, le noyau est considéré nul. À
+    chaque pas, la valeur d'un neurone est lue dans la table à l'indice du
+    nombre de pas écoulés depuis son dernier spike.
+    """
+
+    def __init__(
+        self,
+        fonction: Callable[[float], float],
+        epsilon: float = 1e-6,
+        pas_max: int = 1_000_000,
+        taille_bloc: int = 1024,
+    ) -> None:
+        self.fonction: Callable[[float], float] = fonction
+        self.epsilon: float = epsilon
+        self.pas_max: int = pas_max
+        self.taille_bloc: int = taille_bloc
+        self.dt: Optional[float] = None
+        self.table: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        # Nombre de pas depuis le dernier spike, saturé à len(table) (noyau éteint)
+        self.pas_depuis_spikes: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+
+    def _tabuler(self, dt: float) -> NDArray[np.float64]:
+        blocs: list[NDArray[np.float64]] = []
+        dernier_significatif: int = -1
+        for debut in range(0, self.pas_max, self.taille_bloc):
+            fin = min(debut + self.taille_bloc, self.pas_max)
+            temps = np.arange(debut, fin, dtype=np.float64) * dt
+            bloc = np.fromiter(map(self.fonction, temps.tolist()), dtype=np.float64, count=fin - debut)
+            blocs.append(bloc)
+            significatifs = np.flatnonzero(np.abs(bloc) >= self.epsilon)
+            if significatifs.size > 0:
+                dernier_significatif = debut + int(significatifs[-1])
+            elif dernier_significatif >= 0:
+                break
+        return np.concatenate(blocs)[:dernier_significatif + 1]
+
+    def preparer(self, dt: float, nb_neurones: int) -> None:
+        if self.pas_depuis_spikes.size != nb_neurones:
+            self.pas_depuis_spikes = np.full(nb_neurones, self.table.size, dtype=np.int64)
+        if dt <= 0.0 or _meme_pas(dt, self.dt):
+            return
+        eteints = self.pas_depuis_spikes >= self.table.size
+        self.table = self._tabuler(dt)
+        self.dt = dt
+        self.pas_depuis_spikes[eteints] = self.table.size
+        np.minimum(self.pas_depuis_spikes, self.table.size, out=self.pas_depuis_spikes)
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        # La table est sauvegardée avec son dt : les compteurs saturés valent sa taille
+        return {"dt": self.dt, "table": self.table, "pas_depuis_spikes": self.pas_depuis_spikes}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        self.dt = etat.get("dt")
+        self.table = np.array(etat["table"], dtype=np.float64)
+        self.pas_depuis_spikes = np.array(etat["pas_depuis_spikes"], dtype=np.int64)
+
+    def valeurs(self) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+        actifs = np.flatnonzero(self.pas_depuis_spikes < self.table.size)
+        return actifs, self.table[self.pas_depuis_spikes[actifs]]
+
+    def avancer(self, spikes: NDArray[np.bool_]) -> None:
+        self.pas_depuis_spikes += 1
+        np.minimum(self.pas_depuis_spikes, self.table.size, out=self.pas_depuis_spikes)
+        self.pas_depuis_spikes[spikes] = 0
+
+
+class NoyauExponentiel:
+    """
+    Noyau exponentiel exp(-t / tau), évalué par récurrence.
+
+    Chaque pas coûte une multiplication par neurone : x <- x * exp(-dt / tau),
+    et x vaut 1 juste après un spike.
+    """
+
+    def __init__(self, tau: float, epsilon: float = 1e-6) -> None:
+        self.tau: float = tau
+        self.epsilon: float = epsilon
+        self.dt: Optional[float] = None
+        self.decroissance: float = 1.0
+        self.trace: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+
+    def preparer(self, dt: float, nb_neurones: int) -> None:
+        if self.trace.size != nb_neurones:
+            self.trace = np.zeros(nb_neurones, dtype=np.float64)
+        if dt <= 0.0 or _meme_pas(dt, self.dt):
+            return
+        self.dt = dt
+        self.decroissance = math.exp(-dt / self.tau)
+
+    def etat_sauvegarde(self) -> dict[str, NDArray[np.float64]]:
+        return {"trace": self.trace}
+
+    def restaurer_etat(self, etat: dict[str, NDArray[np.float64]]) -> None:
+        self.trace = np.array(etat["trace"], dtype=np.float64)
+
+    def valeurs(self) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+        actifs = np.flatnonzero(self.trace >= self.epsilon)
+        return actifs, self.trace[actifs]
+
+    def avancer(self, spikes: NDArray[np.bool_]) -> None:
+        self.trace *= self.decroissance
+        self.trace[spikes] = 1.0
+
+
+class NoyauAlphaExponentiel:
+    """
+    Noyau alpha (t / tau) * exp(1 - t / tau), évalué par récurrence exacte.
+
+    Avec d = exp(-dt / tau) et la trace auxiliaire e(t) = exp(-t / tau) :
+    e <- d * e et a <- d * (a + e * dt / tau * exp(1)). Juste après un spike,
+    e = 1 et a = 0.
+    """
+
+    def __init__(self, tau: float, epsilon: float = 1e-6) -> None:
+        self.tau: float = tau
+        self.epsilon: float = epsilon
+        self.dt: Optional[float] = None
+        self.decroissance: float = 1.0
+        self.increment: float = 0.0
+        self.trace: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self.alpha: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+
+    def preparer(self, dt: float, nb_neurones: int) -> None:
+        if self.alpha.size != nb_neurones:
+            self.trace = np.zeros(nb_neurones, dtype=np.float64)
+            self.alpha = np.zeros(nb_neurones, dtype=np.float64)
+        if dt <= 0.0 or _meme_pas(dt, self.dt):
+            return
+        self.dt = dt
+        self.decroissance = math.exp(-dt / self.tau)
+        self.increment = dt / self.tau * math.e
+
+    def etat_sauvegarde(self) -> dict[str, NDArray[np.float64]]:
+        return {"trace": self.trace, "alpha": self.alpha}
+
+    def restaurer_etat(self, etat: dict[str, NDArray[np.float64]]) -> None:
+        self.trace = np.array(etat["trace"], dtype=np.float64)
+        self.alpha = np.array(etat["alpha"], dtype=np.float64)
+
+    def valeurs(self) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+        actifs = np.flatnonzero(self.alpha >= self.epsilon)
+        return actifs, self.alpha[actifs]
+
+    def avancer(self, spikes: NDArray[np.bool_]) -> None:
+        self.alpha += self.increment * self.trace
+        self.alpha *= self.decroissance
+        self.trace *= self.decroissance
+        self.trace[spikes] = 1.0
+        self.alpha[spikes] = 0.0
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Iterable, Sequence, Optional
+import time
+from typing import Any, Iterable, Sequence, Optional, Union
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 from matplotlib.ticker import EngFormatter, FuncFormatter
 import numpy as np
@@ -7,8 +9,9 @@ from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.lines import Line2D
 from matplotlib.units import AxisInfo, ConversionInterface, registry
-from numpy.typing import ArrayLike
-from .simulation import SimulationEventType, SimulationNeurones
+from numpy.typing import ArrayLike, NDArray
+from .enregistrement import _colonne
+from .simulation import SimulationEventType, SimulationNeurones, SimulationPopulation
 from .etat_neurone import EtatNeurone
 from .neurone import Neurone
 
@@ -51,6 +54,11 @@ class LinearDataPlotter(NeuronesPlotter):
         self._axes.xaxis.set_major_formatter(EngFormatter(x_unit))
         self._axes.yaxis.set_major_formatter(EngFormatter(y_unit))
         self._plot_lines: list[Line2D] = []
+        # Historique tracé (neurones x pas), agrandi par doublement : un UPDATE
+        # n'y recopie que les pas enregistrés depuis le précédent
+        self._x: NDArray[np.float64] = np.empty((0, 0))
+        self._y: NDArray[np.float64] = np.empty((0, 0))
+        self._nb_lignes: int = 0
     
 
     def init(self) -> Iterable[Artist]:
@@ -64,7 +72,9 @@ class LinearDataPlotter(NeuronesPlotter):
                 line: Line2D = self._axes.plot([], [])[0]
                 line.set_animated(True)
                 self._plot_lines.append(line)
-
+        for line in self._plot_lines[self._nb_neurones:]:
+            line.remove()
+        del self._plot_lines[self._nb_neurones:]
 
         self._axes.legend(handles=self._plot_lines, labels=[f"Neurone {i+1}" for i in range(self._nb_neurones)])
 
@@ -76,23 +86,67 @@ class LinearDataPlotter(NeuronesPlotter):
     def draw(self) -> Iterable[Artist]:
         return *self._plot_lines,
 
-    def update(self, event_type: SimulationEventType, context: SimulationNeurones, data) -> None:
+    def _nouvelles_lignes(
+        self, context: Union[SimulationNeurones, SimulationPopulation]
+    ) -> tuple[NDArray, NDArray]:
+        """
+        Abscisses et ordonnées (neurones x pas) des pas enregistrés depuis le
+        dernier tracé, lues dans ``donnees`` ou, à défaut, dans l'enregistrement.
+        """
+        enregistrement = context.enregistrement
+        if enregistrement is None:
+            if context.iteration + 1 < self._nb_lignes:
+                self._nb_lignes = 0
+            plot_data: np.ndarray = np.array([
+                serie_etats_neurones.etats[self._nb_lignes:context.iteration+1]
+                for serie_etats_neurones in context.donnees
+            ])
+            return plot_data[self._x_data_field], plot_data[self._y_data_field]
+        if len(enregistrement) < self._nb_lignes:
+            self._nb_lignes = 0
+        valeurs = np.asarray(enregistrement.lignes(self._y_data_field, self._nb_lignes)).T
+        abscisses = np.asarray(enregistrement.lignes(self._x_data_field, self._nb_lignes))
+        return (abscisses.T if abscisses.ndim == 2 else np.broadcast_to(abscisses, valeurs.shape)), valeurs
+
+    def _ajouter(self, abscisses: NDArray, valeurs: NDArray) -> None:
+        fin = self._nb_lignes + valeurs.shape[1]
+        if fin > self._y.shape[1] or self._y.shape[0] != valeurs.shape[0]:
+            capacite = max(2 * self._y.shape[1], fin, 64)
+            x, y = np.empty((valeurs.shape[0], capacite)), np.empty((valeurs.shape[0], capacite))
+            if self._y.shape[0] == valeurs.shape[0]:
+                x[:, :self._nb_lignes] = self._x[:, :self._nb_lignes]
+                y[:, :self._nb_lignes] = self._y[:, :self._nb_lignes]
+            self._x, self._y = x, y
+        self._x[:, self._nb_lignes:fin] = abscisses
+        self._y[:, self._nb_lignes:fin] = valeurs
+        self._nb_lignes = fin
+
+    def update(self, event_type: SimulationEventType, context: Union[SimulationNeurones, SimulationPopulation], data) -> None:
         """
         Update the plot based on the event type and data received.
         """
         match event_type:
             case SimulationEventType.INIT:
-                self._nb_neurones = len(data)
+                self._nb_neurones = (
+                    len(context.population) if isinstance(context, SimulationPopulation) else len(context.neurones)
+                )
+                self._nb_lignes = 0
+                if context.enregistrement is not None:
+                    champs = set(getattr(context.enregistrement, "champs", ()))
+                    manquants = {self._x_data_field, self._y_data_field} - champs
+                    if manquants:
+                        raise ValueError(
+                            f"L'enregistrement de la simulation ne contient pas les champs tracés {sorted(manquants)}."
+                        )
             case SimulationEventType.UPDATE:
-                plot_data: np.ndarray = np.array([
-                    serie_etats_neurones.etats[:context.iteration+1] for serie_etats_neurones in context.donnees
-                ])
-                timestamps: np.ndarray = plot_data[self._x_data_field]
-                potentiels: np.ndarray = plot_data[self._y_data_field]
+                timestamps, potentiels = self._nouvelles_lignes(context)
+                if potentiels.size == 0:
+                    return
+                self._ajouter(timestamps, potentiels)
                 for i, line in enumerate(self._plot_lines):
-                    line.set_xdata(timestamps[i])
-                    line.set_ydata(potentiels[i])
-                
+                    line.set_data(self._x[i, :self._nb_lignes], self._y[i, :self._nb_lignes])
+
+                # Les limites ne font que s'élargir : seuls les nouveaux pas peuvent les dépasser
                 new_x_limits: tuple[float, float] = (np.min(timestamps), np.max(timestamps))
                 new_y_limits: tuple[float, float] = (np.min(potentiels), np.max(potentiels))
                 self._check_limits(new_x_limits, new_y_limits)
@@ -103,4 +157,181 @@ class PotentielsPlotter(LinearDataPlotter):
     
 class InputsPlotter(LinearDataPlotter):
     def __init__(self, axes: Axes) -> None:
-        super().__init__(axes, "Courants d'entrée", "temps", "courant", "s", "A", "t", "I_ext")
\ No newline at end of file
+        super().__init__(axes, "Courants d'entrée", "temps", "courant", "s", "A", "t", "I_ext")
+
+
+def figure_hors_ecran(**kwargs: Any) -> Figure:
+    """Figure rendue par Agg, sans pyplot ni affichage : utilisable sur un serveur sans écran."""
+    figure = Figure(**kwargs)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+class TamponCirculaire:
+    """
+    Derniers ``capacite`` pas (instant et une valeur par neurone), dans des
+    tableaux préalloués : un ajout coûte O(N), quelle que soit la durée du run.
+    """
+
+    def __init__(self, capacite: int, nb_colonnes: int) -> None:
+        self.capacite: int = capacite
+        self._temps: NDArray[np.float64] = np.empty(capacite, dtype=np.float64)
+        self._valeurs: NDArray[np.float64] = np.empty((capacite, nb_colonnes), dtype=np.float64)
+        self._suivant: int = 0
+        self._taille: int = 0
+
+    def __len__(self) -> int:
+        return self._taille
+
+    def reset(self) -> None:
+        self._suivant = 0
+        self._taille = 0
+
+    def ajouter(self, t: float, valeurs: ArrayLike) -> None:
+        self._temps[self._suivant] = t
+        self._valeurs[self._suivant] = valeurs
+        self._suivant = (self._suivant + 1) % self.capacite
+        self._taille = min(self._taille + 1, self.capacite)
+
+    def donnees(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Instants et valeurs, du plus ancien au plus récent (copies)."""
+        if self._taille < self.capacite:
+            return self._temps[:self._taille].copy(), self._valeurs[:self._taille].copy()
+        ordre = np.r_[self._suivant:self.capacite, 0:self._suivant]
+        return self._temps[ordre], self._valeurs[ordre]
+
+
+def decimer_min_max(
+    temps: NDArray[np.float64], valeurs: NDArray[np.float64], nb_paquets: int
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Réduit une série (n, N) à 2 points par paquet (le minimum et le maximum de
+    chaque paquet de pas consécutifs) : le tracé garde l'enveloppe exacte de la
+    série, en particulier les spikes, avec un paquet par pixel de largeur.
+    """
+    n = temps.size
+    if n <= 2 * nb_paquets:
+        return temps, valeurs
+    taille_paquet = n // nb_paquets
+    m = taille_paquet * nb_paquets
+    paquets = valeurs[:m].reshape(nb_paquets, taille_paquet, -1)
+    extremes = np.stack((paquets.min(axis=1), paquets.max(axis=1)), axis=1).reshape(2 * nb_paquets, -1)
+    temps_paquets = np.repeat(temps[:m:taille_paquet], 2)
+    # Les derniers pas (moins d'un paquet) sont gardés tels quels
+    return np.concatenate((temps_paquets, temps[m:])), np.concatenate((extremes, valeurs[m:]))
+
+
+class LiveDataPlotter(NeuronesPlotter):
+    """
+    Tracé en direct d'un champ de tous les neurones, pour les longues simulations.
+
+    Chaque UPDATE ajoute un pas dans un tampon circulaire ; l'historique n'est
+    relu, décimé (min/max par pixel) et redessiné qu'au plus ``images_par_seconde``
+    fois par seconde, ainsi qu'en fin de run. Avec ``fichier`` (par exemple
+    ``"potentiels_{:04d}.png"``), chaque image est écrite sur disque au lieu
+    d'être affichée ; combiné à ``figure_hors_ecran``, aucun écran n'est requis.
+    """
+
+    def __init__(
+        self,
+        axes: Axes,
+        title: str,
+        x_label: str,
+        y_label: str,
+        x_unit: str,
+        y_unit: str,
+        y_data_field: str,
+        capacite: int = 100_000,
+        images_par_seconde: float = 10.0,
+        nb_pixels: Optional[int] = None,
+        fichier: Optional[str] = None,
+    ) -> None:
+        super().__init__(axes)
+        self._axes.set_title(title)
+        self._axes.set_xlabel(x_label)
+        self._axes.set_ylabel(y_label)
+        self._axes.xaxis.set_major_formatter(EngFormatter(x_unit))
+        self._axes.yaxis.set_major_formatter(EngFormatter(y_unit))
+        self._y_data_field: str = y_data_field
+        # Événements traités, pour ``Publisher.abonner``
+        self.evenements: tuple[SimulationEventType, ...] = (
+            SimulationEventType.INIT, SimulationEventType.RESET, SimulationEventType.UPDATE, SimulationEventType.RUN_END,
+        )
+        self._capacite: int = capacite
+        self._periode: float = 1.0 / images_par_seconde
+        self._nb_pixels: int = nb_pixels if nb_pixels is not None else max(1, int(self._axes.bbox.width))
+        self._fichier: Optional[str] = fichier
+        self._tampon: Optional[TamponCirculaire] = None
+        self._plot_lines: list[Line2D] = []
+        self._dernier_dessin: float = -np.inf
+        self.nb_images: int = 0
+
+    def _valeurs(self, context: Union[SimulationNeurones, SimulationPopulation]) -> NDArray:
+        if isinstance(context, SimulationPopulation):
+            return context.population[self._y_data_field]
+        return _colonne(context.neurones, self._y_data_field)
+
+    def init(self) -> Iterable[Artist]:
+        if self._nb_neurones > len(self._plot_lines):
+            for _ in range(self._nb_neurones - len(self._plot_lines)):
+                self._plot_lines.append(self._axes.plot([], [])[0])
+        for line in self._plot_lines[self._nb_neurones:]:
+            line.remove()
+        del self._plot_lines[self._nb_neurones:]
+        for line in self._plot_lines:
+            line.set_data([], [])
+        if self._tampon is None or self._tampon._valeurs.shape[1] != self._nb_neurones:
+            self._tampon = TamponCirculaire(self._capacite, self._nb_neurones)
+        self._tampon.reset()
+        self._dernier_dessin = -np.inf
+        return *self._plot_lines,
+
+    def draw(self) -> Iterable[Artist]:
+        if self._tampon is None or len(self._tampon) == 0:
+            return *self._plot_lines,
+        temps, valeurs = decimer_min_max(*self._tampon.donnees(), self._nb_pixels)
+        for i, line in enumerate(self._plot_lines):
+            line.set_data(temps, valeurs[:, i])
+        x_limits = (temps[0], temps[-1]) if temps[-1] > temps[0] else (temps[0], temps[0] + 1.0)
+        y_min, y_max = float(np.nanmin(valeurs)), float(np.nanmax(valeurs))
+        marge = 0.05 * (y_max - y_min) or 1.0
+        self._axes.set_xlim(x_limits)
+        self._axes.set_ylim(y_min - marge, y_max + marge)
+        return *self._plot_lines,
+
+    def _rendre(self) -> None:
+        self.draw()
+        canvas = self._axes.figure.canvas
+        if self._fichier is not None:
+            self._axes.figure.savefig(self._fichier.format(self.nb_images))
+        else:
+            canvas.draw_idle()
+            canvas.flush_events()
+        self.nb_images += 1
+        self._dernier_dessin = time.perf_counter()
+
+    def update(self, event_type: SimulationEventType, context: Union[SimulationNeurones, SimulationPopulation], data) -> None:
+        match event_type:
+            case SimulationEventType.INIT | SimulationEventType.RESET:
+                self._nb_neurones = (
+                    len(context.population) if isinstance(context, SimulationPopulation) else len(context.neurones)
+                )
+                self.init()
+            case SimulationEventType.UPDATE:
+                if self._tampon is None:
+                    return
+                self._tampon.ajouter(context.temps, self._valeurs(context))
+                if time.perf_counter() - self._dernier_dessin >= self._periode:
+                    self._rendre()
+            case SimulationEventType.RUN_END:
+                self._rendre()
+
+
+class LivePotentielsPlotter(LiveDataPlotter):
+    def __init__(self, axes: Axes, **kwargs: Any) -> None:
+        super().__init__(axes, "Potentiels des neurones", "temps", "potentiel", "s", "V", "U", **kwargs)
+
+
+class LiveInputsPlotter(LiveDataPlotter):
+    def __init__(self, axes: Axes, **kwargs: Any) -> None:
+        super().__init__(axes, "Courants d'entrée", "temps", "courant", "s", "A", "I_ext", **kwargs)
@@ -0,0 +1,196 @@
+import copy
+from typing import Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing_extensions import Self
+
+from .backends import EtatPopulation, pas_lif
+from .etat_neurone import TableEtats
+from .neurone import Neurone
+
+
+class PopulationLIF:
+    """
+    Population de neurones LIF stockée en colonnes contiguës (structure de tableaux).
+
+    L'état est une ``TableEtats``, le stockage commun avec les neurones v1 et les
+    données v2 : les champs réels (U0, U, theta, R, C, I_ext) sont des lignes
+    float64 de N valeurs et ``spike`` un tableau booléen de taille N, vues sur
+    un même tampon. Une mise à jour fait avancer tous les neurones en un seul
+    appel vectorisé, avec la même sémantique que ``Neurone._update`` :
+    intégration, ajout des PSPs, détection du seuil puis réinitialisation. Le
+    pas lui-même est ``backends.pas_lif``, appelé avec NumPy, puis recopié dans
+    les colonnes de la population.
+    """
+
+    _fields: list[str] = ["U0", "U", "theta", "R", "C", "I_ext", "spike"]
+    _champs_reels: list[str] = _fields[:-1]
+
+    def __init__(
+        self,
+        nb_neurones: int,
+        U0: ArrayLike = 0.0,
+        U: Optional[ArrayLike] = None,
+        theta: ArrayLike = 0.1,
+        R: ArrayLike = 1.0,
+        C: ArrayLike = 1.0,
+        I_ext: ArrayLike = 0.0,
+    ) -> None:
+        U = U if U is not None else U0
+        table = TableEtats(nb_neurones)
+        for ligne, valeur in enumerate((U0, U, theta, R, C, I_ext)):
+            table.tableau[ligne] = valeur
+        self._lier(table)
+
+    def _lier(self, table: TableEtats) -> None:
+        # Tout l'état (champs réels puis spikes) tient dans le tampon de la table : un
+        # instantané, une restauration ou un reset sont une seule copie mémoire
+        self._table: TableEtats = table
+        self._memoire: NDArray[np.uint8] = table.memoire
+        self._donnees: NDArray[np.float64] = table.tableau[:len(self._champs_reels)]
+        self._spike: NDArray[np.bool_] = table.spike
+        self._memoire_initiale: NDArray[np.uint8] = self._memoire.copy()
+        self._donnees_initiales: NDArray[np.float64] = (
+            TableEtats(len(table), self._memoire_initiale).tableau[:len(self._champs_reels)]
+        )
+        self._allouer_tampons(len(table))
+
+    @classmethod
+    def vue(cls, table: TableEtats) -> Self:
+        """
+        Population sur une table existante, sans copie : ses pas font avancer les
+        neurones v1 ou les données v2 qui sont des vues sur cette table (voir
+        ``lier_etats``). Son état initial est l'état courant de la table.
+        """
+        population = cls.__new__(cls)
+        population._lier(table)
+        return population
+
+    def _allouer_tampons(self, nb_neurones: int) -> None:
+        self._tau: NDArray[np.float64] = np.empty(nb_neurones, dtype=np.float64)
+        # Facteurs exp(-dt / tau) par neurone, recalculés si dt, R ou C changent ;
+        # R et C sont comparés à leurs valeurs au dernier calcul, car les colonnes
+        # renvoyées par __getitem__ peuvent être modifiées en place
+        self._decroissance: NDArray[np.float64] = np.empty(nb_neurones, dtype=np.float64)
+        self._RC_decroissance: NDArray[np.float64] = np.empty((2, nb_neurones), dtype=np.float64)
+        self._dt_decroissance: Optional[ArrayLike] = None
+
+    @classmethod
+    def depuis_neurones(cls, neurones: Sequence[Neurone]) -> Self:
+        """Construit une population à partir de l'état courant de neurones individuels."""
+        etats = [neurone.etat for neurone in neurones]
+        colonnes = {
+            field: np.fromiter((etat[field] for etat in etats), dtype=np.float64, count=len(etats))
+            for field in cls._champs_reels
+        }
+        return cls(len(etats), **colonnes)
+
+    def __len__(self) -> int:
+        return self._spike.size
+
+    def __getitem__(self, key: str) -> NDArray:
+        """Retourne une vue (sans copie) sur la colonne ``key``."""
+        if key == "spike":
+            return self._spike
+        if key not in self._champs_reels:
+            raise KeyError(f"Champ '{key}' non valide.")
+        return self._donnees[self._champs_reels.index(key)]
+
+    def __setitem__(self, key: str, value: ArrayLike) -> None:
+        """Affecte la colonne ``key``."""
+        self[key][...] = value
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}: {{ {len(self)} neurones }}"
+
+    def _update(self, dt: ArrayLike, I_ext: ArrayLike, psps: ArrayLike, methode: str) -> NDArray[np.bool_]:
+        self._donnees[5] = I_ext
+        decroissance = self._facteurs_decroissance(dt) if methode == "exponentiel" else None
+        etat = EtatPopulation(*self._donnees, self._spike)
+        etat = pas_lif(np, etat, dt, self._donnees[5], psps, methode, decroissance)
+        np.copyto(self._donnees[1], etat.U)
+        np.copyto(self._spike, etat.spike)
+        return self._spike
+
+    def updateEuler(self, dt: ArrayLike, I_ext: ArrayLike, psps: ArrayLike = 0.0) -> NDArray[np.bool_]:
+        """Met à jour tous les neurones avec l'intégrateur d'Euler."""
+        return self._update(dt, I_ext, psps, "euler")
+
+    def updateRK4(self, dt: ArrayLike, I_ext: ArrayLike, psps: ArrayLike = 0.0) -> NDArray[np.bool_]:
+        """Met à jour tous les neurones avec l'intégrateur de Runge-Kutta 4."""
+        return self._update(dt, I_ext, psps, "rk4")
+
+    def _facteurs_decroissance(self, dt: ArrayLike) -> NDArray[np.float64]:
+        """Facteurs exp(-dt/tau) par neurone, recalculés seulement si dt, R ou C ont changé."""
+        # dt peut être un tableau (un pas par neurone, cf. SimulationLots)
+        RC = self._donnees[3:5]
+        if (
+            self._dt_decroissance is None
+            or not np.array_equal(self._dt_decroissance, dt)
+            or not np.array_equal(self._RC_decroissance, RC)
+        ):
+            np.multiply(RC[0], RC[1], out=self._tau)
+            np.divide(-dt, self._tau, out=self._decroissance)
+            np.exp(self._decroissance, out=self._decroissance)
+            np.copyto(self._RC_decroissance, RC)
+            self._dt_decroissance = np.copy(dt)
+        return self._decroissance
+
+    def updateExponentiel(self, dt: ArrayLike, I_ext: ArrayLike, psps: ArrayLike = 0.0) -> NDArray[np.bool_]:
+        """
+        Met à jour tous les neurones avec la solution exacte de l'EDO du LIF.
+
+        U(t+dt) = U_inf + (U - U_inf) * exp(-dt/tau), avec U_inf = U0 + R * I_ext.
+        Les facteurs exp(-dt/tau) sont précalculés par neurone et réutilisés tant
+        que dt, R et C ne changent pas.
+        """
+        return self._update(dt, I_ext, psps, "exponentiel")
+
+    def reset(self) -> None:
+        """Réinitialise la population à son état initial."""
+        np.copyto(self._memoire, self._memoire_initiale)
+        self._dt_decroissance = None
+
+    def instantane(self) -> NDArray[np.uint8]:
+        """Copie de tout l'état courant, en un seul tampon contigu."""
+        return self._memoire.copy()
+
+    def restaurer_instantane(self, instantane: NDArray[np.uint8]) -> None:
+        """Remet la population dans l'état d'un ``instantane`` de cette population (ou d'une de même taille)."""
+        if instantane.shape != self._memoire.shape:
+            raise ValueError("L'instantané ne correspond pas à la taille de la population.")
+        np.copyto(self._memoire, instantane)
+        self._dt_decroissance = None
+
+    def dupliquer(self) -> Self:
+        """Population indépendante dans le même état courant et avec le même état initial."""
+        clone = copy.copy(self)
+        clone._lier(TableEtats(len(self), self._memoire.copy()))
+        np.copyto(clone._memoire_initiale, self._memoire_initiale)
+        return clone
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        clone = self.dupliquer()
+        memo[id(self)] = clone
+        return clone
+
+    def etat_sauvegarde(self) -> dict[str, NDArray]:
+        return {"donnees": self._donnees, "spike": self._spike, "donnees_initiales": self._donnees_initiales}
+
+    def restaurer_etat(self, etat: dict[str, NDArray]) -> None:
+        if etat["donnees"].shape != self._donnees.shape:
+            raise ValueError(f"L'état sauvegardé contient {etat['donnees'].shape[1]} neurones, {len(self)} attendus.")
+        np.copyto(self._donnees, etat["donnees"])
+        np.copyto(self._spike, etat["spike"])
+        np.copyto(self._donnees_initiales, etat["donnees_initiales"])
+        self._dt_decroissance = None
+
+    @property
+    def etat(self) -> NDArray:
+        """Copie de l'état sous forme de tableau structuré de N enregistrements."""
+        dtype = np.dtype([(field, np.float64) for field in self._champs_reels] + [("spike", bool)])
+        etat = np.empty(len(self), dtype=dtype)
+        for field in self._fields:
+            etat[field] = self[field]
+        return etat
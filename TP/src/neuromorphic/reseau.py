@@ -1,32 +1,50 @@
 import numpy as np
 from .neurone import Neurone, LIF
 from .neurone_update_strategy import NeuroneUpdateStrategy, EulerUpdateStrategy
-from typing import List, Dict, Callable, Optional
+from .population import PopulationLIF
+from .synapses import FileRetards, MatriceSynaptiqueCSR
+from .noyaux import NoyauSynaptique, NoyauTabule
+from .stdp import PlasticiteSTDP
+from .sauvegarde import Etat, etat_de, etat_neurones, restaurer_dans, restaurer_neurones
+from typing import List, Dict, Callable, Optional, Sequence, Union
 
 def dirac(t: float) -> float:
     return 1. if t == 0. else 0.
 
 class Reseau:
     def __init__(self, 
-                 neurones: List[Neurone] = [LIF()], 
-                 connectivite: Dict[int, Dict[int, float]] = {}, 
-                 fonction_alpha: Optional[Callable[[float], float]] = None,
-                 update_strategy: Optional[NeuroneUpdateStrategy]=None) -> None:
-        self.connectivite: Dict[int, List[int]] = {i: list(connexions.keys()) for i, connexions in connectivite.items()}
-        self.neurones: List[Neurone] = neurones
+                 neurones: Union[List[Neurone], PopulationLIF] = [LIF()], 
+                 connectivite: Union[Dict[int, Dict[int, float]], MatriceSynaptiqueCSR] = {}, 
+                 fonction_alpha: Optional[Union[Callable[[float], float], NoyauSynaptique]] = None,
+                 update_strategy: Optional[NeuroneUpdateStrategy]=None,
+                 plasticite: Optional[PlasticiteSTDP]=None,
+                 delais: Optional[Dict[int, Dict[int, int]]]=None) -> None:
+        self.neurones: Union[List[Neurone], PopulationLIF] = neurones
         nb_neurones: int = len(neurones)
-        self.poids: np.ndarray = np.zeros((nb_neurones, nb_neurones), dtype=float)
-        for i, connexions in connectivite.items():
-            for j, poids in connexions.items():
-                self.poids[i, j] = poids
+        self.synapses: MatriceSynaptiqueCSR
+        if isinstance(connectivite, MatriceSynaptiqueCSR):
+            if delais is not None:
+                raise ValueError("Les retards d'une MatriceSynaptiqueCSR sont donnés à sa construction.")
+            self.synapses = connectivite
+        else:
+            self.synapses = MatriceSynaptiqueCSR.depuis_connectivite(connectivite, nb_neurones, delais)
+
+        # Avec des retards (en pas), les PSPs transitent par un tampon circulaire
+        # avant d'arriver ; sans retard, elles arrivent au pas qui suit le spike
+        self.file_retards: Optional[FileRetards] = None
+        if self.synapses.delais is not None:
+            self.file_retards = FileRetards(self.synapses.nb_cibles, self.synapses.retard_max)
 
         self.temps_depuis_spikes: np.ndarray = np.full(nb_neurones, np.nan, dtype=float)
 
-        self.fonction_alpha: np.vectorize
+        # Une fonction alpha quelconque est tabulée une fois sur la grille des pas de temps
+        self.noyau: NoyauSynaptique
         if fonction_alpha is None:
-            self.fonction_alpha = np.vectorize(dirac)
+            self.noyau = NoyauTabule(dirac)
+        elif isinstance(fonction_alpha, NoyauSynaptique):
+            self.noyau = fonction_alpha
         else:
-            self.fonction_alpha = np.vectorize(fonction_alpha)
+            self.noyau = NoyauTabule(fonction_alpha)
 
         self.update_strategy: NeuroneUpdateStrategy
         if update_strategy is None:
@@ -34,14 +52,85 @@ class Reseau:
         else:
             self.update_strategy = update_strategy
 
-    def update(self, dt: float, intensites: list[float]) -> list[bool]:
+        # Apprentissage en ligne (STDP) des poids de ``self.synapses``, désactivé par défaut
+        self.plasticite: Optional[PlasticiteSTDP] = plasticite
+        if plasticite is not None and plasticite.poids is not self.synapses:
+            raise ValueError("La plasticité doit porter sur la matrice synaptique du réseau.")
+
+    @property
+    def connectivite(self) -> Dict[int, List[int]]:
+        return {i: self.synapses.cibles(i).tolist() for i in range(self.synapses.nb_neurones)
+                if self.synapses.indptr[i + 1] > self.synapses.indptr[i]}
+
+    @property
+    def poids(self) -> np.ndarray:
+        """Matrice dense des poids (construite à la demande, en O(N²))."""
+        return self.synapses.dense()
+
+    def etat_sauvegarde(self) -> Etat:
+        """Neurones, poids, temps depuis les spikes, noyau et règle de plasticité."""
+        etat: Etat = {
+            "neurones": self.neurones.etat_sauvegarde() if isinstance(self.neurones, PopulationLIF) else etat_neurones(self.neurones),
+            "synapses": self.synapses.etat_sauvegarde(),
+            "temps_depuis_spikes": self.temps_depuis_spikes,
+            "noyau": etat_de(self.noyau),
+        }
+        if self.plasticite is not None:
+            etat["regle"] = etat_de(self.plasticite.regle)
+        if self.file_retards is not None:
+            etat["retards"] = self.file_retards.etat_sauvegarde()
+        return etat
+
+    def restaurer_etat(self, etat: Etat) -> None:
+        if isinstance(self.neurones, PopulationLIF):
+            self.neurones.restaurer_etat(etat["neurones"])
+        else:
+            restaurer_neurones(self.neurones, etat["neurones"])
+        self.synapses.restaurer_etat(etat["synapses"])
+        np.copyto(self.temps_depuis_spikes, etat["temps_depuis_spikes"])
+        restaurer_dans(self.noyau, etat.get("noyau", {}))
+        if self.plasticite is not None:
+            restaurer_dans(self.plasticite.regle, etat.get("regle", {}))
+        # Les retards sont restaurés avec la matrice : la file est recréée à leur mesure
+        self.file_retards = None
+        if self.synapses.delais is not None:
+            self.file_retards = FileRetards(self.synapses.nb_cibles, self.synapses.retard_max)
+            if "retards" in etat:
+                self.file_retards.restaurer_etat(etat["retards"])
+
+    def update(self, dt: float, intensites: Sequence[float]) -> Sequence[bool]:
+
+        self.noyau.preparer(dt, len(self.neurones))
+        # Seuls les neurones dont le noyau alpha est non nul propagent des PSPs
+        actifs, alphas = self.noyau.valeurs()
+        psps: np.ndarray
+        if self.file_retards is None:
+            psps = self.synapses.propager(actifs, alphas)
+        else:
+            psps = self.synapses.propager_retarde(actifs, alphas, self.file_retards)
+
+        if isinstance(self.neurones, PopulationLIF):
+            # Un seul pas vectorisé pour toute la population
+            spikes_population: np.ndarray = self.update_strategy.update(self.neurones, dt, intensites, psps)
+            if self.file_retards is not None:
+                self.file_retards.avancer()
+            self.temps_depuis_spikes += dt
+            self.temps_depuis_spikes[spikes_population] = 0.
+            self.noyau.avancer(spikes_population)
+            if self.plasticite is not None:
+                self.plasticite.update(dt, spikes_population)
+            return spikes_population
 
-        alphas: np.ndarray = self.fonction_alpha(self.temps_depuis_spikes)
-        psps: np.ndarray = alphas.dot(self.poids)
         spikes: list[bool] = []
 
         for i, neurone in enumerate(self.neurones):
             spikes.append(self.update_strategy.update(neurone, dt, intensites[i], psps[i]))
             self.temps_depuis_spikes[i] = 0. if spikes[i] else self.temps_depuis_spikes[i] + dt
-        
+        if self.file_retards is not None:
+            self.file_retards.avancer()
+
+        spikes_reseau = np.asarray(spikes, dtype=bool)
+        self.noyau.avancer(spikes_reseau)
+        if self.plasticite is not None:
+            self.plasticite.update(dt, spikes_reseau)
         return spikes
\ No newline at end of file
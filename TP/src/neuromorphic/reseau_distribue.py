@@ -0,0 +1,199 @@
+import copy
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from multiprocessing.synchronize import Barrier
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .enregistrement import EnregistrementSpikes
+from .neurone_update_strategy import EulerUpdateStrategy, NeuroneUpdateStrategy
+from .noyaux import NoyauSynaptique, NoyauTabule
+from .population import PopulationLIF
+from .reseau import dirac
+from .synapses import FileRetards, MatriceSynaptiqueCSR
+
+# Intervalle (s) entre deux vérifications que les partitions sont toujours en vie
+_PERIODE_SURVEILLANCE: float = 0.5
+
+
+def _partition(
+    indice: int,
+    debut: int,
+    fin: int,
+    bornes: list[tuple[int, int]],
+    population: PopulationLIF,
+    synapses: MatriceSynaptiqueCSR,
+    noyau: NoyauSynaptique,
+    update_strategy: NeuroneUpdateStrategy,
+    nb_iterations: int,
+    dt: float,
+    get_current_inputs: Callable[[float], ArrayLike],
+    noms_memoires: tuple[str, str],
+    barriere: Barrier,
+    resultats: multiprocessing.Queue,
+) -> None:
+    """
+    Boucle d'un processus : fait avancer la tranche [debut, fin) et échange
+    à chaque pas les indices de ses neurones ayant émis un spike.
+    """
+    nb_neurones = synapses.nb_neurones
+    memoire_indices = shared_memory.SharedMemory(name=noms_memoires[0])
+    memoire_comptes = shared_memory.SharedMemory(name=noms_memoires[1])
+    # Chaque partition écrit ses indices dans sa propre zone [debut, fin) du tampon
+    indices_spikes = np.ndarray(nb_neurones, dtype=np.int64, buffer=memoire_indices.buf)
+    comptes = np.ndarray(len(bornes), dtype=np.int64, buffer=memoire_comptes.buf)
+    spikes_globaux = np.zeros(nb_neurones, dtype=bool)
+    spikes = EnregistrementSpikes(fin - debut, dt)
+    file_retards = FileRetards(synapses.nb_cibles, synapses.retard_max) if synapses.delais is not None else None
+
+    try:
+        for pas in range(nb_iterations):
+            noyau.preparer(dt, nb_neurones)
+            actifs, alphas = noyau.valeurs()
+            if file_retards is None:
+                psps = synapses.propager(actifs, alphas)
+            else:
+                psps = synapses.propager_retarde(actifs, alphas, file_retards)
+            courants = np.asarray(get_current_inputs(pas * dt), dtype=np.float64)
+            if courants.ndim > 0:
+                courants = courants[debut:fin]
+            spikes_locaux = np.flatnonzero(update_strategy.update(population, dt, courants, psps))
+            if file_retards is not None:
+                file_retards.avancer()
+
+            indices_spikes[debut:debut + spikes_locaux.size] = spikes_locaux + debut
+            comptes[indice] = spikes_locaux.size
+            barriere.wait()
+            spikes_globaux[...] = False
+            for partition, (debut_partition, _) in enumerate(bornes):
+                spikes_globaux[indices_spikes[debut_partition:debut_partition + comptes[partition]]] = True
+            barriere.wait()
+
+            noyau.avancer(spikes_globaux)
+            spikes.ajouter_spikes(spikes_locaux, pas)
+    except Exception as erreur:
+        # Débloque les autres partitions, qui échoueront à leur tour sur la barrière
+        barriere.abort()
+        resultats.put((indice, erreur))
+        return
+    finally:
+        del indices_spikes, comptes
+        memoire_indices.close()
+        memoire_comptes.close()
+
+    resultats.put((indice, (spikes.neurones + debut, spikes.pas, population._donnees, population["spike"])))
+
+
+class ReseauDistribue:
+    """
+    Réseau dont les neurones sont répartis en tranches entre plusieurs processus.
+
+    Chaque processus fait avancer sa tranche de la population et ne garde que
+    les synapses dont la cible est dans sa tranche. À chaque pas, les
+    processus publient en mémoire partagée les seuls indices de leurs neurones
+    ayant émis un spike, puis chacun reconstitue le vecteur global des spikes
+    pour faire avancer son noyau et calculer ses PSPs : la communication est
+    proportionnelle au nombre de spikes, pas à N.
+
+    Le noyau de chaque processus évolue à partir du même vecteur de spikes, si
+    bien que les trains de spikes sont identiques à ceux d'un ``Reseau``
+    exécuté sur un seul cœur avec la même population.
+    """
+
+    def __init__(
+        self,
+        population: PopulationLIF,
+        synapses: MatriceSynaptiqueCSR,
+        nb_partitions: int,
+        fonction_alpha: Optional[NoyauSynaptique] = None,
+        update_strategy: Optional[NeuroneUpdateStrategy] = None,
+    ) -> None:
+        self.population: PopulationLIF = population
+        self.synapses: MatriceSynaptiqueCSR = synapses
+        self.noyau: NoyauSynaptique = fonction_alpha if fonction_alpha is not None else NoyauTabule(dirac)
+        self.update_strategy: NeuroneUpdateStrategy = (
+            update_strategy if update_strategy is not None else EulerUpdateStrategy()
+        )
+        limites = np.linspace(0, len(population), nb_partitions + 1).astype(int)
+        self.bornes: list[tuple[int, int]] = [(int(a), int(b)) for a, b in zip(limites[:-1], limites[1:])]
+
+    def run(self, nb_iterations: int, dt: float, get_current_inputs_callback: Callable[[float], ArrayLike]) -> EnregistrementSpikes:
+        """
+        Simule ``nb_iterations`` pas ; la population est mise à jour avec l'état final.
+
+        ``get_current_inputs_callback`` est exécutée dans chaque processus : elle
+        doit être picklable et renvoyer les N courants (ou un scalaire commun).
+        """
+        contexte = multiprocessing.get_context()
+        nb_neurones = len(self.population)
+        memoire_indices = shared_memory.SharedMemory(create=True, size=max(1, nb_neurones) * 8)
+        memoire_comptes = shared_memory.SharedMemory(create=True, size=len(self.bornes) * 8)
+        barriere = contexte.Barrier(len(self.bornes))
+        resultats = contexte.Queue()
+        processus = []
+        try:
+            for indice, (debut, fin) in enumerate(self.bornes):
+                tranche = PopulationLIF(
+                    fin - debut, **{champ: self.population[champ][debut:fin] for champ in PopulationLIF._champs_reels}
+                )
+                processus.append(contexte.Process(
+                    target=_partition,
+                    args=(
+                        indice, debut, fin, self.bornes, tranche, self.synapses.colonnes(debut, fin),
+                        copy.deepcopy(self.noyau), self.update_strategy, nb_iterations, dt,
+                        get_current_inputs_callback, (memoire_indices.name, memoire_comptes.name), barriere, resultats,
+                    ),
+                ))
+            for p in processus:
+                p.start()
+
+            spikes = EnregistrementSpikes(nb_neurones, dt)
+            erreurs: list[BaseException] = []
+            for _ in processus:
+                indice, resultat = self._attendre_resultat(resultats, processus, barriere)
+                if isinstance(resultat, BaseException):
+                    erreurs.append(resultat)
+                    continue
+                neurones, pas, donnees, spike = resultat
+                debut, fin = self.bornes[indice]
+                self.population._donnees[:, debut:fin] = donnees
+                self.population["spike"][debut:fin] = spike
+                spikes.ajouter_spikes(neurones, pas)
+            for p in processus:
+                p.join()
+            if erreurs:
+                raise RuntimeError("Échec d'une partition du réseau distribué.") from erreurs[0]
+        finally:
+            for p in processus:
+                if p.is_alive():
+                    p.terminate()
+            memoire_indices.close()
+            memoire_indices.unlink()
+            memoire_comptes.close()
+            memoire_comptes.unlink()
+        spikes.nb_pas = nb_iterations
+        return spikes
+
+    @staticmethod
+    def _attendre_resultat(
+        resultats: multiprocessing.Queue, processus: list[multiprocessing.Process], barriere: Barrier
+    ) -> tuple[int, object]:
+        """
+        Résultat suivant d'une partition. Un processus mort sans avoir rendu son
+        résultat (tué, plantage de l'interpréteur) bloquerait les autres sur la
+        barrière et ce ``get`` indéfiniment : la barrière est alors rompue et
+        l'échec signalé.
+        """
+        while True:
+            try:
+                return resultats.get(timeout=_PERIODE_SURVEILLANCE)
+            except queue.Empty:
+                morts = [p for p in processus if not p.is_alive() and p.exitcode != 0]
+                if morts:
+                    barriere.abort()
+                    raise RuntimeError(
+                        f"Une partition du réseau distribué s'est arrêtée (code de sortie {morts[0].exitcode})."
+                    )
@@ -0,0 +1,122 @@
+import os
+from pathlib import Path
+from typing import Any, Protocol, Sequence, Union, runtime_checkable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .etat_neurone import EtatNeurone
+from .neurone import Neurone
+
+FORMAT_SAUVEGARDE: int = 1
+
+# État d'un objet : tableaux, scalaires ou chaînes, éventuellement imbriqués
+Etat = dict[str, Any]
+
+
+@runtime_checkable
+class Sauvegardable(Protocol):
+    """
+    Objet dont l'état dynamique peut être sauvegardé puis restauré sans rejouer la simulation.
+
+    ``etat_sauvegarde`` peut renvoyer des vues sur l'état interne : elles ne
+    sont lues qu'au moment de l'écriture. ``restaurer_etat`` copie les valeurs
+    dans un objet construit avec la même configuration (tailles, paramètres).
+    """
+
+    def etat_sauvegarde(self) -> Etat: ...
+
+    def restaurer_etat(self, etat: Etat) -> None: ...
+
+
+def etat_de(objet: object) -> Etat:
+    if not isinstance(objet, Sauvegardable):
+        raise TypeError(f"L'état d'un objet {type(objet).__name__} ne peut pas être sauvegardé.")
+    return objet.etat_sauvegarde()
+
+
+def restaurer_dans(objet: object, etat: Etat) -> None:
+    if not isinstance(objet, Sauvegardable):
+        raise TypeError(f"L'état d'un objet {type(objet).__name__} ne peut pas être restauré.")
+    objet.restaurer_etat(etat)
+
+
+def etat_neurones(neurones: Sequence[Neurone]) -> Etat:
+    """État d'une liste de neurones individuels, regroupé en une colonne par champ."""
+    etats = [neurone._etat for neurone in neurones]
+    return {
+        champ: np.fromiter((etat[champ] for etat in etats), dtype=bool if champ == "spike" else np.float64, count=len(etats))
+        for champ in EtatNeurone._fields
+    }
+
+
+def restaurer_neurones(neurones: Sequence[Neurone], etat: Etat) -> None:
+    if len(etat["U"]) != len(neurones):
+        raise ValueError(f"L'état sauvegardé contient {len(etat['U'])} neurones, {len(neurones)} attendus.")
+    colonnes = {champ: etat[champ].tolist() for champ in EtatNeurone._fields}
+    for i, neurone in enumerate(neurones):
+        for champ, valeurs in colonnes.items():
+            neurone._etat[champ] = valeurs[i]
+
+
+def _aplatir(etat: Etat, prefixe: str, resultat: dict[str, NDArray]) -> None:
+    for cle, valeur in etat.items():
+        if "/" in cle:
+            raise ValueError(f"Clé d'état invalide : '{cle}'.")
+        nom = f"{prefixe}{cle}"
+        if isinstance(valeur, dict):
+            _aplatir(valeur, f"{nom}/", resultat)
+        elif valeur is not None:
+            resultat[nom] = np.asarray(valeur)
+
+
+def _deplier(tableaux: dict[str, NDArray]) -> Etat:
+    etat: Etat = {}
+    for nom, tableau in tableaux.items():
+        *parents, cle = nom.split("/")
+        noeud = etat
+        for parent in parents:
+            noeud = noeud.setdefault(parent, {})
+        # Les scalaires redeviennent des objets Python
+        noeud[cle] = tableau.item() if tableau.ndim == 0 else tableau
+    return etat
+
+
+def sauvegarder(objet: object, chemin: Union[str, os.PathLike]) -> None:
+    """
+    Écrit l'état de ``objet`` dans le fichier ``chemin`` (format ``.npz`` non compressé).
+
+    Chaque tableau est écrit d'un bloc. Le fichier est d'abord écrit à côté,
+    puis renommé : une interruption pendant l'écriture laisse intacte la
+    sauvegarde précédente, et une erreur ne laisse pas de fichier partiel.
+    """
+    chemin = Path(chemin)
+    tableaux: dict[str, NDArray] = {}
+    _aplatir({"format": FORMAT_SAUVEGARDE, "classe": type(objet).__name__, "etat": etat_de(objet)}, "", tableaux)
+    temporaire = chemin.with_name(chemin.name + ".tmp")
+    try:
+        with open(temporaire, "wb") as fichier:
+            np.savez(fichier, **tableaux)
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        os.replace(temporaire, chemin)
+    except BaseException:
+        temporaire.unlink(missing_ok=True)
+        raise
+
+
+def charger(chemin: Union[str, os.PathLike]) -> tuple[str, Etat]:
+    """(classe de l'objet sauvegardé, état) lus depuis une sauvegarde."""
+    with np.load(chemin, allow_pickle=False) as fichier:
+        contenu = _deplier({nom: fichier[nom] for nom in fichier.files})
+    if contenu.get("format") != FORMAT_SAUVEGARDE:
+        raise ValueError(f"Format de sauvegarde non pris en charge : {contenu.get('format')}.")
+    return contenu["classe"], contenu.get("etat", {})
+
+
+def restaurer(objet: object, chemin: Union[str, os.PathLike]) -> None:
+    """Restaure dans ``objet`` l'état sauvegardé par ``sauvegarder``."""
+    classe, etat = charger(chemin)
+    if classe != type(objet).__name__:
+        raise ValueError(f"La sauvegarde contient un {classe}, pas un {type(objet).__name__}.")
+    restaurer_dans(objet, etat)
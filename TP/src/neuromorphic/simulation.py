@@ -1,16 +1,39 @@
 from abc import ABC, abstractmethod
 import copy
-from typing import Callable, Protocol, Sequence
+from typing import Callable, NamedTuple, Optional, Protocol, Sequence, Union
 from typing_extensions import override
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from .neurone import Neurone
-from .etat_neurone import SerieEtatsNeurone
+from .etat_neurone import EtatNeurone, SerieEtatsNeurone, TableEtats, lier_etats
+from .enregistrement import Enregistrement, EnregistrementColonnes, _colonne, terminer_enregistrement
 from .neurone_update_strategy import NeuroneUpdateStrategy
+from .population import PopulationLIF
+from .sauvegarde import Etat, Sauvegardable, etat_de, restaurer_dans
+from .stimuli import Stimulus, fonction_courants
 from enum import Enum
 
 
+def _etat_courants(courants: Callable) -> Etat:
+    """État de la source de courants (lecteur de ``Stimulus``) ; une simple fonction du temps n'en a pas."""
+    return courants.etat_sauvegarde() if isinstance(courants, Sauvegardable) else {}
+
+
+def _restaurer_courants(courants: Callable, etat: Etat) -> None:
+    if isinstance(courants, Sauvegardable):
+        courants.restaurer_etat(etat)
+
+
 class SimulationEventType(Enum):
+    """
+    Événements d'une simulation. NEURONE_SPIKE porte une copie de l'``EtatNeurone``
+    du neurone émetteur et n'est émis que par ``SimulationNeurones`` ; SPIKES
+    porte un ``LotSpikes`` et est émis par toutes les simulations.
+    """
     NEURONE_SPIKE = "neurone_spike"
+    SPIKES = "spikes"
     INIT = "init"
     RUN_START = "start"
     UPDATE = "update"
@@ -18,15 +41,44 @@ class SimulationEventType(Enum):
     RESET = "reset"
 
 
+class LotSpikes(NamedTuple):
+    """
+    Données de l'événement SPIKES : tous les spikes d'un pas en une seule notification.
+
+    ``etat`` ne contient que les champs demandés par les abonnés ; pour une
+    population ce sont des vues sur son état, valables jusqu'au pas suivant.
+    """
+    iteration: int
+    t: float
+    indices: NDArray[np.intp]
+    etat: dict[str, NDArray]
+
+
 class Subscriber(Protocol):
+    """
+    Un abonné peut aussi définir ``evenements`` (les types d'événements qu'il
+    traite, utilisés par ``Publisher.abonner``) et ``champs`` (les champs d'état
+    qu'il lit dans les notifications SPIKES). Les deux sont facultatifs.
+    """
+
     def update(self, event_type: SimulationEventType, context, data) -> None:
         ...
 
 class Publisher(ABC):
     def __init__(self):
-        self._subscribers: dict[SimulationEventType, set[Subscriber]] = {
-            event_type: set() for event_type in SimulationEventType
+        # Tuples reconstruits à chaque (dés)abonnement : notify les parcourt sans copie ni hachage
+        self._subscribers: dict[SimulationEventType, tuple[Subscriber, ...]] = {
+            event_type: () for event_type in SimulationEventType
         }
+        self._champs: dict[SimulationEventType, tuple[str, ...]] = {
+            event_type: () for event_type in SimulationEventType
+        }
+
+    def _mettre_a_jour_champs(self, event_type: SimulationEventType) -> None:
+        champs: dict[str, None] = {}
+        for subscriber in self._subscribers[event_type]:
+            champs.update(dict.fromkeys(getattr(subscriber, "champs", ())))
+        self._champs[event_type] = tuple(champs)
 
     def subscribe(self, event_type: SimulationEventType, subscriber: Subscriber) -> None:
         """
@@ -34,9 +86,10 @@ class Publisher(ABC):
 
         :param subscriber: The subscriber to add.
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = set()
-        self._subscribers[event_type].add(subscriber)
+        subscribers = self._subscribers.get(event_type, ())
+        if subscriber not in subscribers:
+            self._subscribers[event_type] = subscribers + (subscriber,)
+            self._mettre_a_jour_champs(event_type)
 
     def unsubscribe(self, event_type: SimulationEventType, subscriber: Subscriber) -> None:
         """
@@ -45,7 +98,24 @@ class Publisher(ABC):
         :param subscriber: The subscriber to remove.
         """
         if event_type in self._subscribers:
-            self._subscribers[event_type].discard(subscriber)
+            self._subscribers[event_type] = tuple(s for s in self._subscribers[event_type] if s is not subscriber)
+            self._mettre_a_jour_champs(event_type)
+
+    def abonner(self, subscriber: Subscriber) -> None:
+        """
+        Abonne ``subscriber`` à chaque type d'événement de ``subscriber.evenements``
+        (à tous s'il n'en déclare aucun).
+        """
+        for event_type in getattr(subscriber, "evenements", SimulationEventType):
+            self.subscribe(event_type, subscriber)
+
+    def a_des_abonnes(self, event_type: SimulationEventType) -> bool:
+        """Indique si ``event_type`` a des abonnés : sinon le moteur ne construit pas ses données."""
+        return bool(self._subscribers.get(event_type))
+
+    def champs_demandes(self, event_type: SimulationEventType) -> tuple[str, ...]:
+        """Union des champs d'état déclarés par les abonnés de ``event_type``."""
+        return self._champs.get(event_type, ())
 
     def notify(self, event_type: SimulationEventType, data=None) -> None:
         """
@@ -53,7 +123,7 @@ class Publisher(ABC):
 
         :param data: The data to notify subscribers with.
         """
-        for subscriber in self._subscribers.get(event_type, []):
+        for subscriber in self._subscribers.get(event_type, ()):
             subscriber.update(event_type, self, data)
 
 class Simulation(Publisher):
@@ -73,7 +143,7 @@ class Simulation(Publisher):
         ...
 
     @abstractmethod
-    def init(self, nb_iterations:int, delta_t:float, get_current_inputs_callback: Callable[[float], list[float]]) -> None:...
+    def init(self, nb_iterations:int, delta_t:float, get_current_inputs_callback: Union[Stimulus, Callable[[float], list[float]]]) -> None:...
 
     @abstractmethod
     def run(self) -> None:...
@@ -88,15 +158,24 @@ class SimulationNeurones(Simulation):
     def __init__(
         self,
         neurones: Sequence[Neurone],
-        update_strategies: Sequence[NeuroneUpdateStrategy]
+        update_strategies: Sequence[NeuroneUpdateStrategy],
+        enregistrement: Optional[Enregistrement] = None,
     ) -> None:
+        """
+        Sans ``enregistrement``, l'état complet de chaque neurone est conservé dans
+        ``donnees`` ; sinon seul l'enregistrement fourni est alimenté à chaque pas.
+        """
         super().__init__()
-        self._neurones_initiaux: list[Neurone] = [copy.copy(neurone) for neurone in neurones]
+        self._enregistrement: Optional[Enregistrement] = enregistrement
         self._update_strategies: list[NeuroneUpdateStrategy] = [
             copy.copy(update_strategy) for update_strategy in update_strategies
         ]
 
-        self._neurones_run: list[Neurone] = []
+        # Les neurones simulés sont copiés une fois ; leurs états sont des vues
+        # sur un tableau commun, remis à l'état initial par une seule copie
+        self._neurones_run: list[Neurone] = [copy.deepcopy(neurone) for neurone in neurones]
+        self._etats: TableEtats = lier_etats([neurone._etat for neurone in self._neurones_run])
+        self._etats_initiaux: NDArray[np.uint8] = self._etats.memoire.copy()
         self._donnees_neurones: list[SerieEtatsNeurone] = []
         self._get_current_inputs: Callable[[float], list[float]]
         self._delta_t: float
@@ -104,12 +183,18 @@ class SimulationNeurones(Simulation):
         self._iteration: int
 
     def _set_initial_values(self, nb_iterations:int, delta_t:float, get_current_inputs: Callable[[float], list[float]]) -> None:
-        self._neurones_run = copy.deepcopy(self._neurones_initiaux)
-        self._donnees_neurones = [
-            SerieEtatsNeurone(steps=nb_iterations, type_elems=float)
-            for _ in range(len(self._neurones_run))
-        ]
-        self._get_current_inputs = get_current_inputs
+        np.copyto(self._etats.memoire, self._etats_initiaux)
+        if self._enregistrement is None:
+            # Les séries sont gardées d'un reset à l'autre tant que le nombre d'itérations
+            # ne change pas : elles sont réécrites pas à pas depuis l'itération 0
+            if not self._donnees_neurones or len(self._donnees_neurones[0].etats) != nb_iterations:
+                self._donnees_neurones = [
+                    SerieEtatsNeurone(steps=nb_iterations, type_elems=float)
+                    for _ in range(len(self._neurones_run))
+                ]
+        else:
+            self._enregistrement.reset()
+        self._get_current_inputs = fonction_courants(get_current_inputs, delta_t)
         self._delta_t = delta_t
         self._nb_iterations = nb_iterations
         self._iteration = 0
@@ -121,13 +206,22 @@ class SimulationNeurones(Simulation):
     @property
     def donnees(self) -> list[SerieEtatsNeurone]:
         return self._donnees_neurones
+
+    @property
+    def enregistrement(self) -> Optional[Enregistrement]:
+        return self._enregistrement
     
     @property
     def iteration(self) -> int:
         return self._iteration
 
+    @property
+    def temps(self) -> float:
+        """Instant du pas en cours."""
+        return self._iteration * self._delta_t
+
     @override
-    def init(self, nb_iterations:int, delta_t:float, get_current_inputs_callback: Callable[[float], list[float]]) -> None:
+    def init(self, nb_iterations:int, delta_t:float, get_current_inputs_callback: Union[Stimulus, Callable[[float], list[float]]]) -> None:
         self._set_initial_values(nb_iterations, delta_t, get_current_inputs_callback)
         self.notify(SimulationEventType.INIT, self._donnees_neurones)
 
@@ -135,9 +229,10 @@ class SimulationNeurones(Simulation):
     def run(self) -> None:
 
         self.notify(SimulationEventType.RUN_START)
-        for i in range(self._nb_iterations):
+        for i in range(self._iteration, self._nb_iterations):
             self.update()
-        
+
+        terminer_enregistrement(self._enregistrement)
         self.notify(SimulationEventType.RUN_END)
 
     @override
@@ -147,6 +242,9 @@ class SimulationNeurones(Simulation):
         
         t = self._iteration * self._delta_t
         current_inputs = self._get_current_inputs(t)
+        # Les copies d'état ne sont faites que si quelqu'un écoute les spikes individuels
+        notifier_spikes: bool = self.a_des_abonnes(SimulationEventType.NEURONE_SPIKE)
+        spikes: list[int] = []
 
         for i, neurone in enumerate(self._neurones_run):
             # Update neuron state and check if it spikes
@@ -154,12 +252,25 @@ class SimulationNeurones(Simulation):
                 neurone, self._delta_t, current_inputs[i]
             )
 
-            self._donnees_neurones[i].set( 
-                self._iteration, (neurone.etat, t)
-            )
+            if self._enregistrement is None:
+                self._donnees_neurones[i].set(
+                    self._iteration, (neurone._etat, t)
+                )
 
             if spiked:
-                self.notify(SimulationEventType.NEURONE_SPIKE, neurone.etat)
+                spikes.append(i)
+                if notifier_spikes:
+                    self.notify(SimulationEventType.NEURONE_SPIKE, neurone.etat)
+
+        if self._enregistrement is not None:
+            self._enregistrement.ajouter(self._neurones_run, t)
+
+        if spikes and self.a_des_abonnes(SimulationEventType.SPIKES):
+            etat = {
+                champ: _colonne(self._neurones_run, champ)
+                for champ in self.champs_demandes(SimulationEventType.SPIKES)
+            }
+            self.notify(SimulationEventType.SPIKES, LotSpikes(self._iteration, t, np.array(spikes, dtype=np.intp), etat))
 
         self.notify(SimulationEventType.UPDATE)
 
@@ -173,3 +284,160 @@ class SimulationNeurones(Simulation):
         self._set_initial_values(self._nb_iterations, self._delta_t, self._get_current_inputs)
 
         self.notify(SimulationEventType.RESET)
+
+    def instantane(self) -> NDArray[np.uint8]:
+        """Copie de l'état de tous les neurones, en un seul tampon contigu."""
+        return self._etats.memoire.copy()
+
+    def restaurer_instantane(self, instantane: NDArray[np.uint8]) -> None:
+        if instantane.shape != self._etats.memoire.shape:
+            raise ValueError("L'instantané ne correspond pas aux neurones de la simulation.")
+        np.copyto(self._etats.memoire, instantane)
+
+    def etat_sauvegarde(self) -> Etat:
+        etat: Etat = {
+            "iteration": self._iteration,
+            "nb_iterations": self._nb_iterations,
+            "delta_t": self._delta_t,
+            "neurones": {champ: self._etats.colonne(champ) for champ in EtatNeurone._fields},
+            "courants": _etat_courants(self._get_current_inputs),
+        }
+        if self._enregistrement is None:
+            if self._donnees_neurones:
+                # Une colonne (N x pas) par champ : spike est déjà booléen, les réels sont ramenés en float64
+                series = np.stack([serie.etats for serie in self._donnees_neurones])
+                etat["donnees"] = {
+                    champ: series[champ] if champ == "spike" else series[champ].astype(np.float64)
+                    for champ in SerieEtatsNeurone._fields
+                }
+        else:
+            etat["enregistrement"] = etat_de(self._enregistrement)
+        return etat
+
+    def restaurer_etat(self, etat: Etat) -> None:
+        """
+        Reprend la simulation à l'itération sauvegardée ; elle doit avoir été
+        initialisée (``init``) avec la même source de courants.
+        """
+        self._set_initial_values(int(etat["nb_iterations"]), float(etat["delta_t"]), self._get_current_inputs)
+        for champ in EtatNeurone._fields:
+            self._etats.colonne(champ)[...] = etat["neurones"][champ]
+        if self._enregistrement is None:
+            for champ, colonne in etat.get("donnees", {}).items():
+                for serie, valeurs in zip(self._donnees_neurones, colonne):
+                    serie.etats[champ] = valeurs
+        else:
+            restaurer_dans(self._enregistrement, etat["enregistrement"])
+        _restaurer_courants(self._get_current_inputs, etat.get("courants", {}))
+        self._iteration = int(etat["iteration"])
+
+
+class SimulationPopulation(Publisher):
+    """
+    Simulation d'une ``PopulationLIF`` : un seul pas vectorisé et une seule
+    écriture dans l'enregistrement par itération. Les spikes sont notifiés
+    par lot (SPIKES), jamais neurone par neurone.
+    """
+
+    def __init__(
+        self,
+        population: PopulationLIF,
+        update_strategy: NeuroneUpdateStrategy,
+        enregistrement: Optional[Enregistrement] = None,
+    ) -> None:
+        super().__init__()
+        self._population: PopulationLIF = population
+        self._update_strategy: NeuroneUpdateStrategy = update_strategy
+        self._enregistrement: Enregistrement = (
+            enregistrement if enregistrement is not None else EnregistrementColonnes(champs=("t", "U", "spike"))
+        )
+        self._get_current_inputs: Callable[[float], ArrayLike]
+        self._delta_t: float
+        self._nb_iterations: int
+        self._iteration: int
+
+    def _set_initial_values(self, nb_iterations: int, delta_t: float, get_current_inputs: Callable[[float], ArrayLike]) -> None:
+        self._population.reset()
+        self._enregistrement.reset()
+        self._get_current_inputs = fonction_courants(get_current_inputs, delta_t)
+        self._delta_t = delta_t
+        self._nb_iterations = nb_iterations
+        self._iteration = 0
+
+    @property
+    def population(self) -> PopulationLIF:
+        return self._population
+
+    @property
+    def enregistrement(self) -> Enregistrement:
+        return self._enregistrement
+
+    @property
+    def iteration(self) -> int:
+        return self._iteration
+
+    @property
+    def temps(self) -> float:
+        """Instant du pas en cours."""
+        return self._iteration * self._delta_t
+
+    def init(
+        self, nb_iterations: int, delta_t: float, get_current_inputs_callback: Union[Stimulus, Callable[[float], ArrayLike]]
+    ) -> None:
+        """Les courants viennent d'une fonction du temps ou d'un ``Stimulus``, lu par blocs."""
+        self._set_initial_values(nb_iterations, delta_t, get_current_inputs_callback)
+        self.notify(SimulationEventType.INIT, self._population)
+
+    def run(self) -> None:
+        self.notify(SimulationEventType.RUN_START)
+        for _ in range(self._iteration, self._nb_iterations):
+            self.update()
+
+        terminer_enregistrement(self._enregistrement)
+        self.notify(SimulationEventType.RUN_END)
+
+    def update(self) -> None:
+        if self._iteration >= self._nb_iterations:
+            raise RuntimeError("Simulation has already ended.")
+
+        t = self._iteration * self._delta_t
+        spikes = self._update_strategy.update(self._population, self._delta_t, self._get_current_inputs(t))
+
+        self._enregistrement.ajouter(self._population, t)
+
+        if self.a_des_abonnes(SimulationEventType.SPIKES) and spikes.any():
+            etat = {champ: self._population[champ] for champ in self.champs_demandes(SimulationEventType.SPIKES)}
+            self.notify(SimulationEventType.SPIKES, LotSpikes(self._iteration, t, np.flatnonzero(spikes), etat))
+
+        self.notify(SimulationEventType.UPDATE)
+
+        self._iteration += 1
+
+    def reset(self) -> None:
+        """
+        Reset the simulation.
+        """
+        self._set_initial_values(self._nb_iterations, self._delta_t, self._get_current_inputs)
+
+        self.notify(SimulationEventType.RESET)
+
+    def etat_sauvegarde(self) -> Etat:
+        return {
+            "iteration": self._iteration,
+            "nb_iterations": self._nb_iterations,
+            "delta_t": self._delta_t,
+            "population": self._population.etat_sauvegarde(),
+            "enregistrement": etat_de(self._enregistrement),
+            "courants": _etat_courants(self._get_current_inputs),
+        }
+
+    def restaurer_etat(self, etat: Etat) -> None:
+        """
+        Reprend la simulation à l'itération sauvegardée ; elle doit avoir été
+        initialisée (``init``) avec la même source de courants.
+        """
+        self._set_initial_values(int(etat["nb_iterations"]), float(etat["delta_t"]), self._get_current_inputs)
+        self._population.restaurer_etat(etat["population"])
+        restaurer_dans(self._enregistrement, etat["enregistrement"])
+        _restaurer_courants(self._get_current_inputs, etat.get("courants", {}))
+        self._iteration = int(etat["iteration"])
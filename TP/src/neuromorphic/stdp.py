@@ -0,0 +1,234 @@
+import math
+from typing import Callable, Optional, Protocol, Union, runtime_checkable
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .sauvegarde import Etat, etat_de, restaurer_dans
+from .synapses import MatriceSynaptiqueCSR
+
+# Indexation des poids touchés : positions dans une CSR, ou couples (pre, post) en dense
+Cles = Union[NDArray[np.intp], tuple[NDArray[np.intp], NDArray[np.intp]]]
+
+
+@runtime_checkable
+class RegleSTDP(Protocol):
+    """
+    Règle de plasticité : variation des poids des synapses (pre[k] -> post[k])
+    touchées par un spike, calculée à partir de l'état interne de la règle
+    (traces ou instants des derniers spikes), mis à jour par ``avancer``.
+    """
+
+    def preparer(self, dt: float, nb_pre: int, nb_post: int) -> None: ...
+
+    def sur_spike_pre(self, pre: NDArray[np.intp], post: NDArray[np.intp]) -> NDArray[np.float64]:
+        """Variation des synapses dont le neurone présynaptique vient d'émettre un spike."""
+        ...
+
+    def sur_spike_post(self, pre: NDArray[np.intp], post: NDArray[np.intp]) -> NDArray[np.float64]:
+        """Variation des synapses dont le neurone postsynaptique vient d'émettre un spike."""
+        ...
+
+    def avancer(self, spikes_pre: NDArray[np.bool_], spikes_post: NDArray[np.bool_]) -> None: ...
+
+
+class RegleTraces:
+    """
+    STDP classique à traces d'éligibilité exponentielles.
+
+    Chaque neurone présynaptique (resp. postsynaptique) a une trace qui décroît
+    avec la constante ``tau_plus`` (resp. ``tau_moins``) et augmente de 1 à
+    chacun de ses spikes. Un spike post renforce ses synapses de
+    ``A_plus * trace_pre``, un spike pré les affaiblit de ``A_moins * trace_post``.
+    """
+
+    def __init__(self, A_plus: float = 0.01, A_moins: float = 0.012, tau_plus: float = 20.0, tau_moins: float = 20.0) -> None:
+        self.A_plus: float = A_plus
+        self.A_moins: float = A_moins
+        self.tau_plus: float = tau_plus
+        self.tau_moins: float = tau_moins
+        self.trace_pre: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self.trace_post: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._decroissances: tuple[float, float] = (1.0, 1.0)
+
+    def preparer(self, dt: float, nb_pre: int, nb_post: int) -> None:
+        if self.trace_pre.size != nb_pre:
+            self.trace_pre = np.zeros(nb_pre, dtype=np.float64)
+        if self.trace_post.size != nb_post:
+            self.trace_post = np.zeros(nb_post, dtype=np.float64)
+        self._decroissances = (math.exp(-dt / self.tau_plus), math.exp(-dt / self.tau_moins))
+
+    def etat_sauvegarde(self) -> dict[str, NDArray[np.float64]]:
+        return {"trace_pre": self.trace_pre, "trace_post": self.trace_post}
+
+    def restaurer_etat(self, etat: dict[str, NDArray[np.float64]]) -> None:
+        self.trace_pre = np.array(etat["trace_pre"], dtype=np.float64)
+        self.trace_post = np.array(etat["trace_post"], dtype=np.float64)
+
+    def sur_spike_pre(self, pre: NDArray[np.intp], post: NDArray[np.intp]) -> NDArray[np.float64]:
+        return -self.A_moins * self.trace_post[post]
+
+    def sur_spike_post(self, pre: NDArray[np.intp], post: NDArray[np.intp]) -> NDArray[np.float64]:
+        return self.A_plus * self.trace_pre[pre]
+
+    def avancer(self, spikes_pre: NDArray[np.bool_], spikes_post: NDArray[np.bool_]) -> None:
+        self.trace_pre *= self._decroissances[0]
+        self.trace_pre[spikes_pre] += 1.0
+        self.trace_post *= self._decroissances[1]
+        self.trace_post[spikes_post] += 1.0
+
+
+def W_vectorisee(deltaT: NDArray[np.float64], theta: float) -> NDArray[np.float64]:
+    """Version vectorisée de ``lif_stdp.W``."""
+    return -deltaT * np.exp(-deltaT * deltaT) * theta / 10
+
+
+class RegleFonction:
+    """
+    STDP définie par une fenêtre ``fonction(deltaT)``, avec ``deltaT = t_pre - t_post``
+    entre un spike et le dernier spike de l'autre neurone de la synapse.
+
+    Seuls les instants des derniers spikes sont conservés (appariement au plus
+    proche voisin) ; ``fonction`` doit accepter des tableaux. Par défaut, la
+    fenêtre est la règle ``W`` de ``lif_stdp``.
+    """
+
+    def __init__(self, fonction: Optional[Callable[[NDArray[np.float64]], NDArray[np.float64]]] = None, theta: float = 1.0) -> None:
+        self.fonction: Callable[[NDArray[np.float64]], NDArray[np.float64]] = (
+            fonction if fonction is not None else lambda deltaT: W_vectorisee(deltaT, theta)
+        )
+        self.t: float = 0.0
+        self.dt: float = 0.0
+        self.derniers_spikes_pre: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self.derniers_spikes_post: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+
+    def preparer(self, dt: float, nb_pre: int, nb_post: int) -> None:
+        if self.derniers_spikes_pre.size != nb_pre:
+            self.derniers_spikes_pre = np.full(nb_pre, np.nan, dtype=np.float64)
+        if self.derniers_spikes_post.size != nb_post:
+            self.derniers_spikes_post = np.full(nb_post, np.nan, dtype=np.float64)
+        self.dt = dt
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        return {"t": self.t, "derniers_spikes_pre": self.derniers_spikes_pre, "derniers_spikes_post": self.derniers_spikes_post}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        self.t = float(etat["t"])
+        self.derniers_spikes_pre = np.array(etat["derniers_spikes_pre"], dtype=np.float64)
+        self.derniers_spikes_post = np.array(etat["derniers_spikes_post"], dtype=np.float64)
+
+    def _fenetre(self, deltaT: NDArray[np.float64]) -> NDArray[np.float64]:
+        # Sans spike antérieur de l'autre neurone (NaN), pas de variation
+        variations = np.asarray(self.fonction(np.nan_to_num(deltaT)), dtype=np.float64)
+        return np.where(np.isnan(deltaT), 0.0, variations)
+
+    def sur_spike_pre(self, pre: NDArray[np.intp], post: NDArray[np.intp]) -> NDArray[np.float64]:
+        return self._fenetre(self.t - self.derniers_spikes_post[post])
+
+    def sur_spike_post(self, pre: NDArray[np.intp], post: NDArray[np.intp]) -> NDArray[np.float64]:
+        return self._fenetre(self.derniers_spikes_pre[pre] - self.t)
+
+    def avancer(self, spikes_pre: NDArray[np.bool_], spikes_post: NDArray[np.bool_]) -> None:
+        self.derniers_spikes_pre[spikes_pre] = self.t
+        self.derniers_spikes_post[spikes_post] = self.t
+        self.t += self.dt
+
+
+class PlasticiteSTDP:
+    """
+    Apprentissage en ligne des poids d'une matrice dense (pre x post) ou d'une
+    ``MatriceSynaptiqueCSR``.
+
+    À chaque pas, seules les synapses issues des neurones présynaptiques ayant
+    émis un spike, ou arrivant sur les neurones postsynaptiques ayant émis un
+    spike, sont modifiées puis bornées à [poids_min, poids_max] : le coût est
+    proportionnel au nombre de synapses touchées, plus O(N) pour l'état de la règle.
+
+    En dense, les synapses sont les entrées non nulles de ``masque`` ; par
+    défaut, ce sont les poids non nuls à la construction (une synapse ramenée
+    à 0 par la suite reste plastique). ``toutes_paires`` rend plastiques tous
+    les couples (pre, post), y compris ceux de poids nul et la diagonale.
+    """
+
+    def __init__(
+        self,
+        poids: Union[NDArray[np.float64], MatriceSynaptiqueCSR],
+        regle: Optional[RegleSTDP] = None,
+        poids_min: float = 0.0,
+        poids_max: float = 1.0,
+        masque: Optional[ArrayLike] = None,
+        toutes_paires: bool = False,
+    ) -> None:
+        if masque is not None and toutes_paires:
+            raise ValueError("masque et toutes_paires sont incompatibles.")
+        self.poids: Union[NDArray[np.float64], MatriceSynaptiqueCSR] = poids
+        self.regle: RegleSTDP = regle if regle is not None else RegleTraces()
+        self.poids_min: float = poids_min
+        self.poids_max: float = poids_max
+        self.masque: Optional[NDArray[np.bool_]] = None
+        if masque is not None:
+            self.masque = np.asarray(masque, dtype=bool)
+        elif not toutes_paires and not isinstance(poids, MatriceSynaptiqueCSR):
+            self.masque = poids != 0
+        if isinstance(poids, MatriceSynaptiqueCSR):
+            self.forme: tuple[int, int] = (poids.nb_neurones, poids.nb_cibles)
+        else:
+            self.forme = poids.shape
+
+    def etat_sauvegarde(self) -> Etat:
+        poids = etat_de(self.poids) if isinstance(self.poids, MatriceSynaptiqueCSR) else self.poids
+        return {"poids": poids, "regle": etat_de(self.regle)}
+
+    def restaurer_etat(self, etat: Etat) -> None:
+        if isinstance(self.poids, MatriceSynaptiqueCSR):
+            self.poids.restaurer_etat(etat["poids"])
+        else:
+            np.copyto(self.poids, etat["poids"])
+        restaurer_dans(self.regle, etat.get("regle", {}))
+
+    def _synapses_sortantes(self, sources: NDArray[np.intp]) -> tuple[Cles, NDArray[np.intp], NDArray[np.intp]]:
+        """(clés, pre, post) des synapses issues de ``sources`` ; les clés indexent les poids (positions CSR ou couples (pre, post))."""
+        if isinstance(self.poids, MatriceSynaptiqueCSR):
+            positions, nb_par_source = self.poids.positions(sources)
+            return positions, np.repeat(sources, nb_par_source), self.poids.indices[positions]
+        pre = np.repeat(sources, self.forme[1])
+        post = np.tile(np.arange(self.forme[1]), sources.size)
+        return self._filtrer(pre, post)
+
+    def _synapses_entrantes(self, cibles: NDArray[np.intp]) -> tuple[Cles, NDArray[np.intp], NDArray[np.intp]]:
+        if isinstance(self.poids, MatriceSynaptiqueCSR):
+            positions, pre, nb_par_cible = self.poids.positions_entrantes(cibles)
+            return positions, pre, np.repeat(cibles, nb_par_cible)
+        pre = np.tile(np.arange(self.forme[0]), cibles.size)
+        post = np.repeat(cibles, self.forme[0])
+        return self._filtrer(pre, post)
+
+    def _filtrer(self, pre: NDArray[np.intp], post: NDArray[np.intp]) -> tuple[Cles, NDArray[np.intp], NDArray[np.intp]]:
+        if self.masque is not None:
+            garder = self.masque[pre, post]
+            pre, post = pre[garder], post[garder]
+        return (pre, post), pre, post
+
+    def _appliquer(self, cles: Cles, variations: NDArray[np.float64]) -> None:
+        valeurs = self.poids.poids if isinstance(self.poids, MatriceSynaptiqueCSR) else self.poids
+        # Une synapse apparaît au plus une fois par événement : l'indexation avancée suffit
+        valeurs[cles] = np.clip(valeurs[cles] + variations, self.poids_min, self.poids_max)
+
+    def update(self, dt: float, spikes_pre: NDArray[np.bool_], spikes_post: Optional[NDArray[np.bool_]] = None) -> None:
+        """
+        Applique un pas d'apprentissage. Pour un réseau récurrent, ``spikes_post``
+        vaut ``spikes_pre`` (valeur par défaut).
+        """
+        spikes_post = spikes_pre if spikes_post is None else spikes_post
+        self.regle.preparer(dt, *self.forme)
+
+        sources = np.flatnonzero(spikes_pre)
+        if sources.size > 0:
+            cles, pre, post = self._synapses_sortantes(sources)
+            self._appliquer(cles, self.regle.sur_spike_pre(pre, post))
+        cibles = np.flatnonzero(spikes_post)
+        if cibles.size > 0:
+            cles, pre, post = self._synapses_entrantes(cibles)
+            self._appliquer(cles, self.regle.sur_spike_post(pre, post))
+
+        self.regle.avancer(spikes_pre, spikes_post)
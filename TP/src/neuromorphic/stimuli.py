@@ -0,0 +1,283 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .lif_stdp import var_gaussienne
+
+
+class Stimulus(ABC):
+    """
+    Courants d'entrée de N neurones, produits par blocs (pas x N) vectorisés.
+
+    Un stimulus ne dépend que de l'indice de pas et de dt : la matrice complète
+    (pas x N) n'est jamais matérialisée, on en lit des blocs successifs.
+    """
+
+    def __init__(self, nb_neurones: int) -> None:
+        self.nb_neurones: int = nb_neurones
+
+    @abstractmethod
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        """Courants des pas [debut, debut + nb_pas), de forme (nb_pas, N)."""
+        ...
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        """État interne entre deux blocs ; vide pour un stimulus qui ne dépend que du pas."""
+        return {}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        pass
+
+    def _temps(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        """Instants des pas du bloc, en colonne (nb_pas, 1) pour la diffusion sur les neurones."""
+        return (np.arange(debut, debut + nb_pas, dtype=np.float64) * dt)[:, None]
+
+    def blocs(self, nb_iterations: int, dt: float, taille_bloc: int = 1024) -> Iterator[NDArray[np.float64]]:
+        """Générateur des blocs successifs couvrant ``nb_iterations`` pas."""
+        for debut in range(0, nb_iterations, taille_bloc):
+            yield self.bloc(debut, min(taille_bloc, nb_iterations - debut), dt)
+
+    def matrice(self, nb_iterations: int, dt: float) -> NDArray[np.float64]:
+        """Matrice complète (nb_iterations, N), à réserver aux simulations courtes."""
+        return self.bloc(0, nb_iterations, dt)
+
+    def lecteur(self, dt: float, taille_bloc: int = 1024) -> "LecteurStimulus":
+        return LecteurStimulus(self, dt, taille_bloc)
+
+    def __add__(self, autre: "Stimulus") -> "SommeStimuli":
+        return SommeStimuli(self, autre)
+
+
+class StimulusConstant(Stimulus):
+    def __init__(self, nb_neurones: int, valeur: ArrayLike = 0.0) -> None:
+        super().__init__(nb_neurones)
+        self.valeur: NDArray[np.float64] = np.broadcast_to(np.asarray(valeur, dtype=np.float64), (nb_neurones,))
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        return np.tile(self.valeur, (nb_pas, 1))
+
+
+class StimulusEchelon(Stimulus):
+    """``amplitude`` entre les instants ``debut`` (inclus) et ``fin`` (exclu), ``base`` ailleurs."""
+
+    def __init__(
+        self, nb_neurones: int, amplitude: ArrayLike, debut: float = 0.0, fin: float = np.inf, base: ArrayLike = 0.0
+    ) -> None:
+        super().__init__(nb_neurones)
+        self.amplitude: NDArray[np.float64] = np.asarray(amplitude, dtype=np.float64)
+        self.base: NDArray[np.float64] = np.asarray(base, dtype=np.float64)
+        self.debut: float = debut
+        self.fin: float = fin
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        t = self._temps(debut, nb_pas, dt)
+        actif = (t >= self.debut) & (t < self.fin)
+        return np.broadcast_to(np.where(actif, self.amplitude, self.base), (nb_pas, self.nb_neurones)).copy()
+
+
+class StimulusRampe(Stimulus):
+    """Variation linéaire de ``valeur_initiale`` à ``valeur_finale`` entre ``debut`` et ``fin``, constante hors de l'intervalle."""
+
+    def __init__(
+        self, nb_neurones: int, valeur_initiale: ArrayLike, valeur_finale: ArrayLike, debut: float, fin: float
+    ) -> None:
+        if fin <= debut:
+            raise ValueError("La fin de la rampe doit être postérieure à son début.")
+        super().__init__(nb_neurones)
+        self.valeur_initiale: NDArray[np.float64] = np.asarray(valeur_initiale, dtype=np.float64)
+        self.valeur_finale: NDArray[np.float64] = np.asarray(valeur_finale, dtype=np.float64)
+        self.debut: float = debut
+        self.fin: float = fin
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        fraction = np.clip((self._temps(debut, nb_pas, dt) - self.debut) / (self.fin - self.debut), 0.0, 1.0)
+        valeurs = self.valeur_initiale + fraction * (self.valeur_finale - self.valeur_initiale)
+        return np.broadcast_to(valeurs, (nb_pas, self.nb_neurones)).copy()
+
+
+class StimulusSinusoidal(Stimulus):
+    """``decalage + amplitude * sin(2π frequence t + phase)``, paramètres diffusables par neurone."""
+
+    def __init__(
+        self, nb_neurones: int, amplitude: ArrayLike, frequence: ArrayLike, phase: ArrayLike = 0.0, decalage: ArrayLike = 0.0
+    ) -> None:
+        super().__init__(nb_neurones)
+        self.amplitude: NDArray[np.float64] = np.asarray(amplitude, dtype=np.float64)
+        self.pulsation: NDArray[np.float64] = 2 * np.pi * np.asarray(frequence, dtype=np.float64)
+        self.phase: NDArray[np.float64] = np.asarray(phase, dtype=np.float64)
+        self.decalage: NDArray[np.float64] = np.asarray(decalage, dtype=np.float64)
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        valeurs = self.decalage + self.amplitude * np.sin(self.pulsation * self._temps(debut, nb_pas, dt) + self.phase)
+        return np.broadcast_to(valeurs, (nb_pas, self.nb_neurones)).copy()
+
+
+class StimulusPoisson(Stimulus):
+    """
+    Impulsions de hauteur ``amplitude`` émises par un processus de Poisson de
+    fréquence ``frequence`` par neurone (probabilité frequence * dt par pas).
+
+    Les tirages sont consommés dans l'ordre des pas : les blocs doivent être lus
+    successivement à partir du pas 0, qui réinitialise le générateur. Le
+    résultat ne dépend pas de la taille des blocs.
+    """
+
+    def __init__(self, nb_neurones: int, frequence: ArrayLike, amplitude: ArrayLike = 1.0, graine: Optional[int] = None) -> None:
+        super().__init__(nb_neurones)
+        self.frequence: NDArray[np.float64] = np.broadcast_to(np.asarray(frequence, dtype=np.float64), (nb_neurones,))
+        self.amplitude: NDArray[np.float64] = np.asarray(amplitude, dtype=np.float64)
+        self.graine: np.random.SeedSequence = np.random.SeedSequence(graine)
+        self._generateur: np.random.Generator = np.random.default_rng(self.graine)
+        self._prochain_pas: int = 0
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        if debut == 0:
+            self._generateur = np.random.default_rng(self.graine)
+        elif debut != self._prochain_pas:
+            raise ValueError(f"Bloc non consécutif : pas {self._prochain_pas} attendu, {debut} demandé.")
+        self._prochain_pas = debut + nb_pas
+        tirages = self._generateur.random((nb_pas, self.nb_neurones))
+        return np.where(tirages < self.frequence * dt, self.amplitude, 0.0)
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        return {"generateur": json.dumps(self._generateur.bit_generator.state), "prochain_pas": self._prochain_pas}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        self._generateur.bit_generator.state = json.loads(str(etat["generateur"]))
+        self._prochain_pas = int(etat["prochain_pas"])
+
+
+class StimulusGaussien(Stimulus):
+    """
+    Codage de population : chaque neurone a une position et reçoit
+    ``exp(-(position - centre)² / variance)``, le centre parcourant
+    ``nb_centres`` positions espacées de ``espacement`` et changeant toutes les
+    ``periode`` unités de temps.
+
+    Les valeurs par défaut reproduisent la fonction ``entree`` de ``lif_stdp``.
+    """
+
+    def __init__(
+        self,
+        nb_neurones: int,
+        positions: Optional[ArrayLike] = None,
+        variance: float = var_gaussienne,
+        periode: float = 10.0,
+        premier_centre: float = 2.0,
+        espacement: float = 3.0,
+        nb_centres: int = 3,
+    ) -> None:
+        super().__init__(nb_neurones)
+        self.positions: NDArray[np.float64] = (
+            np.arange(nb_neurones, dtype=np.float64) if positions is None else np.asarray(positions, dtype=np.float64)
+        )
+        self.variance: float = variance
+        self.periode: float = periode
+        self.premier_centre: float = premier_centre
+        self.espacement: float = espacement
+        self.nb_centres: int = nb_centres
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        # Comme ``entree`` : le temps est tronqué à l'entier avant le calcul du centre
+        rang = (np.trunc(self._temps(debut, nb_pas, dt)) // self.periode) % self.nb_centres
+        distances = self.positions - (self.premier_centre + self.espacement * rang)
+        return np.exp(-distances * distances / self.variance)
+
+
+class StimulusTableau(Stimulus):
+    """
+    Courants lus dans un tableau (pas x N) existant, par exemple un ``np.memmap``.
+
+    Au-delà de la dernière ligne, le tableau est rejoué depuis le début si
+    ``boucler`` est vrai, sinon les courants sont nuls.
+    """
+
+    def __init__(self, valeurs: NDArray, boucler: bool = False) -> None:
+        if valeurs.ndim != 2:
+            raise ValueError("Le tableau des courants doit être de forme (pas, N).")
+        super().__init__(valeurs.shape[1])
+        self.valeurs: NDArray = valeurs
+        self.boucler: bool = boucler
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        nb_lignes = self.valeurs.shape[0]
+        if self.boucler and nb_lignes > 0:
+            return np.asarray(self.valeurs.take(np.arange(debut, debut + nb_pas) % nb_lignes, axis=0), dtype=np.float64)
+        resultat = np.zeros((nb_pas, self.nb_neurones), dtype=np.float64)
+        lues = max(0, min(nb_pas, nb_lignes - debut))
+        resultat[:lues] = self.valeurs[debut:debut + lues]
+        return resultat
+
+
+class StimulusFichier(StimulusTableau):
+    """Courants (pas x N) d'un fichier ``.npy``, projeté en mémoire et lu bloc par bloc."""
+
+    def __init__(self, chemin: Union[str, os.PathLike], boucler: bool = False) -> None:
+        self.chemin: Union[str, os.PathLike] = chemin
+        super().__init__(np.load(chemin, mmap_mode="r"), boucler)
+
+
+class SommeStimuli(Stimulus):
+    def __init__(self, *stimuli: Stimulus) -> None:
+        if len({stimulus.nb_neurones for stimulus in stimuli}) != 1:
+            raise ValueError("Les stimuli sommés doivent avoir le même nombre de neurones.")
+        super().__init__(stimuli[0].nb_neurones)
+        self.stimuli: tuple[Stimulus, ...] = stimuli
+
+    def bloc(self, debut: int, nb_pas: int, dt: float) -> NDArray[np.float64]:
+        resultat = self.stimuli[0].bloc(debut, nb_pas, dt)
+        for stimulus in self.stimuli[1:]:
+            resultat += stimulus.bloc(debut, nb_pas, dt)
+        return resultat
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        return {str(i): stimulus.etat_sauvegarde() for i, stimulus in enumerate(self.stimuli)}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        for i, stimulus in enumerate(self.stimuli):
+            stimulus.restaurer_etat(etat.get(str(i), {}))
+
+
+class LecteurStimulus:
+    """
+    Adaptateur d'un ``Stimulus`` en ``get_current_inputs_callback(t)`` : un bloc
+    est calculé tous les ``taille_bloc`` pas et chaque appel n'en renvoie
+    qu'une ligne (une vue, sans copie).
+    """
+
+    def __init__(self, stimulus: Stimulus, dt: float, taille_bloc: int = 1024) -> None:
+        self.stimulus: Stimulus = stimulus
+        self.dt: float = dt
+        self.taille_bloc: int = taille_bloc
+        self._debut: int = 0
+        self._bloc: NDArray[np.float64] = np.empty((0, stimulus.nb_neurones), dtype=np.float64)
+
+    def __call__(self, t: float) -> NDArray[np.float64]:
+        pas = int(round(t / self.dt))
+        while not self._debut <= pas < self._debut + len(self._bloc):
+            # Les blocs sont lus dans l'ordre ; revenir en arrière (reset) relit depuis le pas 0
+            self._debut = 0 if pas < self._debut else self._debut + len(self._bloc)
+            self._bloc = self.stimulus.bloc(self._debut, self.taille_bloc, self.dt)
+        return self._bloc[pas - self._debut]
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        """Bloc en cours et état du stimulus après ce bloc : la lecture reprend sans recalculer les blocs précédents."""
+        return {"debut": self._debut, "bloc": self._bloc, "stimulus": self.stimulus.etat_sauvegarde()}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        self._debut = int(etat["debut"])
+        self._bloc = np.array(etat["bloc"], dtype=np.float64).reshape(-1, self.stimulus.nb_neurones)
+        self.stimulus.restaurer_etat(etat.get("stimulus", {}))
+
+
+def fonction_courants(
+    source: Union[Stimulus, Callable[[float], ArrayLike]], dt: float, taille_bloc: int = 1024
+) -> Callable[[float], ArrayLike]:
+    """Callback des courants d'une simulation : un ``Stimulus`` est lu par blocs, une fonction est gardée telle quelle."""
+    if isinstance(source, Stimulus):
+        return LecteurStimulus(source, dt, taille_bloc)
+    return source
@@ -0,0 +1,255 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing_extensions import Self
+
+
+class MatriceSynaptiqueCSR:
+    """
+    Matrice des poids synaptiques au format CSR (compressed sparse row).
+
+    Les synapses du neurone présynaptique ``i`` occupent les positions
+    ``indptr[i]:indptr[i+1]`` des tableaux ``indices`` (neurones cibles) et
+    ``poids``. La mémoire est en O(nombre de synapses) et la propagation ne
+    parcourt que les lignes des neurones actifs. Par défaut la matrice est
+    carrée ; ``nb_cibles`` permet de n'en garder qu'un bloc de colonnes.
+
+    ``delais`` donne, si besoin, le retard de chaque synapse en nombre entier
+    de pas de temps, dans le même ordre que ``poids``.
+    """
+
+    def __init__(
+        self,
+        nb_neurones: int,
+        indptr: NDArray[np.intp],
+        indices: NDArray[np.intp],
+        poids: NDArray[np.float64],
+        nb_cibles: Optional[int] = None,
+        delais: Optional[NDArray[np.intp]] = None,
+    ) -> None:
+        if indptr.shape != (nb_neurones + 1,):
+            raise ValueError(f"indptr doit être de taille {nb_neurones + 1}.")
+        if indices.shape != poids.shape or indices.size != indptr[-1]:
+            raise ValueError("indices et poids doivent contenir indptr[-1] éléments.")
+        if delais is not None and (delais.shape != poids.shape or np.any(delais < 0)):
+            raise ValueError("delais doit contenir un retard positif ou nul par synapse.")
+        self.nb_neurones: int = nb_neurones
+        self.nb_cibles: int = nb_neurones if nb_cibles is None else nb_cibles
+        self.indptr: NDArray[np.intp] = indptr
+        self.indices: NDArray[np.intp] = indices
+        self.poids: NDArray[np.float64] = poids
+        self.delais: Optional[NDArray[np.intp]] = delais
+        # Index par cible (ordre des synapses triées par cible, leurs sources et décalages), construit à la demande
+        self._ordre_cibles: Optional[NDArray[np.intp]] = None
+        self._sources_cibles: Optional[NDArray[np.intp]] = None
+        self._indptr_cibles: Optional[NDArray[np.intp]] = None
+
+    @classmethod
+    def depuis_tableaux(
+        cls,
+        nb_neurones: int,
+        sources: ArrayLike,
+        cibles: ArrayLike,
+        poids: ArrayLike,
+        nb_cibles: Optional[int] = None,
+        delais: Optional[ArrayLike] = None,
+    ) -> Self:
+        """Construit la matrice à partir de triplets (source, cible, poids), et des retards (en pas) de chaque synapse."""
+        sources = np.asarray(sources, dtype=np.intp)
+        cibles = np.asarray(cibles, dtype=np.intp)
+        poids = np.asarray(poids, dtype=np.float64)
+        ordre = np.argsort(sources, kind="stable")
+        indptr = np.zeros(nb_neurones + 1, dtype=np.intp)
+        np.cumsum(np.bincount(sources, minlength=nb_neurones), out=indptr[1:])
+        if delais is not None:
+            delais = np.broadcast_to(np.asarray(delais, dtype=np.intp), poids.shape)[ordre]
+        return cls(nb_neurones, indptr, cibles[ordre], poids[ordre], nb_cibles, delais)
+
+    @classmethod
+    def depuis_connectivite(
+        cls,
+        connectivite: Dict[int, Dict[int, float]],
+        nb_neurones: int,
+        delais: Optional[Dict[int, Dict[int, int]]] = None,
+    ) -> Self:
+        """
+        Construit la matrice à partir du dictionnaire ``{source: {cible: poids}}`` de ``Reseau``.
+
+        ``delais`` a la même forme et donne le retard en pas des synapses ; les synapses absentes sont sans retard.
+        """
+        sources: List[int] = []
+        cibles: List[int] = []
+        poids: List[float] = []
+        retards: List[int] = []
+        for i, connexions in connectivite.items():
+            delais_source = delais.get(i, {}) if delais is not None else {}
+            for j, w in connexions.items():
+                sources.append(i)
+                cibles.append(j)
+                poids.append(w)
+                retards.append(delais_source.get(j, 0))
+        return cls.depuis_tableaux(nb_neurones, sources, cibles, poids, delais=retards if delais is not None else None)
+
+    @property
+    def nb_synapses(self) -> int:
+        return self.indices.size
+
+    @property
+    def retard_max(self) -> int:
+        """Plus grand retard d'une synapse, en pas (0 sans retards)."""
+        return int(self.delais.max()) if self.delais is not None and self.delais.size > 0 else 0
+
+    def etat_sauvegarde(self) -> dict[str, Optional[NDArray]]:
+        return {"indptr": self.indptr, "indices": self.indices, "poids": self.poids, "delais": self.delais}
+
+    def restaurer_etat(self, etat: dict[str, NDArray]) -> None:
+        """Restaure les poids, et la structure si elle a changé (l'index par cible est alors invalidé)."""
+        if etat["indptr"].shape != self.indptr.shape:
+            raise ValueError(f"La matrice sauvegardée a {etat['indptr'].size - 1} neurones, {self.nb_neurones} attendus.")
+        delais = etat.get("delais")
+        self.delais = None if delais is None else np.asarray(delais, dtype=np.intp)
+        if np.array_equal(etat["indptr"], self.indptr) and np.array_equal(etat["indices"], self.indices):
+            np.copyto(self.poids, etat["poids"])
+            return
+        self.indptr = np.asarray(etat["indptr"], dtype=np.intp)
+        self.indices = np.asarray(etat["indices"], dtype=np.intp)
+        self.poids = np.asarray(etat["poids"], dtype=np.float64)
+        self._ordre_cibles = self._sources_cibles = self._indptr_cibles = None
+
+    def cibles(self, source: int) -> NDArray[np.intp]:
+        """Neurones postsynaptiques du neurone ``source``."""
+        return self.indices[self.indptr[source]:self.indptr[source + 1]]
+
+    @staticmethod
+    def _segments(indptr: NDArray[np.intp], lignes: NDArray[np.intp]) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """Concaténation des intervalles ``indptr[l]:indptr[l+1]`` des ``lignes``, et leurs longueurs."""
+        debuts = indptr[lignes]
+        longueurs = indptr[lignes + 1] - debuts
+        total = int(longueurs.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.intp), longueurs
+        # Décalage de chaque ligne par rapport à sa place dans le tableau concaténé
+        decalages = debuts - (np.cumsum(longueurs) - longueurs)
+        return np.repeat(decalages, longueurs) + np.arange(total), longueurs
+
+    def positions(self, sources: NDArray[np.intp]) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """
+        Positions dans ``indices``/``poids`` des synapses issues de ``sources``.
+
+        Returns:
+            tuple: (positions concaténées, nombre de synapses par source)
+        """
+        return self._segments(self.indptr, sources)
+
+    def positions_entrantes(self, cibles: NDArray[np.intp]) -> tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.intp]]:
+        """
+        Positions dans ``indices``/``poids`` des synapses arrivant sur ``cibles``.
+
+        Un index par cible est construit au premier appel ; il reste valide tant
+        que seuls les poids changent.
+
+        Returns:
+            tuple: (positions concaténées, neurone source de chacune, nombre de synapses par cible)
+        """
+        if self._ordre_cibles is None or self._sources_cibles is None or self._indptr_cibles is None:
+            self._ordre_cibles = np.argsort(self.indices, kind="stable")
+            self._sources_cibles = np.repeat(np.arange(self.nb_neurones), np.diff(self.indptr))[self._ordre_cibles]
+            self._indptr_cibles = np.zeros(self.nb_cibles + 1, dtype=np.intp)
+            np.cumsum(np.bincount(self.indices, minlength=self.nb_cibles), out=self._indptr_cibles[1:])
+        rangs, nb_par_cible = self._segments(self._indptr_cibles, cibles)
+        return self._ordre_cibles[rangs], self._sources_cibles[rangs], nb_par_cible
+
+    def propager(self, sources: NDArray[np.intp], valeurs: ArrayLike) -> NDArray[np.float64]:
+        """
+        Somme ``valeurs[k] * poids[sources[k], j]`` pour chaque neurone cible j.
+
+        Le coût est proportionnel au nombre de synapses des neurones ``sources``.
+        """
+        positions, nb_par_source = self.positions(sources)
+        if positions.size == 0:
+            return np.zeros(self.nb_cibles, dtype=np.float64)
+        contributions = self.poids[positions] * np.repeat(valeurs, nb_par_source)
+        return np.bincount(self.indices[positions], weights=contributions, minlength=self.nb_cibles)
+
+    def propager_retarde(self, sources: NDArray[np.intp], valeurs: ArrayLike, file: "FileRetards") -> NDArray[np.float64]:
+        """
+        Comme ``propager``, mais chaque contribution est déposée dans ``file``
+        pour être livrée après le retard de sa synapse ; retourne les courants
+        qui arrivent à ce pas (une vue sur ``file``).
+        """
+        if self.delais is None:
+            raise ValueError("La matrice n'a pas de retards.")
+        positions, nb_par_source = self.positions(sources)
+        if positions.size > 0:
+            contributions = self.poids[positions] * np.repeat(valeurs, nb_par_source)
+            file.deposer(self.indices[positions], self.delais[positions], contributions)
+        return file.courants()
+
+    def dense(self) -> NDArray[np.float64]:
+        """Matrice dense (N, nb_cibles) équivalente, en O(N²) mémoire."""
+        dense = np.zeros((self.nb_neurones, self.nb_cibles), dtype=np.float64)
+        sources = np.repeat(np.arange(self.nb_neurones), np.diff(self.indptr))
+        np.add.at(dense, (sources, self.indices), self.poids)
+        return dense
+
+    def colonnes(self, debut: int, fin: int) -> Self:
+        """Sous-matrice des synapses dont la cible est dans [debut, fin), cibles renumérotées à partir de 0."""
+        sources = np.repeat(np.arange(self.nb_neurones), np.diff(self.indptr))
+        garder = (self.indices >= debut) & (self.indices < fin)
+        return type(self).depuis_tableaux(
+            self.nb_neurones, sources[garder], self.indices[garder] - debut, self.poids[garder], nb_cibles=fin - debut,
+            delais=self.delais[garder] if self.delais is not None else None,
+        )
+
+    def vers_connectivite(self) -> Dict[int, Dict[int, float]]:
+        """Dictionnaire ``{source: {cible: poids}}`` équivalent."""
+        return {
+            i: dict(zip(self.cibles(i).tolist(), self.poids[self.indptr[i]:self.indptr[i + 1]].tolist()))
+            for i in range(self.nb_neurones)
+            if self.indptr[i + 1] > self.indptr[i]
+        }
+
+
+class FileRetards:
+    """
+    Courants synaptiques en attente, dans un tampon circulaire de
+    ``retard_max + 1`` lignes de ``nb_cibles`` valeurs.
+
+    Une contribution de retard ``d`` déposée au pas ``n`` est ajoutée à la
+    ligne ``(n + d) mod (retard_max + 1)``, lue puis remise à zéro au pas
+    ``n + d`` : un dépôt coûte O(synapses actives), sans file d'événements
+    ni allocation par spike.
+    """
+
+    def __init__(self, nb_cibles: int, retard_max: int) -> None:
+        self.tampon: NDArray[np.float64] = np.zeros((retard_max + 1, nb_cibles), dtype=np.float64)
+        self.position: int = 0
+
+    @property
+    def retard_max(self) -> int:
+        return self.tampon.shape[0] - 1
+
+    def deposer(self, cibles: NDArray[np.intp], delais: NDArray[np.intp], contributions: NDArray[np.float64]) -> None:
+        """Ajoute ``contributions[k]`` au courant que recevra ``cibles[k]`` dans ``delais[k]`` pas."""
+        lignes = delais + self.position
+        lignes %= self.tampon.shape[0]
+        lignes *= self.tampon.shape[1]
+        lignes += cibles
+        np.add.at(self.tampon.reshape(-1), lignes, contributions)
+
+    def courants(self) -> NDArray[np.float64]:
+        """Courants arrivant au pas en cours (vue, valide jusqu'à ``avancer``)."""
+        return self.tampon[self.position]
+
+    def avancer(self) -> None:
+        """Vide la ligne du pas en cours et passe au pas suivant."""
+        self.tampon[self.position] = 0.0
+        self.position = (self.position + 1) % self.tampon.shape[0]
+
+    def etat_sauvegarde(self) -> dict[str, object]:
+        return {"tampon": self.tampon, "position": self.position}
+
+    def restaurer_etat(self, etat: dict[str, object]) -> None:
+        self.tampon = np.array(etat["tampon"], dtype=np.float64)
+        self.position = int(etat["position"])
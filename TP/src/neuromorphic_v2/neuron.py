@@ -1,21 +1,125 @@
-from dataclasses import dataclass, replace
+import math
 from enum import Enum
+from typing import Optional
+
+from typing_extensions import Self
+
+from neuromorphic.etat_neurone import INDICES_CHAMPS, TableEtats, _memoire_propre, derivee_lif
+
+_U0, _U, _THETA, _R, _C, _I, _SECONDES = (
+    INDICES_CHAMPS[champ] for champ in ("U0", "U", "theta", "R", "C", "I_ext", "secondes_depuis_spike")
+)
+
+
+def _champ(indice: int) -> property:
+    def lire(self: "DonneesNeurone") -> float:
+        return self._reels[self._i + indice * self._n]
+
+    def ecrire(self: "DonneesNeurone", valeur: float) -> None:
+        self._reels[self._i + indice * self._n] = valeur
+
+    return property(lire, ecrire)
+
 
-@dataclass
 class DonneesNeurone:
-    potentielMembranaireRepos: float
-    potentielMembranaire: float
-    seuilSpike: float
-    capacite: float
-    resistance: float
-    courantEntrant: float
-    secondesDepuisDernierSpike: float
-    spike: bool
+    """
+    Données d'un neurone, vue sur une colonne d'une ``TableEtats`` de v1 : les
+    processeurs v2, les neurones v1 et ``PopulationLIF`` partagent le même
+    stockage. Construites directement, elles portent leurs propres valeurs.
+    """
+
+    __slots__ = ("_reels", "_spikes", "_i", "_n")
+    _champs: tuple[str, ...] = (
+        "potentielMembranaireRepos", "potentielMembranaire", "seuilSpike", "capacite",
+        "resistance", "courantEntrant", "secondesDepuisDernierSpike", "spike",
+    )
+
+    def __init__(
+        self,
+        potentielMembranaireRepos: float,
+        potentielMembranaire: float,
+        seuilSpike: float,
+        capacite: float,
+        resistance: float,
+        courantEntrant: float,
+        secondesDepuisDernierSpike: Optional[float],
+        spike: bool,
+    ) -> None:
+        self._reels: memoryview
+        self._spikes: memoryview
+        self._reels, self._spikes = _memoire_propre((0.0,) * len(INDICES_CHAMPS), False)
+        self._i: int = 0
+        self._n: int = 1
+        for champ, valeur in zip(self._champs, (
+            potentielMembranaireRepos, potentielMembranaire, seuilSpike, capacite,
+            resistance, courantEntrant, secondesDepuisDernierSpike, spike,
+        )):
+            setattr(self, champ, valeur)
+
+    @classmethod
+    def vue(cls, table: TableEtats, indice: int) -> Self:
+        """Données du neurone ``indice`` de ``table``, sans copie."""
+        donnees = cls.__new__(cls)
+        donnees._reels = table.reels
+        donnees._spikes = table.spikes
+        donnees._i = indice
+        donnees._n = len(table)
+        return donnees
+
+    potentielMembranaireRepos = _champ(_U0)
+    potentielMembranaire = _champ(_U)
+    seuilSpike = _champ(_THETA)
+    capacite = _champ(_C)
+    resistance = _champ(_R)
+    courantEntrant = _champ(_I)
+
+    @property
+    def secondesDepuisDernierSpike(self) -> Optional[float]:
+        secondes = self._reels[self._i + _SECONDES * self._n]
+        return None if math.isnan(secondes) else secondes
+
+    @secondesDepuisDernierSpike.setter
+    def secondesDepuisDernierSpike(self, secondes: Optional[float]) -> None:
+        self._reels[self._i + _SECONDES * self._n] = math.nan if secondes is None else secondes
+
+    @property
+    def spike(self) -> bool:
+        return self._spikes[self._i]
+
+    @spike.setter
+    def spike(self, spike: bool) -> None:
+        self._spikes[self._i] = bool(spike)
+
+    def __copy__(self) -> Self:
+        copie = type(self).__new__(type(self))
+        copie._reels, copie._spikes = _memoire_propre(self._reels[self._i::self._n], self._spikes[self._i])
+        copie._i = 0
+        copie._n = 1
+        return copie
+
+    def __eq__(self, autre: object) -> bool:
+        if not isinstance(autre, DonneesNeurone):
+            return NotImplemented
+        return all(getattr(self, champ) == getattr(autre, champ) for champ in self._champs)
+
+    def __repr__(self) -> str:
+        return f"DonneesNeurone({', '.join(f'{champ}={getattr(self, champ)!r}' for champ in self._champs)})"
+
+def _spike(dn: DonneesNeurone) -> float:
+    """Émet le spike du neurone si son potentiel dépasse le seuil ; retourne le potentiel après réinitialisation."""
+    reels, i, n = dn._reels, dn._i, dn._n
+    U = reels[i + _U * n]
+    if U > reels[i + _THETA * n]:
+        dn._spikes[i] = True
+        reels[i + _SECONDES * n] = 0.0
+        U = reels[i + _U * n] = reels[i + _U0 * n]
+    return U
 
 class TypeTravailleur(Enum):
     PROCESSEUR_NEURONE = 0
 
 class ProcesseurNeuroneLIF:
+    __slots__ = ("dn", "deltaSeconde")
     dn: DonneesNeurone
     deltaSeconde: float
 
@@ -23,44 +127,36 @@ class ProcesseurNeuroneLIF:
         self.dn = dn
         self.deltaSeconde = deltaSeconde
         self.dn.spike = False
-        # TODO Faire en sorte que le nb de pico seconde ecoulé ne soit pas incrémenté une fois qu'on dépasse le seuil pour lequel il a de l'influence (se baser sur R * C (Tau))
         if self.dn.secondesDepuisDernierSpike is not None:
             self.dn.secondesDepuisDernierSpike += deltaSeconde
 
+    @staticmethod
     def deltaPotentiel(dn: DonneesNeurone) -> float:
-        tau = (dn.resistance * dn.capacite)
-        diffPotentiel = dn.potentielMembranaire - \
-            dn.potentielMembranaireRepos
-        delta = ((dn.resistance *
-                 dn.courantEntrant) - diffPotentiel) / tau
-        return delta
+        return derivee_lif(dn.potentielMembranaire, dn.potentielMembranaireRepos, dn.resistance, dn.capacite, dn.courantEntrant)
 
+    @staticmethod
     def processSpikeBehavior(dn: DonneesNeurone) -> None:
-        if dn.potentielMembranaire > dn.seuilSpike:
-            dn.spike = True
-            dn.secondesDepuisDernierSpike=0
-            dn.potentielMembranaire = dn.potentielMembranaireRepos
+        _spike(dn)
 
     def stepEuler(self) -> None:
-        ProcesseurNeuroneLIF.processSpikeBehavior(self.dn)
-
-        self.dn.potentielMembranaire += self.deltaSeconde * \
-            ProcesseurNeuroneLIF.deltaPotentiel(self.dn)
+        # Champs lus une fois dans des variables locales, sans passer par les propriétés
+        reels, i, n = self.dn._reels, self.dn._i, self.dn._n
+        U = _spike(self.dn)
+        reels[i + _U * n] = U + self.deltaSeconde * derivee_lif(
+            U, reels[i + _U0 * n], reels[i + _R * n], reels[i + _C * n], reels[i + _I * n]
+        )
 
     def stepRK4(self) -> None:
-        ProcesseurNeuroneLIF.processSpikeBehavior(self.dn)
-        tempNeuronData = replace(self.dn)
-        k1 = ProcesseurNeuroneLIF.deltaPotentiel(self.dn)
-        tempNeuronData.potentielMembranaire += (self.deltaSeconde * k1)/2
-        k2 = ProcesseurNeuroneLIF.deltaPotentiel(tempNeuronData)
-        tempNeuronData.potentielMembranaire = self.dn.potentielMembranaire + \
-            (self.deltaSeconde * k2)/2
-        k3 = ProcesseurNeuroneLIF.deltaPotentiel(tempNeuronData)
-        tempNeuronData.potentielMembranaire = self.dn.potentielMembranaire + \
-            (self.deltaSeconde * k3)
-        k4 = ProcesseurNeuroneLIF.deltaPotentiel(tempNeuronData)
-        self.dn.potentielMembranaire += (self.deltaSeconde / 6) * \
-            (k1 + 2*k2 + 2*k3 + k4)
+        # Les étapes intermédiaires ne changent que U : pas besoin de copier les données
+        reels, i, n = self.dn._reels, self.dn._i, self.dn._n
+        U = _spike(self.dn)
+        U0, R, C, I = reels[i + _U0 * n], reels[i + _R * n], reels[i + _C * n], reels[i + _I * n]
+        dt = self.deltaSeconde
+        k1 = derivee_lif(U, U0, R, C, I)
+        k2 = derivee_lif(U + (dt * k1)/2, U0, R, C, I)
+        k3 = derivee_lif(U + (dt * k2)/2, U0, R, C, I)
+        k4 = derivee_lif(U + (dt * k3), U0, R, C, I)
+        reels[i + _U * n] = U + (dt / 6) * (k1 + 2*k2 + 2*k3 + k4)
 
 
 
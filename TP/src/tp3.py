@@ -1,4 +1,4 @@
-from neuromorphic import Reseau, Neurone, LIF, DtypeEtat, entree
+from neuromorphic import Neurone, LIF, StimulusGaussien, SimulationNeurones, EulerUpdateStrategy, EnregistrementColonnes
 from numpy.typing import NDArray
 import numpy as np
 import matplotlib.pyplot as plt
@@ -24,57 +24,35 @@ def main() -> None :
         LIF(U0=U0, theta=theta, C=C, R=R) for _ in range(N)
     ]
 
-    TAU: float = R * C
-    def alpha(t: float) -> float:
-        if np.isnan(t):
-            return 0.0
-        return (t / TAU) * np.exp(1 - (t / TAU))
-    
-
-    reseau : Reseau = Reseau(
-        neurones, 
-        {i: {j: 0.0 for j in range(N//2, N)} for i in range(N//2)},
-        # fonction_alpha=alpha,
-        # update_strategy=RK4UpdateStrategy()
+    # Chaque pas enregistre le temps, les spikes, U et I_ext de tous les neurones, en colonnes
+    enregistrement : EnregistrementColonnes = EnregistrementColonnes(("t", "spike", "U", "I_ext"))
+    simulation : SimulationNeurones = SimulationNeurones(
+        neurones, [EulerUpdateStrategy() for _ in range(N)], enregistrement
     )
 
+    # Codage gaussien de l'entrée, calculé par blocs plutôt que neurone par neurone
+    stimulus = StimulusGaussien(N, positions=(np.arange(N) + 1) % 9)
+    simulation.init(steps, dt, stimulus)
+    simulation.run()
 
-    temps_spikes_neurones : list[list[float]] = [[] for _ in range(N)]
-
-    donnees_neurones : list[np.ndarray] = [np.empty(steps, dtype=DtypeEtat) for _ in range(N)]
-
-    for i in range(steps):
-        dt = temps[i] - (0.0 if i == 0 else temps[i-1])
-
-        courants_entrant = [
-            entree(temps[j], (j+1)%9)
-            for i in range(N)
-        ]
-
-        spikes = reseau.update(dt, courants_entrant)
-        for j, spike in enumerate(spikes):
-            donnees_neurones[j][i] = neurones[j].vecteur_etat
-            if spike:
-                temps_spikes_neurones[j].append(temps[i])
+    temps = enregistrement["t"]
+    spikes = enregistrement["spike"]
+    temps_spikes : list[NDArray[np.float64]] = [temps[spikes[:, j]] for j in range(N)]
 
     fig : Figure = plt.figure(figsize=(10, 10))
     axes : list[Axes] = fig.subplots(nrows=3, ncols=1, sharex=True)
 
-    temps_spikes = [np.array(temps_spikes_neurones[i]) for i in range(N)]
-
     # Spikes en fonction du temps
-    offsets = [i for i in range(0, len(temps_spikes_neurones))]
-    labels = ['N {}'.format(i+1) for i in range(len(temps_spikes_neurones))]
-    colors = ['C{}'.format(i) for i in range(len(temps_spikes_neurones))]
+    offsets = [i for i in range(0, len(temps_spikes))]
+    labels = ['N {}'.format(i+1) for i in range(len(temps_spikes))]
+    colors = ['C{}'.format(i) for i in range(len(temps_spikes))]
     axes[0].eventplot(temps_spikes, lineoffsets=offsets, colors=colors)
     axes[0].set_ylabel("Spikes")
     axes[0].set_yticks(offsets, labels)
     axes[0].yaxis.set_visible(False)
 
     # Potentiel membranaire en fonction du temps
-    U_values = np.array([donnees["U"] for donnees in donnees_neurones])
-    values_dict = {key: np.array([donnees[key] for donnees in donnees_neurones]) 
-                  for key in ["U", "I_ext"]}
+    values_dict = {key: enregistrement[key].T for key in ["U", "I_ext"]}
     
     U_values = values_dict["U"]
     axes[1].plot(temps, U_values.T)
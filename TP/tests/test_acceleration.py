@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from neuromorphic import acceleration
+from neuromorphic.acceleration import FusionneUpdateStrategy, _pas_lif
+from neuromorphic.population import PopulationLIF
+
+N, DT, NB_PAS = 50, 1e-3, 300
+METHODES = {"euler": "updateEuler", "rk4": "updateRK4", "exponentiel": "updateExponentiel"}
+
+
+def _population():
+    generateur = np.random.default_rng(0)
+    return PopulationLIF(N, theta=0.1, R=generateur.uniform(0.5, 2.0, N), C=generateur.uniform(0.005, 0.05, N))
+
+
+def _entrees():
+    generateur = np.random.default_rng(1)
+    return generateur.uniform(0.0, 0.3, (NB_PAS, N)), generateur.uniform(0.0, 0.02, (NB_PAS, N))
+
+
+def _trajectoire(pas):
+    population = _population()
+    potentiels, spikes = [], []
+    for I_ext, psps in zip(*_entrees()):
+        spikes.append(np.array(pas(population, I_ext, psps)))
+        potentiels.append(population["U"].copy())
+    return np.array(potentiels), np.array(spikes)
+
+
+def _reference(methode):
+    return _trajectoire(lambda population, I_ext, psps: getattr(population, METHODES[methode])(DT, I_ext, psps))
+
+
+def _comparer(trajectoire, reference):
+    assert reference[1].any()
+    np.testing.assert_array_equal(trajectoire[1], reference[1])
+    np.testing.assert_allclose(trajectoire[0], reference[0], rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("methode", METHODES)
+def test_noyau_compile_egal_a_la_population(methode):
+    pytest.importorskip("numba")
+    strategie = FusionneUpdateStrategy(methode)
+    _comparer(_trajectoire(lambda population, I_ext, psps: strategie.update(population, DT, I_ext, psps)), _reference(methode))
+
+
+@pytest.mark.parametrize("methode", METHODES)
+def test_noyau_python_egal_a_la_population(methode):
+    def pas(population, I_ext, psps):
+        population["I_ext"] = I_ext
+        decroissance = population._facteurs_decroissance(DT)
+        _pas_lif(
+            population["U0"], population["U"], population["theta"], population["R"], population["C"],
+            population["I_ext"], psps, population["spike"], decroissance, DT, acceleration.METHODES[methode],
+        )
+        return population["spike"]
+
+    _comparer(_trajectoire(pas), _reference(methode))
+
+
+@pytest.mark.parametrize("methode", METHODES)
+def test_repli_sans_numba_egal_a_la_population(methode, monkeypatch):
+    monkeypatch.setattr(acceleration, "_pas_lif_compile", None)
+    strategie = FusionneUpdateStrategy(methode)
+    _comparer(_trajectoire(lambda population, I_ext, psps: strategie.update(population, DT, I_ext, psps)), _reference(methode))
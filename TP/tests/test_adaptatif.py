@@ -0,0 +1,32 @@
+import math
+
+import numpy as np
+
+from neuromorphic.adaptatif import SimulationAdaptative
+from neuromorphic.population import PopulationLIF
+
+R, C, THETA, I = 1.0, 0.02, 0.5, 1.0
+# U(t) = R*I*(1 - exp(-t/tau)) depuis U0 = 0 : le seuil est atteint en t*, puis tous les t*
+PERIODE = -R * C * math.log(1 - THETA / (R * I))
+
+
+def _erreur_spikes(**tolerances):
+    simulation = SimulationAdaptative(PopulationLIF(1, R=R, C=C, theta=THETA), **tolerances)
+    simulation.init(0.1, 1e-3, lambda t: I)
+    simulation.run()
+    temps = simulation.temps_spikes(0)
+    assert temps.size == int(0.1 / PERIODE)
+    return float(np.max(np.abs(temps - PERIODE * np.arange(1, temps.size + 1))))
+
+
+def test_instants_de_spike_analytiques():
+    assert _erreur_spikes() < 1e-7
+
+
+def test_erreur_decroit_avec_la_tolerance():
+    erreurs = [
+        _erreur_spikes(tolerance_abs=tolerance, tolerance_rel=tolerance, resolution_spikes=1e-12)
+        for tolerance in (1e-3, 1e-5, 1e-7, 1e-9)
+    ]
+    assert all(fine < grossiere for grossiere, fine in zip(erreurs, erreurs[1:]))
+    assert erreurs[-1] < 1e-9
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from neuromorphic.backends import PopulationBackend, ReseauBackend
+from neuromorphic.neurone_update_strategy import RK4UpdateStrategy
+from neuromorphic.noyaux import NoyauAlphaExponentiel, NoyauExponentiel
+from neuromorphic.population import PopulationLIF
+from neuromorphic.reseau import Reseau
+from neuromorphic.synapses import MatriceSynaptiqueCSR
+
+N, DT, NB_PAS, TAU = 30, 1e-3, 300, 5e-3
+METHODES = {"euler": "updateEuler", "rk4": "updateRK4", "exponentiel": "updateExponentiel"}
+
+
+def _parametres():
+    generateur = np.random.default_rng(0)
+    return {"theta": 0.1, "R": generateur.uniform(0.5, 2.0, N), "C": generateur.uniform(0.005, 0.05, N)}
+
+
+def _courants():
+    return np.random.default_rng(1).uniform(0.0, 0.3, (NB_PAS, N))
+
+
+def _poids():
+    generateur = np.random.default_rng(2)
+    return np.where(generateur.random((N, N)) < 0.2, generateur.uniform(0.0, 0.05, (N, N)), 0.0)
+
+
+@pytest.mark.parametrize("methode", METHODES)
+def test_population_backend_numpy_egale_a_population_lif(methode):
+    backend = PopulationBackend(N, methode=methode, **_parametres())
+    population = PopulationLIF(N, **_parametres())
+    psps = np.random.default_rng(3).uniform(0.0, 0.02, (NB_PAS, N))
+    nb_spikes = 0
+    for I_ext, psp in zip(_courants(), psps):
+        spikes = getattr(population, METHODES[methode])(DT, I_ext, psp)
+        np.testing.assert_array_equal(backend.update(DT, I_ext, psp), spikes)
+        np.testing.assert_array_equal(backend["U"], population["U"])
+        nb_spikes += int(np.count_nonzero(spikes))
+    assert nb_spikes > 0
+
+
+def test_reseau_backend_numpy_egal_a_reseau():
+    poids = _poids()
+    backend = ReseauBackend(PopulationBackend(N, **_parametres()), poids, NoyauExponentiel(TAU))
+    reseau = Reseau(
+        PopulationLIF(N, **_parametres()), MatriceSynaptiqueCSR.depuis_tableaux(N, *np.nonzero(poids), poids[np.nonzero(poids)]),
+        NoyauExponentiel(TAU, epsilon=0.0), RK4UpdateStrategy(),
+    )
+    nb_spikes = 0
+    for I_ext in _courants():
+        spikes = reseau.update(DT, I_ext)
+        np.testing.assert_array_equal(backend.update(DT, I_ext), spikes)
+        np.testing.assert_allclose(backend.population["U"], reseau.neurones["U"], rtol=1e-12, atol=1e-15)
+        nb_spikes += int(np.count_nonzero(spikes))
+    assert nb_spikes > 0
+
+
+def test_reseau_backend_refuse_csr_et_autres_noyaux():
+    population = PopulationBackend(N)
+    poids = _poids()
+    with pytest.raises(TypeError, match="dense"):
+        ReseauBackend(population, MatriceSynaptiqueCSR.depuis_tableaux(N, [0], [1], [0.1]), TAU)
+    with pytest.raises(TypeError, match="NoyauAlphaExponentiel"):
+        ReseauBackend(population, poids, NoyauAlphaExponentiel(TAU))
+    with pytest.raises(TypeError, match="exponentiel"):
+        ReseauBackend(population, poids, lambda t: 1.0)
+    with pytest.raises(ValueError):
+        ReseauBackend(population, poids[:, :5], TAU)
+    assert ReseauBackend(population, poids, NoyauExponentiel(TAU)).tau == TAU
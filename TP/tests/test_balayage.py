@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from neuromorphic.balayage import BalayageParallele, grille
+from neuromorphic.lots import SimulationLots
+from neuromorphic.neurone_update_strategy import ExponentielUpdateStrategy
+
+
+def test_balayage_enregistre_t_sans_dimension_neurones():
+    configurations = grille(3, [ExponentielUpdateStrategy()], theta=[0.1, 0.2])
+    balayage = BalayageParallele(configurations, champs=("t", "U"), nb_processus=1)
+
+    resultats = balayage.run(10, 1e-3)
+
+    assert resultats["U"].shape == (2, 10, 3)
+    assert resultats["t"].shape == (2, 10)
+    assert balayage.resultat(1)["t"].shape == (10,)
+
+
+def test_lots_refuse_t():
+    with pytest.raises(ValueError):
+        SimulationLots(2, 3, ExponentielUpdateStrategy(), champs=("t", "U"))
@@ -0,0 +1,82 @@
+import threading
+
+import numpy as np
+
+from neuromorphic.dvs import CartePixels, FluxDVS, StimulusDVS, blocs_comptes, prelecture
+
+EVENEMENT = np.dtype([("t", np.int64), ("x", np.int16), ("y", np.int16), ("on", np.bool_)])
+
+
+def _evenements(*lignes):
+    return np.array(list(lignes), dtype=EVENEMENT)
+
+
+def test_blocs_comptes_binning_polarite_et_hors_champ():
+    carte = CartePixels(2, 2)
+    nb_neurones = carte.nb_entrees
+    paquets = [
+        _evenements((1000, 0, 0, True), (1400, 0, 0, True), (1999, 1, 0, False)),
+        _evenements((2000, 1, 1, True), (2500, 2, 5, True), (3100, 0, 1, False)),
+        _evenements(),
+        _evenements((5000, 1, 1, False)),
+    ]
+
+    blocs = list(blocs_comptes(paquets, carte, nb_neurones, duree_pas=1000, taille_bloc=3))
+
+    assert [bloc.shape for bloc in blocs] == [(3, nb_neurones), (2, nb_neurones)]
+    comptes = np.concatenate(blocs)
+    attendus = np.zeros((5, nb_neurones), dtype=np.int32)
+    attendus[0, 1] = 2  # (0, 0), polarité ON
+    attendus[0, 2] = 1  # (1, 0), polarité OFF
+    attendus[1, 7] = 1  # (1, 1), ON ; (2, 5) est hors du capteur
+    attendus[2, 4] = 1  # (0, 1), OFF
+    attendus[4, 6] = 1  # (1, 1), OFF
+    np.testing.assert_array_equal(comptes, attendus)
+
+
+def test_blocs_comptes_ignore_les_evenements_avant_t0():
+    carte = CartePixels(1, 1, polarites=False)
+    paquets = [_evenements((100, 0, 0, True), (900, 0, 0, True), (1400, 0, 0, True))]
+
+    (bloc,) = blocs_comptes(paquets, carte, 1, duree_pas=500, t0=800)
+
+    np.testing.assert_array_equal(bloc, [[1], [1]])
+
+
+class _FluxSynthetique(FluxDVS):
+    def __init__(self, paquets):
+        super().__init__("synthetique", nb_neurones=2, carte=CartePixels(1, 1), duree_pas=1000, taille_bloc=2)
+        self._paquets = paquets
+
+    def paquets(self):
+        yield from self._paquets
+
+
+def test_stimulus_dvs_arrete_la_lecture_precedente():
+    paquets = [_evenements(*[(1000 * i, 0, 0, i % 2 == 0) for i in range(100)])]
+    stimulus = StimulusDVS(_FluxSynthetique(paquets))
+    fils = threading.active_count()
+
+    premier = stimulus.bloc(0, 3, 1e-3)
+    assert threading.active_count() == fils + 1
+    np.testing.assert_array_equal(premier, [[0, 1], [1, 0], [0, 1]])
+    np.testing.assert_array_equal(stimulus.bloc(0, 3, 1e-3), premier)
+    assert threading.active_count() == fils + 1
+
+    stimulus.fermer()
+    assert threading.active_count() == fils
+
+
+def test_prelecture_ferme_sa_source():
+    fermee = threading.Event()
+
+    def source():
+        try:
+            yield from range(1000)
+        finally:
+            fermee.set()
+
+    lecture = prelecture(source(), taille_file=2)
+    assert next(lecture) == 0
+    lecture.close()
+    assert fermee.is_set()
@@ -0,0 +1,77 @@
+import numpy as np
+
+from neuromorphic import (
+    EnregistrementDisque, EnregistrementSpikes, EulerUpdateStrategy, PopulationLIF, ouvrir_enregistrement,
+)
+from neuromorphic.simulation import SimulationPopulation
+
+
+def test_disque_complet_en_fin_de_run(tmp_path) -> None:
+    enregistrement = EnregistrementDisque(tmp_path, ("U", "spike"), taille_bloc=64)
+    simulation = SimulationPopulation(PopulationLIF(5), EulerUpdateStrategy(), enregistrement)
+    simulation.init(100, 0.05, lambda t: np.full(5, 0.3))
+    simulation.run()
+
+    colonnes = ouvrir_enregistrement(tmp_path)
+    assert colonnes["U"].shape == (100, 5)
+    assert colonnes["spike"].shape == (100, 5)
+
+
+def test_disque_reprend_apres_fermeture(tmp_path) -> None:
+    with EnregistrementDisque(tmp_path, ("U",), taille_bloc=8) as enregistrement:
+        for _ in range(5):
+            enregistrement.ajouter(PopulationLIF(2))
+        enregistrement.fermer()
+        for _ in range(2):
+            enregistrement.ajouter(PopulationLIF(2))
+    assert ouvrir_enregistrement(tmp_path)["U"].shape == (7, 2)
+
+
+DT = 0.01
+
+
+def _spikes() -> EnregistrementSpikes:
+    # Neurone 0 : ISI de 3 et 6 pas ; 1 : un seul spike ; 2 : aucun ; 3 : ISI réguliers de 2 pas
+    spikes = EnregistrementSpikes(4, DT, capacite=2)
+    for pas, neurones in [(1, [3]), (2, [0]), (3, [3]), (5, [0, 3]), (7, [3, 1]), (11, [0])]:
+        spikes.ajouter_spikes(np.array(neurones), pas)
+    spikes.nb_pas = 20
+    return spikes
+
+
+def test_spikes_aer_index_par_neurone() -> None:
+    spikes = _spikes()
+
+    assert len(spikes) == 8
+    np.testing.assert_array_equal(spikes.neurones, [3, 0, 3, 0, 3, 3, 1, 0])
+    np.testing.assert_array_equal(spikes.pas_neurone(0), [2, 5, 11])
+    np.testing.assert_array_equal(spikes.pas_neurone(2), [])
+    np.testing.assert_allclose(spikes.temps_neurone(3), np.array([1, 3, 5, 7]) * DT)
+    assert [train.size for train in spikes.trains()] == [3, 1, 0, 4]
+
+    # L'index est reconstruit après un ajout
+    spikes.ajouter_spikes(np.array([2]), 12)
+    np.testing.assert_array_equal(spikes.pas_neurone(2), [12])
+
+
+def test_spikes_raster_et_taux() -> None:
+    spikes = _spikes()
+
+    temps, neurones = spikes.raster()
+    np.testing.assert_allclose(temps, np.array([1, 2, 3, 5, 5, 7, 7, 11]) * DT)
+    np.testing.assert_array_equal(neurones, spikes.neurones)
+    np.testing.assert_array_equal(spikes.nombre_spikes(), [3, 1, 0, 4])
+    np.testing.assert_allclose(spikes.taux_decharge(), np.array([3, 1, 0, 4]) / (20 * DT))
+
+
+def test_spikes_statistiques_isi() -> None:
+    spikes = _spikes()
+
+    isi, neurones = spikes.intervalles()
+    np.testing.assert_allclose(isi, np.array([3, 6, 2, 2, 2]) * DT)
+    np.testing.assert_array_equal(neurones, [0, 0, 3, 3, 3])
+
+    statistiques = spikes.statistiques_isi()
+    np.testing.assert_allclose(statistiques["moyenne"], [4.5 * DT, np.nan, np.nan, 2 * DT])
+    np.testing.assert_allclose(statistiques["ecart_type"], [1.5 * DT, np.nan, np.nan, 0.0], atol=1e-12)
+    np.testing.assert_allclose(statistiques["cv"], [1 / 3, np.nan, np.nan, 0.0], atol=1e-9)
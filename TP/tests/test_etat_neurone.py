@@ -0,0 +1,41 @@
+import copy
+import pickle
+
+import numpy as np
+
+from neuromorphic import LIF
+from neuromorphic.etat_neurone import lier_etats
+from neuromorphic.population import PopulationLIF
+from neuromorphic_v2.neuron import DonneesNeurone
+
+
+def test_neurones_population_et_v2_partagent_la_table():
+    neurones = [LIF(U=0.01 * i, R=1.0 + 0.1 * i) for i in range(5)]
+    references = [LIF(U=0.01 * i, R=1.0 + 0.1 * i) for i in range(5)]
+    table = lier_etats([neurone._etat for neurone in neurones])
+    population = PopulationLIF.vue(table)
+    donnees = DonneesNeurone.vue(table, 2)
+
+    for _ in range(300):
+        population.updateRK4(1e-3, 0.3)
+        for reference in references:
+            reference.updateRK4(1e-3, 0.3)
+
+    np.testing.assert_allclose(
+        [neurone._etat["U"] for neurone in neurones], [reference._etat["U"] for reference in references], atol=1e-15
+    )
+    assert donnees.potentielMembranaire == neurones[2]._etat["U"] == population["U"][2]
+    donnees.potentielMembranaire = 0.05
+    assert neurones[2]._etat["U"] == population["U"][2] == 0.05
+
+
+def test_copie_et_serialisation_detachent_l_etat():
+    neurones = [LIF(), LIF(U=0.02)]
+    lier_etats([neurone._etat for neurone in neurones])
+
+    copie = copy.copy(neurones[1]._etat)
+    copie["U"] = 1.0
+    relu = pickle.loads(pickle.dumps(neurones[1]))
+
+    assert neurones[1]._etat["U"] == 0.02
+    assert relu._etat["U"] == 0.02
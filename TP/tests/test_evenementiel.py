@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from neuromorphic import ExponentielUpdateStrategy, MatriceSynaptiqueCSR, PopulationLIF
+from neuromorphic.evenementiel import SimulationEvenementielle
+from neuromorphic.reseau import Reseau
+
+
+def _reseau_aleatoire(N: int, I: np.ndarray, generateur: np.random.Generator) -> Reseau:
+    sources, cibles = np.nonzero(generateur.random((N, N)) < 0.3)
+    garder = sources != cibles
+    synapses = MatriceSynaptiqueCSR.depuis_tableaux(
+        N, sources[garder], cibles[garder], generateur.uniform(0.0, 0.02, int(garder.sum()))
+    )
+    return Reseau(PopulationLIF(N, I_ext=I), synapses, update_strategy=ExponentielUpdateStrategy())
+
+
+def test_memes_trains_de_spikes_que_reseau_dirac() -> None:
+    generateur = np.random.default_rng(3)
+    N, dt, duree = 10, 1e-3, 2.0
+    I = generateur.uniform(0.12, 0.3, N)
+    reseau = _reseau_aleatoire(N, I, generateur)
+    evenementielle = SimulationEvenementielle(PopulationLIF(N, I_ext=I), reseau.synapses, delai=dt)
+
+    spikes = np.array([np.array(reseau.update(dt, I)) for _ in range(int(round(duree / dt)))])
+    evenementielle.run(duree)
+
+    for i in range(N):
+        # Un spike détecté au pas n est daté de la fin du pas
+        temps_reseau = (np.flatnonzero(spikes[:, i]) + 1) * dt
+        temps_evenements = evenementielle.temps_spikes(i)
+        assert temps_evenements.size == temps_reseau.size > 0
+        np.testing.assert_allclose(temps_evenements, temps_reseau, atol=5 * dt)
+
+
+def test_depuis_reseau_prend_dt_comme_delai() -> None:
+    generateur = np.random.default_rng(0)
+    I = generateur.uniform(0.12, 0.3, 4)
+    reseau = _reseau_aleatoire(4, I, generateur)
+    with pytest.raises(ValueError):
+        SimulationEvenementielle.depuis_reseau(reseau)
+    reseau.update(1e-3, I)
+    assert SimulationEvenementielle.depuis_reseau(reseau).delai == pytest.approx(1e-3)
+
+
+def test_delai_nul_refuse() -> None:
+    synapses = MatriceSynaptiqueCSR.depuis_tableaux(2, [0, 1], [1, 0], [2.0, 2.0])
+    with pytest.raises(ValueError):
+        SimulationEvenementielle(PopulationLIF(2, theta=1.0, I_ext=[2.0, 0.0]), synapses)
+    with pytest.raises(ValueError):
+        SimulationEvenementielle(PopulationLIF(2, theta=1.0, I_ext=[2.0, 0.0]), synapses, delai=0.0)
+
+
+def test_excitation_mutuelle_se_termine() -> None:
+    synapses = MatriceSynaptiqueCSR.depuis_tableaux(2, [0, 1], [1, 0], [2.0, 2.0])
+    simulation = SimulationEvenementielle(PopulationLIF(2, theta=1.0, I_ext=[2.0, 0.0]), synapses, delai=1e-3)
+    simulation.run(1.0)
+    # Au plus un spike par neurone et par délai
+    assert 0 < simulation.spikes_temps.size <= 2 * 1.0 / 1e-3 + 2
@@ -0,0 +1,41 @@
+import sys
+import threading
+
+from neuromorphic import LIF
+
+
+def _potentiels(I_ext):
+    neurone = LIF()
+    potentiels = []
+    for _ in range(5000):
+        neurone.updateRK4EnPlace(1e-3, I_ext)
+        potentiels.append(neurone._etat["U"])
+    return potentiels
+
+
+def test_pas_en_place_independants_entre_threads():
+    courants = [0.5, 0.6, 0.7, 0.8]
+    resultats = {}
+    intervalle = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        fils = [threading.Thread(target=lambda I=I: resultats.update({I: _potentiels(I)})) for I in courants]
+        for fil in fils:
+            fil.start()
+        for fil in fils:
+            fil.join()
+    finally:
+        sys.setswitchinterval(intervalle)
+
+    for I in courants:
+        assert resultats[I] == _potentiels(I)
+
+
+def test_pas_en_place_egaux_aux_pas_alloues():
+    for pas_alloue, pas_en_place in (("updateEuler", "updateEulerEnPlace"), ("updateRK4", "updateRK4EnPlace")):
+        alloue, en_place = LIF(), LIF()
+        for pas in range(2000):
+            I_ext = 1.0 + 0.5 * (pas % 7)
+            spike = getattr(alloue, pas_alloue)(1e-3, I_ext, psps=0.01)
+            assert getattr(en_place, pas_en_place)(1e-3, I_ext, psps=0.01) == spike
+            assert en_place._etat["U"] == alloue._etat["U"]
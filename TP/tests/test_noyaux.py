@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+import pytest
+
+from neuromorphic.noyaux import NoyauAlphaExponentiel, NoyauExponentiel, NoyauTabule
+
+TAU, DT, N = 0.02, 1e-3, 5
+
+
+def exponentiel(t):
+    return math.exp(-t / TAU)
+
+
+def alpha(t):
+    return t / TAU * math.exp(1 - t / TAU)
+
+
+def _valeurs_denses(noyau):
+    actifs, valeurs = noyau.valeurs()
+    denses = np.zeros(N)
+    denses[actifs] = valeurs
+    return denses
+
+
+def _parcourir(noyau, nb_pas=300, probabilite=0.03):
+    """Valeurs du noyau à chaque pas et pas écoulés depuis le dernier spike (-1 avant le premier), sur des spikes aléatoires."""
+    spikes = np.random.default_rng(3).random((nb_pas, N)) < probabilite
+    depuis = np.full(N, -1)
+    valeurs, ecarts = [], []
+    for pas in range(nb_pas):
+        noyau.preparer(DT, N)
+        valeurs.append(_valeurs_denses(noyau))
+        ecarts.append(depuis.copy())
+        noyau.avancer(spikes[pas])
+        depuis[depuis >= 0] += 1
+        depuis[spikes[pas]] = 0
+    return np.array(valeurs), np.array(ecarts)
+
+
+def _forme_fermee(fonction, ecarts):
+    return np.where(ecarts >= 0, np.vectorize(fonction)(np.maximum(ecarts, 0) * DT), 0.0)
+
+
+@pytest.mark.parametrize("classe, fonction", [(NoyauExponentiel, exponentiel), (NoyauAlphaExponentiel, alpha)])
+def test_noyau_recursif_egal_a_la_forme_fermee(classe, fonction):
+    valeurs, ecarts = _parcourir(classe(TAU, epsilon=0.0))
+    assert (ecarts > 0).any()
+    np.testing.assert_allclose(valeurs, _forme_fermee(fonction, ecarts), rtol=1e-10, atol=1e-15)
+
+
+@pytest.mark.parametrize("fonction", [exponentiel, alpha])
+@pytest.mark.parametrize("epsilon", [1e-3, 1e-6])
+def test_noyau_tabule_tronque_sous_epsilon(fonction, epsilon):
+    noyau = NoyauTabule(fonction, epsilon=epsilon, taille_bloc=64)
+    valeurs, ecarts = _parcourir(noyau, nb_pas=2000, probabilite=0.002)
+
+    # Des neurones restent silencieux au-delà de la fin de la table
+    assert (ecarts >= noyau.table.size).any()
+    assert np.max(np.abs(valeurs - _forme_fermee(fonction, ecarts))) < epsilon
@@ -0,0 +1,73 @@
+import numpy as np
+
+from neuromorphic import LIF
+from neuromorphic.neurone_update_strategy import EulerUpdateStrategy
+from neuromorphic.plotting import LivePotentielsPlotter, TamponCirculaire, decimer_min_max, figure_hors_ecran
+from neuromorphic.simulation import SimulationNeurones
+
+
+def _simulation(nb_neurones, plotter):
+    simulation = SimulationNeurones([LIF() for _ in range(nb_neurones)], [EulerUpdateStrategy()] * nb_neurones)
+    simulation.abonner(plotter)
+    simulation.init(30, 1e-3, lambda t: [0.5] * nb_neurones)
+    return simulation
+
+
+def test_tampon_circulaire_garde_les_derniers_pas_dans_l_ordre():
+    tampon = TamponCirculaire(4, 2)
+    for pas in range(10):
+        tampon.ajouter(float(pas), [pas, -pas])
+
+    temps, valeurs = tampon.donnees()
+    assert len(tampon) == 4
+    np.testing.assert_array_equal(temps, [6.0, 7.0, 8.0, 9.0])
+    np.testing.assert_array_equal(valeurs, [[6, -6], [7, -7], [8, -8], [9, -9]])
+
+    tampon.reset()
+    tampon.ajouter(0.5, [1.0, 2.0])
+    temps, valeurs = tampon.donnees()
+    np.testing.assert_array_equal(temps, [0.5])
+    np.testing.assert_array_equal(valeurs, [[1.0, 2.0]])
+
+
+def test_decimer_min_max_garde_les_extremes():
+    temps = np.arange(1003, dtype=np.float64)
+    valeurs = np.zeros((1003, 2))
+    valeurs[123, 0] = 5.0
+    valeurs[777, 1] = -3.0
+
+    temps_decimes, valeurs_decimees = decimer_min_max(temps, valeurs, 10)
+
+    assert temps_decimes.size == 2 * 10 + 3
+    assert valeurs_decimees.shape == (23, 2)
+    assert valeurs_decimees[:, 0].max() == 5.0
+    assert valeurs_decimees[:, 1].min() == -3.0
+    np.testing.assert_array_equal(temps_decimes[-3:], temps[-3:])
+
+
+def test_decimer_min_max_laisse_les_series_courtes():
+    temps, valeurs = np.arange(5.0), np.ones((5, 1))
+    assert decimer_min_max(temps, valeurs, 10) == (temps, valeurs)
+
+
+def test_live_plotter_limite_les_images():
+    lent = LivePotentielsPlotter(figure_hors_ecran().add_subplot(), images_par_seconde=1e-6)
+    _simulation(2, lent).run()
+    # Une image au premier pas, une en fin de run
+    assert lent.nb_images == 2
+
+    rapide = LivePotentielsPlotter(figure_hors_ecran().add_subplot(), images_par_seconde=float("inf"))
+    _simulation(2, rapide).run()
+    assert rapide.nb_images == 30 + 1
+
+
+def test_live_plotter_retire_les_lignes_en_trop():
+    axes = figure_hors_ecran().add_subplot()
+    plotter = LivePotentielsPlotter(axes)
+    _simulation(3, plotter).run()
+    assert len(plotter._plot_lines) == 3
+
+    _simulation(1, plotter).run()
+    assert len(plotter._plot_lines) == 1
+    assert axes.get_lines() == plotter._plot_lines
+    assert len(plotter._plot_lines[0].get_xdata()) == 30
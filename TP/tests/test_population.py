@@ -0,0 +1,17 @@
+import numpy as np
+
+from neuromorphic import PopulationLIF
+
+
+def test_exponentiel_suit_une_modification_en_place_de_C() -> None:
+    population = PopulationLIF(3)
+    population.updateExponentiel(0.1, 0.2)
+    population["C"][...] = 100.0
+    population.updateExponentiel(0.1, 0.2)
+
+    # Même état avant le second pas, facteurs calculés directement avec C = 100
+    reference = PopulationLIF(3, C=1.0)
+    reference.updateExponentiel(0.1, 0.2)
+    neuve = PopulationLIF(3, U=reference["U"].copy(), C=100.0)
+    neuve.updateExponentiel(0.1, 0.2)
+    np.testing.assert_array_equal(population["U"], neuve["U"])
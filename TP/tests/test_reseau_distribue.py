@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pytest
+
+from neuromorphic.noyaux import NoyauExponentiel
+from neuromorphic.population import PopulationLIF
+from neuromorphic.reseau import Reseau
+from neuromorphic.reseau_distribue import ReseauDistribue
+from neuromorphic.synapses import MatriceSynaptiqueCSR
+
+N = 12
+COURANTS = np.linspace(0.15, 0.35, N)
+
+
+def _courants(t):
+    return COURANTS
+
+
+def _arret_brutal(t):
+    os._exit(3)
+
+
+def _synapses():
+    generateur = np.random.default_rng(4)
+    sources = generateur.integers(0, N, 40)
+    cibles = generateur.integers(0, N, 40)
+    return MatriceSynaptiqueCSR.depuis_tableaux(N, sources, cibles, generateur.uniform(0.0, 0.05, 40))
+
+
+def test_reseau_distribue_egal_au_reseau_sur_un_coeur():
+    dt, nb_pas = 1e-2, 300
+    reseau = Reseau(PopulationLIF(N, theta=0.1), _synapses(), NoyauExponentiel(0.05))
+    neurones, pas = [], []
+    for i in range(nb_pas):
+        spikes = np.flatnonzero(reseau.update(dt, COURANTS))
+        neurones.extend(spikes)
+        pas.extend([i] * spikes.size)
+
+    distribue = ReseauDistribue(PopulationLIF(N, theta=0.1), _synapses(), 3, NoyauExponentiel(0.05))
+    spikes_distribues = distribue.run(nb_pas, dt, _courants)
+
+    assert len(neurones) > 0
+    attendus = sorted(zip(pas, neurones))
+    assert sorted(zip(spikes_distribues.pas.tolist(), spikes_distribues.neurones.tolist())) == attendus
+    np.testing.assert_array_equal(distribue.population["U"], reseau.neurones["U"])
+
+
+def test_partition_morte_signalee():
+    distribue = ReseauDistribue(PopulationLIF(N), _synapses(), 2)
+    with pytest.raises(RuntimeError):
+        distribue.run(10, 1e-2, _arret_brutal)
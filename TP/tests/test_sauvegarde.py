@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from neuromorphic import LIF
+from neuromorphic.enregistrement import EnregistrementColonnes
+from neuromorphic.neurone_update_strategy import EulerUpdateStrategy, RK4UpdateStrategy
+from neuromorphic.population import PopulationLIF
+from neuromorphic.sauvegarde import restaurer, sauvegarder
+from neuromorphic.simulation import SimulationNeurones, SimulationPopulation
+from neuromorphic.stimuli import StimulusPoisson
+
+N = 3
+# Au-delà du premier bloc de 1024 pas lu par la simulation : la reprise dépend de l'état du générateur
+NB_PAS, PAS_SAUVEGARDE, DT = 1500, 700, 1e-3
+
+
+def _simulation_neurones():
+    return SimulationNeurones(
+        [LIF() for _ in range(N)], [RK4UpdateStrategy()] * N, EnregistrementColonnes(("t", "U", "spike"))
+    )
+
+
+def _simulation_population():
+    return SimulationPopulation(PopulationLIF(N), EulerUpdateStrategy(), EnregistrementColonnes(("t", "U", "spike")))
+
+
+def _stimulus():
+    return StimulusPoisson(N, frequence=100.0, amplitude=80.0, graine=7)
+
+
+@pytest.mark.parametrize("fabrique", [_simulation_neurones, _simulation_population])
+def test_reprise_identique_a_un_run_continu(tmp_path, fabrique):
+    continue_ = fabrique()
+    continue_.init(NB_PAS, DT, _stimulus())
+    continue_.run()
+
+    interrompue = fabrique()
+    interrompue.init(NB_PAS, DT, _stimulus())
+    for _ in range(PAS_SAUVEGARDE):
+        interrompue.update()
+    sauvegarder(interrompue, tmp_path / "reprise.npz")
+
+    reprise = fabrique()
+    reprise.init(NB_PAS, DT, _stimulus())
+    restaurer(reprise, tmp_path / "reprise.npz")
+    reprise.run()
+
+    assert continue_.enregistrement["spike"][PAS_SAUVEGARDE:].any()
+    for champ in ("t", "U", "spike"):
+        np.testing.assert_array_equal(reprise.enregistrement[champ], continue_.enregistrement[champ])
+
+
+def test_sauvegarde_interrompue_ne_laisse_pas_de_fichier_partiel(tmp_path, monkeypatch):
+    simulation = _simulation_population()
+    simulation.init(10, DT, _stimulus())
+    simulation.run()
+    chemin = tmp_path / "sauvegarde.npz"
+    sauvegarder(simulation, chemin)
+    assert [f.name for f in tmp_path.iterdir()] == ["sauvegarde.npz"]
+    precedente = chemin.read_bytes()
+
+    def savez_interrompu(fichier, **tableaux):
+        fichier.write(b"partiel")
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(np, "savez", savez_interrompu)
+    simulation.init(20, DT, _stimulus())
+    simulation.run()
+    with pytest.raises(KeyboardInterrupt):
+        sauvegarder(simulation, chemin)
+
+    assert [f.name for f in tmp_path.iterdir()] == ["sauvegarde.npz"]
+    assert chemin.read_bytes() == precedente
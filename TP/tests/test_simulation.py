@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from neuromorphic import LIF
+from neuromorphic.enregistrement import EnregistrementColonnes, EnregistrementDisque
+from neuromorphic.neurone_update_strategy import EulerUpdateStrategy
+from neuromorphic.plotting import PotentielsPlotter, figure_hors_ecran
+from neuromorphic.population import PopulationLIF
+from neuromorphic.simulation import SimulationEventType, SimulationNeurones, SimulationPopulation
+
+
+def _simulation_tracee(enregistrement):
+    plotter = PotentielsPlotter(figure_hors_ecran().add_subplot())
+    simulation = SimulationNeurones([LIF() for _ in range(3)], [EulerUpdateStrategy()] * 3, enregistrement)
+    simulation.subscribe(SimulationEventType.INIT, plotter)
+    simulation.subscribe(SimulationEventType.UPDATE, plotter)
+    return simulation, plotter
+
+
+def test_plotter_lit_l_enregistrement():
+    simulation, plotter = _simulation_tracee(EnregistrementColonnes(("t", "U")))
+    simulation.init(20, 1e-3, lambda t: [0.5] * 3)
+    plotter.init()
+    simulation.run()
+
+    assert len(plotter._plot_lines) == 3
+    np.testing.assert_array_equal(plotter._plot_lines[0].get_ydata(), simulation.enregistrement["U"][:, 0])
+
+
+@pytest.mark.parametrize("disque", [False, True])
+def test_plotter_n_ajoute_que_les_nouveaux_pas(tmp_path, disque):
+    enregistrement = (
+        EnregistrementDisque(tmp_path, ("t", "U"), taille_bloc=7) if disque
+        else EnregistrementColonnes(("t", "U"), taille_bloc=7)
+    )
+    simulation, plotter = _simulation_tracee(enregistrement)
+    for _ in range(2):
+        simulation.init(50, 1e-3, lambda t: [0.5, 0.6, 0.7])
+        plotter.init()
+        simulation.run()
+
+        for i, ligne in enumerate(plotter._plot_lines):
+            np.testing.assert_array_equal(ligne.get_xdata(), enregistrement["t"])
+            np.testing.assert_array_equal(ligne.get_ydata(), enregistrement["U"][:, i])
+
+
+def test_plotter_refuse_un_enregistrement_sans_les_champs_traces():
+    simulation, _ = _simulation_tracee(EnregistrementColonnes(("U",)))
+    with pytest.raises(ValueError):
+        simulation.init(20, 1e-3, lambda t: [0.5] * 3)
+
+
+def test_population_ne_notifie_que_des_lots_de_spikes():
+    recus = []
+
+    class Abonne:
+        def update(self, event_type, context, data):
+            recus.append(event_type)
+
+    simulation = SimulationPopulation(PopulationLIF(2, theta=0.01), EulerUpdateStrategy())
+    simulation.subscribe(SimulationEventType.NEURONE_SPIKE, Abonne())
+    simulation.subscribe(SimulationEventType.SPIKES, Abonne())
+    simulation.init(100, 1e-3, lambda t: 1.0)
+    simulation.run()
+
+    assert recus and set(recus) == {SimulationEventType.SPIKES}
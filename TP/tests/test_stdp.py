@@ -0,0 +1,24 @@
+import numpy as np
+
+from neuromorphic.stdp import PlasticiteSTDP
+
+
+def _appariement(plasticite: PlasticiteSTDP) -> None:
+    # 0 puis 1 émettent : potentiation des synapses 0 -> 1 existantes
+    plasticite.update(1e-3, np.array([True, False, False]))
+    plasticite.update(1e-3, np.array([False, True, False]))
+
+
+def test_dense_ne_cree_pas_de_synapses() -> None:
+    poids = np.zeros((3, 3))
+    poids[0, 2] = 0.5
+    _appariement(PlasticiteSTDP(poids))
+    attendu = np.zeros((3, 3))
+    attendu[0, 2] = 0.5
+    np.testing.assert_array_equal(poids, attendu)
+
+
+def test_dense_toutes_paires() -> None:
+    poids = np.zeros((3, 3))
+    _appariement(PlasticiteSTDP(poids, toutes_paires=True))
+    assert poids[0, 1] > 0.0
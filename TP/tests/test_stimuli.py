@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from neuromorphic.lif_stdp import entree
+from neuromorphic.stimuli import (
+    LecteurStimulus, StimulusConstant, StimulusEchelon, StimulusGaussien, StimulusRampe, StimulusTableau,
+)
+
+DT = 0.25
+
+
+def test_echelon_et_rampe_par_morceaux():
+    echelon = StimulusEchelon(2, amplitude=[1.0, 2.0], debut=0.5, fin=1.25, base=-1.0)
+    np.testing.assert_array_equal(echelon.bloc(0, 7, DT)[:, 1], [-1, -1, 2, 2, 2, -1, -1])
+
+    rampe = StimulusRampe(1, valeur_initiale=1.0, valeur_finale=3.0, debut=0.25, fin=1.25)
+    np.testing.assert_allclose(rampe.bloc(0, 7, DT)[:, 0], [1.0, 1.0, 1.5, 2.0, 2.5, 3.0, 3.0])
+    # Un bloc ne dépend que de ses pas, pas des blocs lus avant
+    np.testing.assert_array_equal(rampe.bloc(3, 2, DT), rampe.matrice(7, DT)[3:5])
+
+    with pytest.raises(ValueError):
+        StimulusRampe(1, 0.0, 1.0, debut=1.0, fin=1.0)
+
+
+def test_somme_de_stimuli():
+    somme = StimulusConstant(2, [0.5, 1.0]) + StimulusEchelon(2, amplitude=2.0, debut=0.5)
+    np.testing.assert_array_equal(somme.bloc(0, 4, DT), [[0.5, 1.0], [0.5, 1.0], [2.5, 3.0], [2.5, 3.0]])
+
+    with pytest.raises(ValueError):
+        StimulusConstant(2) + StimulusConstant(3)
+
+
+def test_gaussien_reproduit_entree():
+    nb_neurones, dt = 10, 0.7
+    courants = StimulusGaussien(nb_neurones).matrice(100, dt)
+    attendus = [[entree(pas * dt, n) for n in range(nb_neurones)] for pas in range(100)]
+    np.testing.assert_allclose(courants, attendus, rtol=1e-12)
+
+
+class _StimulusCompte(StimulusTableau):
+    def __init__(self, valeurs):
+        super().__init__(valeurs)
+        self.debuts = []
+
+    def bloc(self, debut, nb_pas, dt):
+        self.debuts.append(debut)
+        return super().bloc(debut, nb_pas, dt)
+
+
+def test_lecteur_aux_frontieres_des_blocs():
+    valeurs = np.arange(20.0).reshape(10, 2)
+    stimulus = _StimulusCompte(valeurs)
+    lecteur = LecteurStimulus(stimulus, DT, taille_bloc=4)
+
+    lignes = [lecteur(pas * DT).copy() for pas in range(10)]
+    np.testing.assert_array_equal(lignes, valeurs)
+    assert stimulus.debuts == [0, 4, 8]
+
+    # Relire un pas du bloc en cours ne recalcule rien ; revenir en arrière relit depuis le pas 0
+    np.testing.assert_array_equal(lecteur(9 * DT), valeurs[9])
+    np.testing.assert_array_equal(lecteur(5 * DT), valeurs[5])
+    assert stimulus.debuts == [0, 4, 8, 0, 4]
+
+    # Au-delà du tableau, les courants sont nuls
+    np.testing.assert_array_equal(lecteur(11 * DT), [0.0, 0.0])
+    assert [len(bloc) for bloc in stimulus.blocs(10, DT, taille_bloc=4)] == [4, 4, 2]
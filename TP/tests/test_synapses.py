@@ -0,0 +1,90 @@
+import numpy as np
+
+from neuromorphic.synapses import FileRetards, MatriceSynaptiqueCSR
+
+
+def _courants_par_pas(file, depots, nb_pas):
+    """Courants reçus à chaque pas ; ``depots[pas]`` = (cibles, retards, contributions) déposés à ce pas."""
+    recus = []
+    for pas in range(nb_pas):
+        if pas in depots:
+            file.deposer(*(np.asarray(tableau) for tableau in depots[pas]))
+        recus.append(file.courants().copy())
+        file.avancer()
+    return np.array(recus)
+
+
+def test_file_retards_livre_au_pas_k_plus_d():
+    file = FileRetards(nb_cibles=4, retard_max=3)
+    recus = _courants_par_pas(file, {5: ([2, 1], [3, 0], [1.5, 0.25])}, 12)
+
+    attendus = np.zeros((12, 4))
+    attendus[5, 1] = 0.25
+    attendus[8, 2] = 1.5
+    np.testing.assert_array_equal(recus, attendus)
+
+
+def test_file_retards_circulaire():
+    # Bien plus de pas que de lignes dans le tampon : chaque ligne est réutilisée
+    file = FileRetards(nb_cibles=1, retard_max=2)
+    depots = {pas: ([0], [pas % 3], [float(pas)]) for pas in range(20)}
+    recus = _courants_par_pas(file, depots, 23)
+
+    attendus = np.zeros(23)
+    for pas in range(20):
+        attendus[pas + pas % 3] += pas
+    np.testing.assert_array_equal(recus[:, 0], attendus)
+    assert file.tampon.shape == (3, 1)
+    assert not file.tampon.any()
+
+
+def test_file_retards_cumule_les_sources_de_meme_retard():
+    synapses = MatriceSynaptiqueCSR.depuis_tableaux(
+        4, sources=[0, 1, 2, 2], cibles=[3, 3, 3, 0], poids=[0.1, 0.2, 0.3, 0.4], delais=[2, 2, 2, 1]
+    )
+    file = FileRetards(synapses.nb_cibles, synapses.retard_max)
+    recus = []
+    for pas in range(4):
+        sources = np.array([0, 1, 2]) if pas == 0 else np.empty(0, dtype=np.intp)
+        recus.append(synapses.propager_retarde(sources, np.ones(sources.size), file).copy())
+        file.avancer()
+
+    np.testing.assert_allclose(recus, [[0, 0, 0, 0], [0.4, 0, 0, 0], [0, 0, 0, 0.6], [0, 0, 0, 0]])
+
+
+def _synapses_aleatoires(nb_neurones, nb_synapses, graine=0):
+    generateur = np.random.default_rng(graine)
+    # Les neurones pairs n'ont aucune synapse sortante : lignes vides dans la matrice
+    sources = 2 * generateur.integers(0, nb_neurones // 2, nb_synapses) + 1
+    cibles = generateur.integers(0, nb_neurones, nb_synapses)
+    return MatriceSynaptiqueCSR.depuis_tableaux(nb_neurones, sources, cibles, generateur.normal(size=nb_synapses))
+
+
+def test_propagation_csr_egale_au_produit_dense():
+    synapses = _synapses_aleatoires(20, 60)
+    W = synapses.dense()
+    assert not W[::2].any()
+
+    spikes = np.random.default_rng(1).random(20) < 0.5
+    np.testing.assert_allclose(synapses.propager(np.flatnonzero(spikes), np.ones(spikes.sum())), W.T @ spikes)
+
+
+def test_propagation_des_seuls_neurones_actifs():
+    synapses = _synapses_aleatoires(20, 60)
+    W = synapses.dense()
+    actifs = np.array([0, 3, 4, 11, 19])
+    alphas = np.array([0.5, 1.0, 2.0, 0.25, 3.0])
+    valeurs = np.zeros(20)
+    valeurs[actifs] = alphas
+
+    np.testing.assert_allclose(synapses.propager(actifs, alphas), W.T @ valeurs)
+    np.testing.assert_array_equal(synapses.propager(np.array([0, 2, 4]), np.ones(3)), np.zeros(20))
+    np.testing.assert_array_equal(synapses.propager(np.empty(0, dtype=np.intp), np.empty(0)), np.zeros(20))
+
+
+def test_propagation_d_un_bloc_de_colonnes():
+    synapses = _synapses_aleatoires(20, 60)
+    actifs = np.arange(20)
+    np.testing.assert_allclose(
+        synapses.colonnes(5, 12).propager(actifs, np.ones(20)), synapses.dense()[:, 5:12].sum(axis=0)
+    )